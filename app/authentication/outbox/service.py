@@ -0,0 +1,227 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config.config import Settings
+from app.authentication.outbox.transport import EmailMessage, EmailTransport, make_transport
+from app.core.utils.enums import EmailStatus
+from app.database.auth import EmailOutbox
+from app.database.session import AsyncSessionLocal
+
+
+settings = Settings()
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxService:
+    """
+    Outbound email through the email_outbox table.
+
+    `enqueue` stores a message and wakes the dispatcher, so requests never wait on
+    the email provider. The dispatcher task started with `start()` claims due
+    messages in batches, hands them to the transport and records the outcome. If a
+    batch is rejected its messages are sent again one at a time, so only the ones
+    that fail on their own are charged. A failed message is retried after
+    retry_base_seconds * 2 ** (attempts - 1) until `max_attempts`, after which it
+    is marked failed.
+
+    Claimed messages are marked "sending" with a lease. If a worker dies mid-send
+    the lease runs out and the messages are claimed again, unless that send was
+    their last attempt, in which case they are marked failed. On PostgreSQL the
+    claim uses FOR UPDATE SKIP LOCKED, so every worker can run a dispatcher.
+    """
+
+    LEASE_SECONDS = 300
+
+    def __init__(self, transport: EmailTransport,
+                 session_factory: Callable[[], AsyncSession],
+                 sender: str,
+                 batch_size: int = 50,
+                 max_attempts: int = 5,
+                 retry_base_seconds: float = 30,
+                 poll_seconds: float = 5):
+        self.transport = transport
+        self.session_factory = session_factory
+        self.sender = sender
+        # A batch has to fit in one transport call to stay all or nothing
+        self.batch_size = min(batch_size, transport.MAX_BATCH or batch_size)
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.poll_seconds = poll_seconds
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.wakeup: asyncio.Event | None = None
+        self.task: asyncio.Task | None = None
+        self.stopping = False
+        self.batches = 0
+        self.sent = 0
+        self.retried = 0
+        self.failed = 0
+
+    def enqueue(self, db: Session, to_email: str, subject: str, html: str) -> EmailOutbox:
+        """Store a message for the dispatcher and commit it."""
+        now = datetime.now()
+        email = EmailOutbox(
+            to_email=to_email,
+            subject=subject,
+            html=html,
+            status=EmailStatus.PENDING.value,
+            attempts=0,
+            next_attempt_at=now,
+            created_at=now,
+        )
+        db.add(email)
+        db.commit()
+        db.refresh(email)
+        self.notify()
+        return email
+
+    def notify(self):
+        """Wake the dispatcher now rather than at its next poll. Safe from any thread."""
+        if self.loop is not None and self.wakeup is not None:
+            self.loop.call_soon_threadsafe(self.wakeup.set)
+
+    def start(self):
+        """Start the dispatcher task on the running event loop."""
+        self.loop = asyncio.get_running_loop()
+        self.wakeup = asyncio.Event()
+        self.stopping = False
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Let the batch in flight finish, then stop the dispatcher.
+
+        A send still running after `poll_seconds` is cancelled; its messages are
+        claimed again once their lease runs out.
+        """
+        if self.task is None:
+            return
+        self.stopping = True
+        self.wakeup.set()
+        try:
+            await asyncio.wait_for(self.task, timeout=self.poll_seconds)
+        except asyncio.TimeoutError:
+            pass
+        self.task = None
+
+    async def dispatch_once(self) -> int:
+        """Claim one batch of due messages and send it.
+
+        Returns:
+            int: The number of messages claimed.
+        """
+        now = datetime.now()
+        async with self.session_factory() as db:
+            batch = (await db.scalars(
+                select(EmailOutbox)
+                .where(
+                    EmailOutbox.status.in_([EmailStatus.PENDING.value, EmailStatus.SENDING.value]),
+                    EmailOutbox.next_attempt_at <= now,
+                )
+                .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )).all()
+            if not batch:
+                return 0
+            to_send = []
+            for email in batch:
+                # A lease that ran out on the last attempt: the send may or may not
+                # have gone through, and there are no attempts left to find out
+                if email.attempts >= self.max_attempts:
+                    email.status = EmailStatus.FAILED.value
+                    email.last_error = f"Gave up after {email.attempts} attempts; the sending worker stopped before finishing"
+                    self.failed += 1
+                    continue
+                email.status = EmailStatus.SENDING.value
+                email.attempts += 1
+                email.next_attempt_at = now + timedelta(seconds=self.LEASE_SECONDS)
+                to_send.append(email)
+            await db.commit()
+
+            if to_send:
+                await self._send(to_send)
+                await db.commit()
+        self.batches += 1
+        return len(batch)
+
+    async def _send(self, batch: list[EmailOutbox]):
+        """Send `batch` and record the outcome on each message.
+
+        A rejected batch of several messages is sent again one message at a time, so
+        one bad message doesn't use up the attempts of the others.
+        """
+        messages = [EmailMessage(sender=self.sender, to=e.to_email, subject=e.subject, html=e.html) for e in batch]
+        try:
+            provider_ids = await run_in_threadpool(self.transport.send_batch, messages)
+        except Exception as exc:
+            if len(batch) > 1:
+                logger.warning("Sending %d emails failed, sending them one at a time: %s", len(batch), exc)
+                for email in batch:
+                    await self._send([email])
+                return
+            logger.warning("Sending email %d failed: %s", batch[0].id, exc)
+            self._record_failure(batch[0], f"{type(exc).__name__}: {exc}")
+        else:
+            sent_at = datetime.now()
+            for email, provider_id in zip(batch, provider_ids):
+                email.status = EmailStatus.SENT.value
+                email.provider_id = provider_id
+                email.sent_at = sent_at
+                email.last_error = None
+            self.sent += len(batch)
+
+    def _record_failure(self, email: EmailOutbox, error: str):
+        email.last_error = error[:1000]
+        if email.attempts >= self.max_attempts:
+            email.status = EmailStatus.FAILED.value
+            self.failed += 1
+        else:
+            email.status = EmailStatus.PENDING.value
+            email.next_attempt_at = datetime.now() + timedelta(seconds=self.retry_base_seconds * 2 ** (email.attempts - 1))
+            self.retried += 1
+
+    async def _run(self):
+        while not self.stopping:
+            self.wakeup.clear()
+            try:
+                claimed = await self.dispatch_once()
+            except Exception:
+                logger.exception("Email dispatch failed")
+                claimed = 0
+            # A full batch means more may be due; otherwise sleep until woken or the next poll
+            if claimed < self.batch_size and not self.stopping:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    def backlog(self, db: Session) -> dict[str, int]:
+        """Number of outbox messages in each status."""
+        rows = db.execute(select(EmailOutbox.status, func.count()).group_by(EmailOutbox.status)).all()
+        return {status: count for status, count in rows}
+
+    def stats(self) -> dict:
+        """Counters of this process's dispatcher."""
+        return {
+            "transport": type(self.transport).__name__,
+            "batches": self.batches,
+            "sent": self.sent,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+email_outbox = EmailOutboxService(
+    transport=make_transport(settings.EMAIL_TRANSPORT, api_key=settings.RESEND_API_KEY, file_path=settings.EMAIL_FILE_PATH),
+    session_factory=AsyncSessionLocal,
+    sender=settings.EMAIL_FROM,
+    batch_size=settings.EMAIL_BATCH_SIZE,
+    max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+    retry_base_seconds=settings.EMAIL_RETRY_BASE_SECONDS,
+    poll_seconds=settings.EMAIL_POLL_SECONDS,
+)
@@ -0,0 +1,99 @@
+import json
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import resend
+
+
+@dataclass
+class EmailMessage:
+    sender: str
+    to: str
+    subject: str
+    html: str
+
+
+class EmailTransport(ABC):
+    """Delivers a batch of outbox messages.
+
+    The dispatcher calls `send_batch` from a worker thread, so implementations may
+    block. A batch is all or nothing: raising means none of it was sent and every
+    message in it is retried. The dispatcher never passes more than `MAX_BATCH`
+    messages (None: no limit).
+    """
+
+    MAX_BATCH: int | None = None
+
+    @abstractmethod
+    def send_batch(self, messages: list[EmailMessage]) -> list[str | None]:
+        """Send the messages.
+
+        Returns:
+            list[str | None]: The provider's ID for each message, in order (None if it has none).
+        """
+        raise NotImplementedError
+
+
+class ResendTransport(EmailTransport):
+    """Resend's batch endpoint: up to 100 messages in one request."""
+
+    MAX_BATCH = 100
+
+    def __init__(self, api_key: str):
+        resend.api_key = api_key
+
+    def send_batch(self, messages: list[EmailMessage]) -> list[str | None]:
+        # One request per batch keeps it all or nothing; chunking here could fail
+        # after earlier chunks went out, and the retry would send those again
+        if len(messages) > self.MAX_BATCH:
+            raise ValueError(f"Resend accepts at most {self.MAX_BATCH} messages per batch, got {len(messages)}")
+        response = resend.Batch.send([
+            {"from": m.sender, "to": m.to, "subject": m.subject, "html": m.html}
+            for m in messages
+        ])
+        return [item.get("id") for item in response["data"]]
+
+
+class MemoryTransport(EmailTransport):
+    """Keeps sent messages in `sent`; for tests and local runs."""
+
+    def __init__(self):
+        self.sent: list[EmailMessage] = []
+        self._lock = threading.Lock()
+
+    def send_batch(self, messages: list[EmailMessage]) -> list[str | None]:
+        with self._lock:
+            first = len(self.sent)
+            self.sent.extend(messages)
+        return [f"memory-{first + i}" for i in range(len(messages))]
+
+
+class FileTransport(EmailTransport):
+    """Appends each message as a JSON line to `path`; for local runs without a provider."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send_batch(self, messages: list[EmailMessage]) -> list[str | None]:
+        written_at = datetime.now().isoformat()
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            for message in messages:
+                file.write(json.dumps({**asdict(message), "written_at": written_at}) + "\n")
+        return [None] * len(messages)
+
+
+def make_transport(name: str, api_key: str, file_path: str) -> EmailTransport:
+    """Build the transport named by EMAIL_TRANSPORT ("resend", "memory" or "file").
+
+    Raises:
+        ValueError: For any other name.
+    """
+    if name == "resend":
+        return ResendTransport(api_key)
+    if name == "memory":
+        return MemoryTransport()
+    if name == "file":
+        return FileTransport(file_path)
+    raise ValueError(f"Unknown email transport {name!r}; expected 'resend', 'memory' or 'file'")
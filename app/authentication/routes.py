@@ -11,10 +11,14 @@ from sqlalchemy.orm import Session
 from typing import Annotated, List
 from app.authentication.users.schema import CreateUser, InviteTarget, NewPassword, UserOut
 from app.authentication.tokens.schema import TokenIn, TokenOut
+from app.authentication.outbox.schema import EmailOut
+from app.authentication.outbox.service import email_outbox
 from app.database.session import session
 from app.authentication.users.service import UserService
 from app.authentication.utils.auth_utils import get_current_user
-from app.database.auth import User
+from app.authentication.utils.principal_cache import principal_cache
+from app.authentication.utils.password_utils import password_hashing
+from app.database.auth import User, EmailOutbox
 
 auth_router = APIRouter(tags=['Users'])
 
@@ -30,9 +34,9 @@ def require_superuser(current_user: User = Depends(get_current_user)) -> User:
 
 
 @auth_router.post("/create")
-def create_user(user: Annotated[CreateUser, Body()],
-                db: Annotated[Session, Depends(session)]):
-    return UserService.create_user(db=db, user=user)
+async def create_user(user: Annotated[CreateUser, Body()],
+                      db: Annotated[Session, Depends(session)]):
+    return await UserService.create_user(db=db, user=user)
 
 
 @auth_router.get("/list", response_model=List[UserOut])
@@ -51,23 +55,53 @@ def invite_user(
     _: Annotated[User, Depends(require_superuser)],
     db: Annotated[Session, Depends(session)]
 ):
-    """Send an invitation email to a user. Superuser only."""
+    """Queue an invitation email to a user. Superuser only.
+    Delivery happens in the background; follow it at GET /emails/{email_id}."""
     return UserService.invite_user(db=db, id=user_id)
 
 
 @auth_router.post("/set_new_password")
-def accept_invite(data: Annotated[NewPassword, Body()],
-                  db: Annotated[Session, Depends(session)]):
-    return UserService.set_new_password(data=data, db=db)
+async def accept_invite(data: Annotated[NewPassword, Body()],
+                        db: Annotated[Session, Depends(session)]):
+    return await UserService.set_new_password(data=data, db=db)
 
 
 @auth_router.post("/login_token")
 async def login_for_access_token(form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
                                  db: Annotated[Session, Depends(session)]):
-    login = UserService.login(form_data=form_data, db=db)
+    # The user lookup and token insert run on the threadpool and the password check
+    # on the hashing pool; no thread is held while bcrypt waits in its queue
+    login = await UserService.login(form_data=form_data, db=db)
     return login
 
 
 @auth_router.get("/me")
 def get_me(current_user: Annotated[User, Depends(get_current_user)]):
-    return {"firstname": current_user.firstname, "role": current_user.user_role}
\ No newline at end of file
+    return {"firstname": current_user.firstname, "role": current_user.user_role}
+
+
+@auth_router.get("/emails/{email_id}", response_model=EmailOut)
+def get_email_status(
+    email_id: int,
+    _: Annotated[User, Depends(require_superuser)],
+    db: Annotated[Session, Depends(session)]
+):
+    """Delivery status of a queued email. Superuser only."""
+    email = db.get(EmailOutbox, email_id)
+    if email is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Email not found")
+    return email
+
+
+@auth_router.get("/metrics")
+def auth_metrics(
+    _: Annotated[User, Depends(require_superuser)],
+    db: Annotated[Session, Depends(session)]
+):
+    """Authenticated-user cache hit rate, password hashing pool queue and email
+    outbox backlog. Superuser only."""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "password_hashing": password_hashing.stats(),
+        "email": {**email_outbox.stats(), "backlog": email_outbox.backlog(db)},
+    }
@@ -1,4 +1,5 @@
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from sqlalchemy import insert
@@ -18,14 +19,18 @@ class UserService():
 
 
     @staticmethod
-    def create_user(db:Session, user: CreateUser):
+    async def create_user(db:Session, user: CreateUser):
         username = f"{user.firstname.lower()}.{user.lastname.lower()}"
-        user_exists = lookup_user(db=db, username=username)
+        user_exists = await run_in_threadpool(lookup_user, db=db, username=username)
         if user_exists:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User already exists")
         
         temporary_password = generate_temporary_password()
-        hashed_password = hash_password(temporary_password)
+        hashed_password = await hash_password(temporary_password)
+        return await run_in_threadpool(UserService._insert_user, db, username, user, hashed_password)
+
+    @staticmethod
+    def _insert_user(db: Session, username: str, user: CreateUser, hashed_password: str) -> UserOut:
         stmt = (insert(User).values(username=username,
                                   email=user.email,
                                   firstname=user.firstname,
@@ -46,11 +51,11 @@ class UserService():
         token_expires = timedelta(hours=INVITE_EXPIRY_HOURS)
         invite_token = TokenService.create_token(data=payload, expiry = token_expires)
         TokenService.store_token(db=db, data=payload, jwt=invite_token)
-        invite = invite_message(invite_token=invite_token, user=user)
+        invite = invite_message(db=db, invite_token=invite_token, user=user)
         return invite
     
     @staticmethod
-    def set_new_password(db: Session, data: NewPassword):
+    async def set_new_password(db: Session, data: NewPassword):
         
         try:
             decoded = TokenService.verify_token_type(data.token, TokenType.invite.value)
@@ -62,27 +67,31 @@ class UserService():
 
         payload = Payload(**decoded)
 
-        TokenService.verify_token(db=db, token=data.token, type=payload.type)
-        user_exists = lookup_user(db=db, user_id=payload.id)
+        await TokenService.verify_token(db=db, token=data.token, type=payload.type)
+        user_exists = await run_in_threadpool(lookup_user, db=db, user_id=payload.id)
         if not user_exists:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                                 detail="Invalid account")
-        hash_new_password = hash_password(data.new_password)
-        activate_user_account(db=db, user_id=payload.id, hash=hash_new_password)
-        TokenService.mark_token_used(db=db, jti=payload.jti, type=payload.type)
+        hash_new_password = await hash_password(data.new_password)
+        await run_in_threadpool(UserService._activate, db, payload, hash_new_password)
 
         return {"message": "Account activated successfully"}
+
+    @staticmethod
+    def _activate(db: Session, payload: Payload, hash_new_password: str):
+        activate_user_account(db=db, user_id=payload.id, hash=hash_new_password)
+        TokenService.mark_token_used(db=db, jti=payload.jti, type=payload.type)
     
     @staticmethod
-    def login(*, form_data:OAuth2PasswordRequestForm, db: Session):
+    async def login(*, form_data:OAuth2PasswordRequestForm, db: Session):
         ACCESS_EXPIRY_DAYS = 4
 
-        user: User = authenticate_user(db=db, username=form_data.username, password=form_data.password)
+        user: User = await authenticate_user(db=db, username=form_data.username, password=form_data.password)
         
         payload = Payload(sub=user.username, id=user.id, email=user.email, role=user.user_role, type=TokenType.access)
         token_expires = timedelta(days=ACCESS_EXPIRY_DAYS)
         access_token = TokenService.create_token(data=payload, expiry=token_expires)
-        TokenService.store_token(db=db, data=payload, jwt=access_token)
+        await run_in_threadpool(TokenService.store_token, db=db, data=payload, jwt=access_token)
         return TokenOut(access_token=access_token, token_type="bearer", role=user.user_role, firstname=user.firstname)
     
     
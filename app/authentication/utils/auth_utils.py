@@ -6,6 +6,7 @@ password verification, token-based authentication, and user account activation.
 """
 
 from fastapi import HTTPException, status, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.exc import DatabaseError
 from typing import Annotated
@@ -16,6 +17,7 @@ from app.config.config import Settings
 from app.authentication.tokens.schema import Payload
 from app.authentication.tokens.service import TokenService
 from app.authentication.utils.password_utils import verify_password
+from app.authentication.utils.principal_cache import principal_cache
 
 settings = Settings()
 SECRET_KEY = settings.KEY
@@ -51,10 +53,13 @@ def lookup_user(db: Session, username: str | None = None, user_id: int | None =
     return None
 
 
-def authenticate_user(db: Session, username: str, password: str) -> User:
+async def authenticate_user(db: Session, username: str, password: str) -> User:
     """
     Authenticate a user with username and password.
 
+    The lookup runs on the threadpool and the password check on the
+    password_hashing pool, so no shared thread waits on bcrypt.
+
     Args:
         db: Database session for querying users.
         username: Username of the user attempting to authenticate.
@@ -66,14 +71,14 @@ def authenticate_user(db: Session, username: str, password: str) -> User:
     Raises:
         HTTPException: 404 if user doesn't exist, 401 if password is incorrect.
     """
-    user = db.query(User).filter(User.username == username).first()
+    user = await run_in_threadpool(lookup_user, db=db, username=username)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User does not exist"
         )
     
-    if not verify_password(password=password, hash=user.pwd_hash):
+    if not await verify_password(password=password, hash=user.pwd_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -136,6 +141,9 @@ def get_current_user(
     Get the current authenticated and active user from JWT token.
     
     This is the main dependency to use for protecting routes that require authentication.
+    Active users are cached by user ID and token JTI (see principal_cache), so a
+    repeat request with the same token skips the database and gets back a
+    transient User without pwd_hash.
 
     Args:
         db: Database session for querying users.
@@ -147,8 +155,20 @@ def get_current_user(
     Raises:
         HTTPException: 401 if token is invalid, 404 if user not found, 403 if user is inactive.
     """
-    user = get_user_from_token(db=db, token=token)
-    return user_is_active(user=user)
+    token_data: Payload = TokenService.decode_token(token)
+    cached = principal_cache.get(token_data.id, token_data.jti)
+    if cached is not None:
+        return cached
+
+    user = lookup_user(db=db, user_id=token_data.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+    user = user_is_active(user=user)
+    principal_cache.set(user, token_data.jti)
+    return user
 
 
 def activate_user_account(db: Session, user_id: int, hash: str) -> User:
@@ -182,6 +202,7 @@ def activate_user_account(db: Session, user_id: int, hash: str) -> User:
         user.is_active = True
         db.commit()
         db.refresh(user)  
+        principal_cache.invalidate(user_id)
         return user
 
     except DatabaseError:
@@ -1,25 +1,15 @@
-from fastapi import HTTPException, status
-import resend
-from app.database.auth import User
-from app.config.config import Settings
+from sqlalchemy.orm import Session
+from app.database.auth import User, EmailOutbox
+from app.authentication.outbox.service import email_outbox
 
 
-settings = Settings()
-resend.api_key = settings.RESEND_API_KEY
+def send_email(db: Session, to_email: str, subject: str, html: str) -> EmailOutbox:
+    """Queue an email in the outbox; the dispatcher sends it in the background."""
+    return email_outbox.enqueue(db=db, to_email=to_email, subject=subject, html=html)
 
 
-def send_email(to_email:str, subject: str, html: str):
 
-    resend.Emails.send({
-         "from": "onboarding@resend.dev",
-         "to": to_email,
-         "subject": subject,
-         "html": html
-    })
-
-
-
-def invite_message(invite_token: str, user: User):
+def invite_message(db: Session, invite_token: str, user: User):
     
     INVITE_EXPIRY_HOURS = 24
     invite_link = f"https://slotmein.vercel.app/accept-invite?token={invite_token}"
@@ -71,12 +61,8 @@ def invite_message(invite_token: str, user: User):
     </html>
     """
 
-    try:
-        send_email(to_email=user.email, subject=subject, html=html)
-    except Exception as e:
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to send email: {e}")
-    
-    return {"message": f"Invite sent to {user.email}"}
+    email = send_email(db=db, to_email=user.email, subject=subject, html=html)
+    return {"message": f"Invite queued for {user.email}", "email_id": email.id}
 
 
 
@@ -2,18 +2,33 @@ import string
 import secrets
 import hashlib
 from passlib.context import CryptContext
+from app.config.config import Settings
+from app.core.utils.executor import BoundedExecutor
+
+settings = Settings()
 pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
 
+# bcrypt is deliberately slow; a burst of logins runs at most PASSWORD_HASH_CONCURRENCY
+# hashes at a time and answers 503 past the queue, leaving CPU and threads for other requests
+password_hashing = BoundedExecutor(
+        name="password-hashing",
+        max_concurrency=settings.PASSWORD_HASH_CONCURRENCY,
+        max_queue=settings.PASSWORD_HASH_QUEUE_SIZE,
+        retry_after_seconds=1,
+        busy_detail="Too many sign-ins at once. Please try again shortly.",
+)
+
 def generate_temporary_password():
         alphabet = string.ascii_letters + string.digits + string.punctuation
         temporary = ''.join(secrets.choice(alphabet) for _ in range(12))
         return temporary
 
-def hash_password(password: str) -> str:
+async def hash_password(password: str) -> str:
+        """Hash on the password_hashing pool; no event loop or threadpool thread waits on bcrypt."""
         prehash = hashlib.sha256(password.encode()).hexdigest()
-        return pwd_context.hash(prehash)
+        return await password_hashing.run(pwd_context.hash, prehash)
 
-def verify_password(password: str, hash: str) -> bool:
+async def verify_password(password: str, hash: str) -> bool:
+        """Verify on the password_hashing pool; no event loop or threadpool thread waits on bcrypt."""
         prehash = hashlib.sha256(password.encode()).hexdigest()
-        return pwd_context.verify(prehash, hash)
-
+        return await password_hashing.run(pwd_context.verify, prehash, hash)
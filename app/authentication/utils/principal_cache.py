@@ -0,0 +1,213 @@
+"""
+Cache of authenticated principals for get_current_user.
+
+A principal is the active user behind an access token, keyed by user ID and the
+token's `jti`. The JWT is still decoded (and its signature and expiry checked)
+on every request; only the `users` lookup is skipped on a hit.
+
+The store is pluggable. MemoryPrincipalStore keeps entries in the worker's own
+memory. SQLitePrincipalStore keeps them in a SQLite file that every worker on
+the host opens, so an invalidation in one worker reaches the others; it stands
+in for a shared cache service without adding one.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+from app.config.config import Settings
+from app.core.utils.cache import TTLCache
+from app.database.auth import User
+
+
+settings = Settings()
+
+
+class PrincipalStore(ABC):
+    """Where cached principals live. Values are plain dicts of User columns."""
+
+    @abstractmethod
+    def get(self, user_id: int, jti: str) -> Optional[dict]:
+        """Return the principal, or None if it is missing, expired or invalidated."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, user_id: int, jti: str, principal: dict):
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_user(self, user_id: int):
+        """Drop the principals of every token the user holds."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def size(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryPrincipalStore(PrincipalStore):
+    """
+    Per-process store on a TTLCache.
+
+    Invalidating a user bumps their generation rather than searching the cache for
+    their tokens; entries from an older generation read as missing. Other workers
+    don't see the invalidation and keep their entries until the TTL runs out.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60):
+        self.entries: TTLCache[tuple[int, dict]] = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.generations: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, jti: str) -> Optional[dict]:
+        entry = self.entries.get((user_id, jti))
+        if entry is None:
+            return None
+        generation, principal = entry
+        if generation != self.generations.get(user_id, 0):
+            self.entries.invalidate((user_id, jti))
+            return None
+        return principal
+
+    def set(self, user_id: int, jti: str, principal: dict):
+        self.entries.set((user_id, jti), (self.generations.get(user_id, 0), principal))
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            self.generations[user_id] = self.generations.get(user_id, 0) + 1
+
+    def size(self) -> int:
+        return len(self.entries)
+
+
+class SQLitePrincipalStore(PrincipalStore):
+    """
+    Store in a SQLite file shared by the workers on one host.
+
+    Expiry uses wall-clock time so every process agrees on it. Expired rows are
+    purged, and the table trimmed to `max_entries`, every `purge_every` writes.
+    """
+
+    def __init__(self, path: str, max_entries: int = 1024, ttl_seconds: float = 60, purge_every: int = 256):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.purge_every = purge_every
+        self.writes = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS principals ("
+                " user_id INTEGER NOT NULL,"
+                " jti TEXT NOT NULL,"
+                " principal TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " PRIMARY KEY (user_id, jti))"
+            )
+
+    def get(self, user_id: int, jti: str) -> Optional[dict]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT principal FROM principals WHERE user_id = ? AND jti = ? AND expires_at > ?",
+                (user_id, jti, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, user_id: int, jti: str, principal: dict):
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO principals (user_id, jti, principal, expires_at) VALUES (?, ?, ?, ?)",
+                (user_id, jti, json.dumps(principal), now + self.ttl_seconds),
+            )
+            self.writes += 1
+            if self.writes % self.purge_every == 0:
+                self.conn.execute("DELETE FROM principals WHERE expires_at <= ?", (now,))
+                self.conn.execute(
+                    "DELETE FROM principals WHERE rowid IN ("
+                    " SELECT rowid FROM principals ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def invalidate_user(self, user_id: int):
+        with self._lock:
+            self.conn.execute("DELETE FROM principals WHERE user_id = ?", (user_id,))
+
+    def size(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM principals WHERE expires_at > ?", (time.time(),)).fetchone()[0]
+
+
+class PrincipalCache:
+    """
+    Front of the principal store: turns users into cacheable dicts and back, and
+    counts hits and misses (per process) for the metrics endpoint.
+
+    Only active users are cached. A hit returns a transient User, not attached
+    to any session and without `pwd_hash`, which never enters the cache.
+    """
+
+    FIELDS = ("id", "username", "email", "firstname", "lastname", "user_role", "is_active")
+
+    def __init__(self, store: PrincipalStore):
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, jti: Optional[str]) -> Optional[User]:
+        principal = self.store.get(user_id, jti) if jti else None
+        with self._lock:
+            if principal is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return User(**principal) if principal is not None else None
+
+    def set(self, user: User, jti: Optional[str]):
+        if jti and user.is_active is True:
+            self.store.set(user.id, jti, {field: getattr(user, field) for field in self.FIELDS})
+
+    def invalidate(self, user_id: int):
+        """Forget every cached principal of the user; call after changing their account."""
+        self.store.invalidate_user(user_id)
+        with self._lock:
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses, invalidations = self.hits, self.misses, self.invalidations
+        lookups = hits + misses
+        return {
+            "backend": type(self.store).__name__,
+            "size": self.store.size(),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+            "invalidations": invalidations,
+        }
+
+
+def make_principal_store(backend: str, path: str, max_entries: int, ttl_seconds: float) -> PrincipalStore:
+    """Build the store named by PRINCIPAL_CACHE_BACKEND ("memory" or "sqlite").
+
+    Raises:
+        ValueError: For any other backend name.
+    """
+    if backend == "memory":
+        return MemoryPrincipalStore(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    if backend == "sqlite":
+        return SQLitePrincipalStore(path, max_entries=max_entries, ttl_seconds=ttl_seconds)
+    raise ValueError(f"Unknown principal cache backend {backend!r}; expected 'memory' or 'sqlite'")
+
+
+principal_cache = PrincipalCache(make_principal_store(
+    backend=settings.PRINCIPAL_CACHE_BACKEND,
+    path=settings.PRINCIPAL_CACHE_PATH,
+    max_entries=settings.PRINCIPAL_CACHE_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL,
+))
@@ -8,6 +8,32 @@ class Settings(BaseSettings):
     DATABASE_URL : str
     KEY : str
     RESEND_API_KEY: str
+    SCHEDULER_WORKERS: int = 1
+    SCHEDULER_RESTARTS: int = 8
+    SCHEDULER_DEADLINE_MS: int = 2000
+    SCHEDULER_MAX_BUDGET_MS: int = 5000
+    TALENT_SNAPSHOT_TTL: int = 300
+    GENERATION_CONCURRENCY: int = 2
+    GENERATION_QUEUE_SIZE: int = 8
+    GENERATION_JOB_QUEUE_SIZE: int = 32
+    GENERATION_JOB_TTL: int = 900
+    PREVIEW_CACHE_SIZE: int = 64
+    PREVIEW_CACHE_TTL: int = 600
+    SCHEDULE_DRAFT_LIMIT: int = 256
+    SCHEDULE_DRAFT_TTL: int = 3600
+    PRINCIPAL_CACHE_BACKEND: str = "memory"
+    PRINCIPAL_CACHE_PATH: str = "principal_cache.sqlite3"
+    PRINCIPAL_CACHE_SIZE: int = 1024
+    PRINCIPAL_CACHE_TTL: int = 60
+    PASSWORD_HASH_CONCURRENCY: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+    EMAIL_TRANSPORT: str = "resend"
+    EMAIL_FROM: str = "onboarding@resend.dev"
+    EMAIL_FILE_PATH: str = "outbox_mail.jsonl"
+    EMAIL_BATCH_SIZE: int = 50
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BASE_SECONDS: int = 30
+    EMAIL_POLL_SECONDS: int = 5
 
     class Config:
         env_file = ".env"
\ No newline at end of file
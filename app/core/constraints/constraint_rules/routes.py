@@ -6,9 +6,9 @@ This module provides REST API endpoints for creating and deleting constraint rul
 """
 
 from fastapi import APIRouter, Depends, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
-from app.database.session import session
+from app.database.session import async_session
 from app.database.auth import User
 from app.core.constraints.constraint_rules.schema import ConstraintRuleIn, ConstraintRuleOut
 from app.core.constraints.constraint_rules.services.services import ConstraintRuleService
@@ -17,9 +17,9 @@ from app.authentication.utils.auth_utils import get_current_user
 constraint_rules = APIRouter(tags=['Constraint Rules'])
 
 @constraint_rules.post("/create", response_model=list[ConstraintRuleOut])
-def create_constraint_rule(
+async def create_constraint_rule(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     data: Annotated[ConstraintRuleIn, Body()]
 ):
     """
@@ -40,13 +40,13 @@ def create_constraint_rule(
         HTTPException: 404 if constraint not found, 409 if rule already exists,
                       400 if validation fails.
     """
-    constraint_rule = ConstraintRuleService().create_rules(db=db, data=data)
+    constraint_rule = await ConstraintRuleService().create_rules(db=db, data=data)
     return constraint_rule
 
 @constraint_rules.delete("/delete/{rule_id}", status_code=204)
-def delete_constraint_rule(
+async def delete_constraint_rule(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     rule_id: int
 ):
     """
@@ -62,4 +62,4 @@ def delete_constraint_rule(
     Raises:
         HTTPException: 404 if rule not found.
     """
-    ConstraintRuleService().delete_rules(db=db, rule_id=rule_id)
\ No newline at end of file
+    await ConstraintRuleService().delete_rules(db=db, rule_id=rule_id)
\ No newline at end of file
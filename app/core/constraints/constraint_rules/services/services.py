@@ -1,43 +1,50 @@
-from sqlalchemy.orm import Session
-from app.core.utils.crud import CRUDBase
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.utils.crud import AsyncCRUDBase
 from app.database.models import ConstraintRule, TalentConstraint
 from app.core.constraints.constraint_rules.schema import  ConstraintRuleCreate, ConstraintRuleUpdate, ConstraintRuleIn, ConstraintRuleOut
 from app.core.constraints.constraint_rules.utils import generate_rule_combinations
 from app.core.constraints.constraint_rules.services.validators import evaluate_existing_rules, validate_constraint_rules, context_finder, rule_exists
 from app.core.constraints.constraint_rules.utils import rules_configuration
+from app.core.schedule.talents.snapshot import talent_snapshots
 
 
 
-class ConstraintRuleService(CRUDBase[ConstraintRule, ConstraintRuleIn, ConstraintRuleUpdate]):
+class ConstraintRuleService(AsyncCRUDBase[ConstraintRule, ConstraintRuleIn, ConstraintRuleUpdate]):
 
     def __init__(self):
         super().__init__(ConstraintRule)
        
     
-    def create_rules(self, db: Session, data:ConstraintRuleIn):
-        constraint = db.query(TalentConstraint).filter(
-            TalentConstraint.id == data.constraint_id).first()
+    async def create_rules(self, db: AsyncSession, data:ConstraintRuleIn):
+        constraint = await db.get(TalentConstraint, data.constraint_id)
         
         rules_config = rules_configuration(constraint=constraint)
         
         ctx = context_finder(db=db, data=data, rules_config=rules_config, constraint=constraint)
         validate_constraint_rules(ctx)
-        evaluate_existing_rules(ctx)
+        await evaluate_existing_rules(ctx)
         rules_to_process: list[ConstraintRuleCreate] = generate_rule_combinations(data)
 
         constraint.is_active = True
         
-        created_rules: list[ConstraintRule] = self.batch_create(db=db, objs_in=rules_to_process)
+        # ConstraintRuleOut nests the constraint, which is already loaded in this session
+        created_rules: list[ConstraintRule] = await self.batch_create(db=db, objs_in=rules_to_process)
+        talent_snapshots.bump()
         
         return [ConstraintRuleOut.model_validate(rule) for rule in created_rules]
 
-    def delete_rules(self, db: Session, rule_id: int):
-        rule = db.query(ConstraintRule).filter(ConstraintRule.id == rule_id).first()
+    async def delete_rules(self, db: AsyncSession, rule_id: int):
+        rule = await db.get(ConstraintRule, rule_id)
         rule_exists(rule)
-        self.delete(db=db, id=rule_id)
+        await self.delete(db=db, id=rule_id)
+        talent_snapshots.bump()
 
-def get_rule(db: Session, id: int):
-    rule = db.query(ConstraintRule).filter(ConstraintRule.id == id)
+async def get_rule(db: AsyncSession, id: int):
+    rule = (await db.scalars(
+        select(ConstraintRule).where(ConstraintRule.id == id).options(selectinload(ConstraintRule.constraint))
+    )).first()
     rule_exists(rule)
     return ConstraintRuleOut.model_validate(rule)
 
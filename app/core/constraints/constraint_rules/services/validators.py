@@ -1,13 +1,13 @@
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import select, and_
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.constraints.constraint_rules.schema import ConstraintRuleIn
 from app.database.models import TalentConstraint, ConstraintRule
 from app.core.utils.enums import ConstraintType
 
 
 
-def context_finder(*, db: Session, data: ConstraintRuleIn, rules_config: dict, constraint:TalentConstraint ) -> dict:
+def context_finder(*, db: AsyncSession, data: ConstraintRuleIn, rules_config: dict, constraint:TalentConstraint ) -> dict:
 
         context = {
             "db": db,
@@ -51,9 +51,9 @@ def validate_constraint_rules(context: dict):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                                 detail="Combination constraints require both day and shifts")
     
-def evaluate_existing_rules(context: dict):
+async def evaluate_existing_rules(context: dict):
 
-        db: Session = context["db"]
+        db: AsyncSession = context["db"]
         data: ConstraintRuleIn = context["data"]
         constraint: TalentConstraint = context["constraint"]
 
@@ -68,7 +68,9 @@ def evaluate_existing_rules(context: dict):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one day or shift required")
 
         filter_expression = CONSTRAINT_FILTERS[constraint.type](data)
-        existing_rules = db.query(ConstraintRule).filter(ConstraintRule.constraint_id == data.constraint_id, filter_expression).first()
+        existing_rules = (await db.scalars(
+            select(ConstraintRule).where(ConstraintRule.constraint_id == data.constraint_id, filter_expression)
+        )).first()
 
         if existing_rules:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Constraint rule exists")
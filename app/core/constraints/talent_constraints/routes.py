@@ -6,10 +6,10 @@ talent constraints (availability restrictions for specific talents).
 """
 
 from fastapi import APIRouter, Depends, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 from app.core.constraints.talent_constraints.services.services import TalentConstraintService, get_all_constraints, get_constraint
-from app.database.session import session
+from app.database.session import async_session
 from app.database.auth import User
 from app.core.constraints.talent_constraints.schema import ConstraintIn, ConstraintOut
 from app.authentication.utils.auth_utils import get_current_user
@@ -21,9 +21,9 @@ talent_constraints = APIRouter(tags=["Talent Constraints"])
 
 
 @talent_constraints.post("/create", response_model=ConstraintOut)
-def create_constraint(
+async def create_constraint(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     data: Annotated[ConstraintIn, Body()]
 ):
     """
@@ -43,13 +43,13 @@ def create_constraint(
     Raises:
         HTTPException: 404 if talent not found, 400 if talent inactive, 403 if constraint exists.
     """
-    constraint = TalentConstraintService().create_constraint(db=db, data=data)
+    constraint = await TalentConstraintService().create_constraint(db=db, data=data)
     return constraint
 
 @talent_constraints.delete("/delete/{constraint_id}", status_code=204)
-def delete_constraint(
+async def delete_constraint(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     constraint_id: int
 ):
     """
@@ -65,12 +65,12 @@ def delete_constraint(
     Raises:
         HTTPException: 404 if constraint not found.
     """
-    TalentConstraintService().delete_constraint(db=db, constraint_id=constraint_id)
+    await TalentConstraintService().delete_constraint(db=db, constraint_id=constraint_id)
 
 @talent_constraints.get("/retrieve_constraint/{constraint_id}", response_model=ConstraintOut)
-def retrieve_constraint(
+async def retrieve_constraint(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     constraint_id: int
 ):
     """
@@ -89,12 +89,12 @@ def retrieve_constraint(
     Raises:
         HTTPException: 404 if constraint not found.
     """
-    return get_constraint(db=db, id=constraint_id)
+    return await get_constraint(db=db, id=constraint_id)
 
 @talent_constraints.get("/retrieve_all_constraints", response_model=list[ConstraintOut])
-def retrieve_all_constraints(
+async def retrieve_all_constraints(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     constraint_id: int | None = None,
     talent_id: int | None = None,
     tal_role: str | None = None,
@@ -124,7 +124,7 @@ def retrieve_all_constraints(
     Raises:
         HTTPException: 404 if no constraints found.
     """
-    return get_all_constraints(
+    return await get_all_constraints(
         db=db,
         constraint_id=constraint_id,
         talent_id=talent_id,
@@ -1,52 +1,67 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-from app.core.utils.crud import CRUDBase
+from app.core.utils.crud import AsyncCRUDBase
 from app.database.models import TalentConstraint, Talent, ConstraintRule
 from app.core.constraints.talent_constraints.schema import ConstraintIn, ConstraintUpdate, ConstraintOut
 from app.core.constraints.talent_constraints.services.validators import validate_constraint_input, constraint_exists
 from app.core.constraints.talent_constraints.utils import search_filters
+from app.core.schedule.talents.snapshot import talent_snapshots
 
 
-class TalentConstraintService(CRUDBase[TalentConstraint, ConstraintIn, ConstraintUpdate]):
+# ConstraintOut nests the talent and the rules; AsyncSession can't lazy-load them
+CONSTRAINT_OUT_OPTIONS = (selectinload(TalentConstraint.talent), selectinload(TalentConstraint.rules))
+
+
+class TalentConstraintService(AsyncCRUDBase[TalentConstraint, ConstraintIn, ConstraintUpdate]):
 
     def __init__(self):
         super().__init__(TalentConstraint)
     
-    def create_constraint(self, db: Session, data: ConstraintIn):
+    async def create_constraint(self, db: AsyncSession, data: ConstraintIn):
        
-        talent = db.query(Talent).filter(Talent.id == data.talent_id).first()
-        constraint = db.query(TalentConstraint).filter(TalentConstraint.talent_id == data.talent_id,TalentConstraint.type == data.type).first()
+        talent = await db.get(Talent, data.talent_id)
+        constraint = (await db.scalars(select(TalentConstraint).where(TalentConstraint.talent_id == data.talent_id,TalentConstraint.type == data.type))).first()
         validate_constraint_input(talent=talent, constraint=constraint)
-        created_constraint: TalentConstraint = self.create(db=db, obj_in=data)
+        created_constraint: TalentConstraint = await self.create(db=db, obj_in=data)
+        await db.refresh(created_constraint, ["talent", "rules"])
+        talent_snapshots.bump()
         return ConstraintOut.model_validate(created_constraint)
 
    
-    def delete_constraint(self, db: Session, constraint_id: int):
-        constraint = db.query(TalentConstraint).filter(TalentConstraint.id == constraint_id).first()
+    async def delete_constraint(self, db: AsyncSession, constraint_id: int):
+        constraint = await db.get(TalentConstraint, constraint_id)
         constraint_exists(constraint)
-        self.delete(db=db, id=constraint_id)
+        await self.delete(db=db, id=constraint_id)
+        talent_snapshots.bump()
 
-def get_constraint(db: Session, id: int):
+async def get_constraint(db: AsyncSession, id: int):
     
-    constraint = db.query(TalentConstraint).join(TalentConstraint.talent).join(TalentConstraint.rules).filter(TalentConstraint.id == id).first()
+    constraint = (await db.scalars(
+        select(TalentConstraint).join(TalentConstraint.talent).join(TalentConstraint.rules)
+        .where(TalentConstraint.id == id).options(*CONSTRAINT_OUT_OPTIONS)
+    )).first()
     constraint_exists(constraint)
     return ConstraintOut.model_validate(constraint)
 
-def get_all_constraints(db: Session,
+async def get_all_constraints(db: AsyncSession,
                         constraint_id: int| None = None,
                         talent_id: int| None = None,
                         tal_role: str | None = None,
                         name: str | None = None,
                         contract_type: str | None = None,
                         is_active: bool| None = None):
-    query = db.query(TalentConstraint).join(Talent).outerjoin(ConstraintRule)
-    constraints = search_filters(query=query, 
-                                 constraint_id=constraint_id,
-                                 talent_id=talent_id,
-                                 tal_role=tal_role,
-                                 name=name,
-                                 contract_type=contract_type,
-                                 is_active=is_active)
+    query = select(TalentConstraint).join(Talent).outerjoin(ConstraintRule).options(*CONSTRAINT_OUT_OPTIONS)
+    query = search_filters(query=query, 
+                           constraint_id=constraint_id,
+                           talent_id=talent_id,
+                           tal_role=tal_role,
+                           name=name,
+                           contract_type=contract_type,
+                           is_active=is_active)
+    # The rule join repeats a constraint once per rule; Query used to drop the repeats
+    constraints = (await db.scalars(query)).unique().all()
     constraint_exists(constraints)
     return [ConstraintOut.model_validate(constraint) for constraint in constraints]
 
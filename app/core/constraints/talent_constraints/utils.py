@@ -1,15 +1,14 @@
-from sqlalchemy.orm import Query
-from sqlalchemy import or_
+from sqlalchemy import Select, or_
 from app.database.models import Talent, TalentConstraint
 
 
-def search_filters(query: Query,
+def search_filters(query: Select,
                    constraint_id: int| None = None,
                         talent_id: int| None = None,
                         tal_role: str | None = None,
                         name: str | None = None,
                         contract_type: str | None = None,
-                        is_active: bool| None = None):
+                        is_active: bool| None = None) -> Select:
     if constraint_id:
         query = query.filter(TalentConstraint.id == constraint_id)
     
@@ -33,4 +32,4 @@ def search_filters(query: Query,
     if is_active is not None:
         query = query.filter(Talent.is_active == is_active)
     
-    return query.all()
+    return query
@@ -0,0 +1,56 @@
+from dataclasses import replace
+from datetime import date, datetime, time, timedelta
+from app.core.schedule.shifts.schema import shiftSpecification
+from app.core.schedule.allocator.entities import assignment
+
+
+class weekClock:
+    """Integer time model used inside the allocator.
+
+    Moments become minutes since midnight of a Sunday (the week start) and days
+    become day indices from that Sunday, so day // 7 is the Sunday-to-Saturday
+    week. Shifts are stamped with these integers once, on entry, and the engine
+    compares and subtracts plain ints from then on. Earlier days (history) get
+    negative indices.
+    """
+
+    MINUTES_PER_DAY = 1440
+
+    def __init__(self, day: date):
+        """
+        Args:
+            day (date): Any day of the first week to model; the clock starts on the Sunday before it.
+        """
+        self.week_start = day - timedelta(days=(day.weekday() + 1) % 7)
+        self.epoch = datetime.combine(self.week_start, time.min)
+
+    @classmethod
+    def covering(cls, shifts) -> "weekClock":
+        """Return a clock starting on the Sunday of the earliest shift (today when there are none)."""
+        days = [shift.start_time.date() for shift in shifts]
+        return cls(min(days) if days else date.today())
+
+    def minutes(self, moment: datetime) -> int:
+        """Return whole minutes from the week start to `moment`."""
+        return (moment - self.epoch) // timedelta(minutes=1)
+
+    def day_index(self, day: date) -> int:
+        """Return the day index of `day` (0 is the week start)."""
+        return (day - self.week_start).days
+
+    def datetime_at(self, minutes: int) -> datetime:
+        """Turn minutes from the week start back into a datetime."""
+        return self.epoch + timedelta(minutes=minutes)
+
+    def stamp(self, shift: shiftSpecification) -> shiftSpecification:
+        """Return a copy of the shift carrying its day index and start/end minutes."""
+        start = self.minutes(shift.start_time)
+        return replace(shift, day=start // self.MINUTES_PER_DAY, start_min=start, end_min=self.minutes(shift.end_time))
+
+    def stamp_assignment(self, old_assignment: assignment) -> assignment:
+        """Return a copy of the assignment whose shift is stamped with this clock."""
+        return assignment(
+            talent_id=old_assignment.talent_id,
+            shift_id=old_assignment.shift_id,
+            shift=self.stamp(old_assignment.shift),
+        )
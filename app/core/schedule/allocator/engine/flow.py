@@ -0,0 +1,142 @@
+import heapq
+
+
+class minCostFlow:
+    """Minimum-cost maximum-flow solver (primal-dual, successive shortest paths).
+
+    Each phase runs Dijkstra on reduced costs to update the node potentials, then
+    pushes as much flow as possible along the edges that are tight under the new
+    potentials, so a phase can saturate many shortest paths at once. Edge costs must
+    be non-negative integers.
+    """
+
+    def __init__(self):
+        # Each edge is [to, capacity, cost, index of the reverse edge in graph[to]]
+        self.graph: list[list[list[int]]] = []
+
+    def add_node(self) -> int:
+        """Add a node and return its index."""
+        self.graph.append([])
+        return len(self.graph) - 1
+
+    def add_edge(self, u: int, v: int, capacity: int, cost: int) -> tuple[int, int]:
+        """Add a directed edge u → v.
+
+        Args:
+            u (int): Tail node.
+            v (int): Head node.
+            capacity (int): Maximum flow through the edge.
+            cost (int): Non-negative cost per unit of flow.
+
+        Returns:
+            tuple[int, int]: Reference to the edge, to read its flow back with `flow`.
+        """
+        self.graph[u].append([v, capacity, cost, len(self.graph[v])])
+        self.graph[v].append([u, 0, -cost, len(self.graph[u]) - 1])
+        return u, len(self.graph[u]) - 1
+
+    def flow(self, edge: tuple[int, int]) -> int:
+        """Return the flow pushed through an edge returned by `add_edge`."""
+        u, index = edge
+        v, _, _, reverse = self.graph[u][index]
+        return self.graph[v][reverse][1]
+
+    def solve(self, source: int, sink: int) -> int:
+        """Push the maximum flow from source to sink at minimum total cost.
+
+        Returns:
+            int: The total flow pushed.
+        """
+        potential = [0] * len(self.graph)
+        total = 0
+
+        while True:
+            dist, parent = self._shortest_paths(source, potential)
+            if dist[sink] is None:
+                return total
+
+            for node, d in enumerate(dist):
+                if d is not None:
+                    potential[node] += d
+
+            pushed = self._push_tight(source, sink, potential)
+            if not pushed:
+                # The tight-edge search can miss a path through a zero-cost cycle;
+                # the Dijkstra path is always tight, so push along it instead
+                pushed = self._push_path(source, sink, parent)
+            total += pushed
+
+    def _shortest_paths(self, source: int, potential: list[int]):
+        dist: list[int | None] = [None] * len(self.graph)
+        parent: list[tuple[int, int] | None] = [None] * len(self.graph)
+        dist[source] = 0
+        heap = [(0, source)]
+
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for index, (v, capacity, cost, _) in enumerate(self.graph[u]):
+                if capacity <= 0:
+                    continue
+                candidate = d + cost + potential[u] - potential[v]
+                if dist[v] is None or candidate < dist[v]:
+                    dist[v] = candidate
+                    parent[v] = (u, index)
+                    heapq.heappush(heap, (candidate, v))
+
+        return dist, parent
+
+    def _augment(self, path: list[tuple[int, int]]) -> int:
+        pushed = min(self.graph[u][index][1] for u, index in path)
+        for u, index in path:
+            edge = self.graph[u][index]
+            edge[1] -= pushed
+            self.graph[edge[0]][edge[3]][1] += pushed
+        return pushed
+
+    def _push_path(self, source: int, sink: int, parent) -> int:
+        path = []
+        node = sink
+        while node != source:
+            u, index = parent[node]
+            path.append((u, index))
+            node = u
+        return self._augment(path)
+
+    def _push_tight(self, source: int, sink: int, potential: list[int]) -> int:
+        """Blocking flow over tight edges (zero reduced cost), using current-arc pointers."""
+        arc = [0] * len(self.graph)
+        on_path = [False] * len(self.graph)
+        pushed = 0
+
+        while True:
+            path: list[tuple[int, int]] = []
+            u = source
+            on_path[source] = True
+
+            while u != sink:
+                edges = self.graph[u]
+                while arc[u] < len(edges):
+                    v, capacity, cost, _ = edges[arc[u]]
+                    if capacity > 0 and not on_path[v] and cost + potential[u] - potential[v] == 0:
+                        break
+                    arc[u] += 1
+
+                if arc[u] < len(edges):
+                    path.append((u, arc[u]))
+                    u = edges[arc[u]][0]
+                    on_path[u] = True
+                    continue
+
+                # Dead end: retreat and never try this node again during the phase
+                on_path[u] = False
+                if u == source:
+                    return pushed
+                u, _ = path.pop()
+                arc[u] += 1
+
+            pushed += self._augment(path)
+            for u, _ in path:
+                on_path[u] = False
+            on_path[sink] = False
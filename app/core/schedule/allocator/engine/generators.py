@@ -1,7 +1,8 @@
 from collections import defaultdict
+import numpy as np
 from app.core.schedule.talents.schema import talentAvailability
 from app.core.schedule.shifts.schema import shiftSpecification
-from datetime import date
+from app.core.schedule.allocator.engine.clock import weekClock
 
 
 class TalentByRole:
@@ -22,31 +23,126 @@ class TalentByRole:
         return talents_by_role
 
 
-class TalentGenerator():
-    def __init__(self, shift: shiftSpecification, talents_by_role: dict[str, tuple[int, tuple]], lookup: dict[tuple[int, date], tuple[date, date]]):
-        """Generate eligible talents for a given shift.
+class EligibilityMatrix:
+    def __init__(self, shifts: dict[int, shiftSpecification], talents_by_role: dict[str, tuple[int, tuple]],
+                 availability: dict[int, talentAvailability], clock: weekClock):
+        """Precompute which talents may work which shifts for a whole week.
+
+        The matrix is talent x shift and is built in one vectorised pass: a talent is
+        eligible when the role matches, the shift name is in the talent's shift list,
+        and one of the talent's availability windows on that date covers the shift.
+        Windows are turned into clock minutes once; shifts arrive already stamped.
 
         Args:
-            shift (shiftSpecification): The shift specification being assigned.
+            shifts (dict[int, shiftSpecification]): The week's shift instances keyed by ID.
             talents_by_role (dict[str, tuple]): Mapping of role name to tuples of talent info.
-            lookup (dict[tuple[int, date], tuple[date, date]]): Availability lookup keyed by (talent_id, date).
+            availability (dict[int, talentAvailability]): Mapping of talent IDs to their availability objects.
+            clock (weekClock): The clock the shifts were stamped with.
         """
-        self.shift = shift
-        self.talents_by_role = talents_by_role
-        self.lookup = lookup
+        self.clock = clock
+        self.shift_ids = list(shifts)
+        self.talent_ids: list[int] = []
+        talent_roles: list[str] = []
+        talent_shifts: list[list[str]] = []
+        seen = set()
+
+        for role, talents in talents_by_role.items():
+            for talent_id, _, shift_names in talents:
+                if talent_id in seen:
+                    continue
+                seen.add(talent_id)
+                self.talent_ids.append(talent_id)
+                talent_roles.append(role)
+                talent_shifts.append(shift_names)
+
+        self.constrained = np.array(
+            [tid in availability and bool(availability[tid].constraint) for tid in self.talent_ids], dtype=bool)
+        self.unconstrained = np.array(
+            [tid in availability and not availability[tid].constraint for tid in self.talent_ids], dtype=bool)
+
+        self.matrix = self._build(list(shifts.values()), talent_roles, talent_shifts, availability)
+
+    def _build(self, shifts: list[shiftSpecification], talent_roles: list[str], talent_shifts: list[list[str]],
+               availability: dict[int, talentAvailability]) -> np.ndarray:
+        talents, slots = len(self.talent_ids), len(shifts)
+        if not talents or not slots:
+            return np.zeros((talents, slots), dtype=bool)
+
+        # Role and shift-name checks become integer comparisons on encoded labels
+        role_codes = {role: code for code, role in enumerate(dict.fromkeys(talent_roles))}
+        talent_role = np.array([role_codes[role] for role in talent_roles])
+        shift_role = np.array([role_codes.get(shift.role_name, -1) for shift in shifts])
+        role_match = talent_role[:, None] == shift_role[None, :]
+
+        name_codes = {name: code for code, name in enumerate(dict.fromkeys(shift.shift_name for shift in shifts))}
+        shift_name = np.array([name_codes[shift.shift_name] for shift in shifts])
+        works_name = np.zeros((talents, len(name_codes)), dtype=bool)
+        for row, names in enumerate(talent_shifts):
+            for name in names:
+                if name in name_codes:
+                    works_name[row, name_codes[name]] = True
+        name_match = works_name[:, shift_name]
 
-    def find_eligible_talents(self):
-        """Find all eligible talents for the shift.
+        # Talents sharing a window object (see TalentAssembler) share a pattern,
+        # so coverage is computed once per distinct pattern rather than per talent
+        pattern_of: dict[int, int] = {}
+        patterns = []
+        talent_pattern = np.full(talents, -1, dtype=np.intp)
+        for row, talent_id in enumerate(self.talent_ids):
+            talent = availability.get(talent_id)
+            if talent is None:
+                continue
+            if id(talent.window) not in pattern_of:
+                pattern_of[id(talent.window)] = len(patterns)
+                patterns.append(talent.window)
+            talent_pattern[row] = pattern_of[id(talent.window)]
 
-        Yields:
-            int: Talent IDs that meet role, availability, and shift constraints.
+        # Flatten every pattern's spans into parallel arrays, grouped by pattern
+        window_row, window_day, window_start, window_end = [], [], [], []
+        for pattern, window in enumerate(patterns):
+            for day, spans in window.items():
+                for start, end in spans:
+                    window_row.append(pattern)
+                    window_day.append(self.clock.day_index(day))
+                    window_start.append(self.clock.minutes(start))
+                    window_end.append(self.clock.minutes(end))
+
+        covered = np.zeros((talents, slots), dtype=bool)
+        if window_row:
+            shift_day = np.array([shift.day for shift in shifts])
+            shift_start = np.array([shift.start_min for shift in shifts])
+            shift_end = np.array([shift.end_min for shift in shifts])
+
+            window_row = np.array(window_row)
+            fits = (
+                (np.array(window_day)[:, None] == shift_day[None, :])
+                & (np.array(window_start)[:, None] <= shift_start[None, :])
+                & (np.array(window_end)[:, None] >= shift_end[None, :])
+            )
+            # Any span of a pattern covering the shift is enough: OR-reduce each pattern's rows
+            pattern_covered = np.zeros((len(patterns), slots), dtype=bool)
+            rows, first = np.unique(window_row, return_index=True)
+            pattern_covered[rows] = np.logical_or.reduceat(fits, first, axis=0)
+
+            has_pattern = talent_pattern >= 0
+            covered[has_pattern] = pattern_covered[talent_pattern[has_pattern]]
+
+        return role_match & name_match & covered
+
+    def eligible_talents(self) -> dict[int, list[int]]:
+        """List the eligible talents of every shift, constrained talents first.
+
+        Returns:
+            dict[int, list[int]]: shift_instance_id -> talent IDs, keeping the
+            talents_by_role order within the constrained and unconstrained groups.
         """
-        seen = set()
-        for talent_id, _, shifts in self.talents_by_role[self.shift.role_name]:
-            window_lookup = self.lookup.get((talent_id, self.shift.start_time.date()), [])
-            if any(start <= self.shift.start_time and end >= self.shift.end_time for start, end in window_lookup):
-                if self.shift.shift_name in shifts:
-                    if talent_id not in seen:
-                        yield talent_id
-                        seen.add(talent_id)
+        ids = np.array(self.talent_ids, dtype=np.int64)
+        # Order rows once (constrained first, stable) and read each shift's column through it
+        order = np.concatenate([np.flatnonzero(self.constrained), np.flatnonzero(self.unconstrained)])
+        ordered_ids = ids[order]
+        by_shift = self.matrix[order].T
 
+        return {
+            shift_id: ordered_ids[by_shift[col]].tolist()
+            for col, shift_id in enumerate(self.shift_ids)
+        }
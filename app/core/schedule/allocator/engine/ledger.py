@@ -0,0 +1,97 @@
+from collections import defaultdict
+from app.core.schedule.allocator.entities import assignment
+
+
+class assignmentLedger:
+    """Index of assignments keyed by talent and day index.
+
+    Replaces the flat assignment list the validators and the scorer used to scan.
+    Every lookup they need (shifts on a given day, hours in a given week, hours
+    overall) is a dictionary probe, and the weekly totals are kept up to date as
+    assignments are recorded rather than summed on demand.
+
+    Days and weeks are the integers of weekClock: shifts must be stamped before
+    they are recorded.
+    """
+
+    def __init__(self, assignments: list[assignment] = None):
+        """
+        Args:
+            assignments (list[assignment], optional):
+                Assignments to load up front, typically the previous week's history.
+        """
+        self.entries: list[assignment] = []
+        self.by_day: dict[tuple[int, int], list[assignment]] = defaultdict(list)
+        self.weekly_hours: dict[tuple[int, int], float] = defaultdict(float)
+        self.total_hours: dict[int, float] = defaultdict(float)
+
+        for a in assignments or []:
+            self.add(a)
+
+    @staticmethod
+    def week_of(day: int) -> int:
+        """Return the index of the Sunday-to-Saturday week containing day index `day`."""
+        return day // 7
+
+    def add(self, new_assignment: assignment):
+        """Record an assignment and update the running hour totals.
+
+        Args:
+            new_assignment (assignment): The assignment to record.
+        """
+        talent_id = new_assignment.talent_id
+        shift_day = new_assignment.shift.day
+        hours = (new_assignment.shift.end_min - new_assignment.shift.start_min) / 60
+
+        self.entries.append(new_assignment)
+        self.by_day[(talent_id, shift_day)].append(new_assignment)
+        self.weekly_hours[(talent_id, self.week_of(shift_day))] += hours
+        self.total_hours[talent_id] += hours
+
+    def remove(self, old_assignment: assignment):
+        """Forget a recorded assignment and take its hours off the running totals.
+
+        Args:
+            old_assignment (assignment): An assignment previously passed to `add`.
+        """
+        talent_id = old_assignment.talent_id
+        shift_day = old_assignment.shift.day
+        hours = (old_assignment.shift.end_min - old_assignment.shift.start_min) / 60
+
+        self.entries.remove(old_assignment)
+        day_entries = self.by_day[(talent_id, shift_day)]
+        day_entries.remove(old_assignment)
+        if not day_entries:
+            del self.by_day[(talent_id, shift_day)]
+
+        # Re-add the week from what is left rather than subtracting, so repeated
+        # moves cannot accumulate floating-point drift in the hour check
+        week = self.week_of(shift_day)
+        self.weekly_hours[(talent_id, week)] = sum(
+            (a.shift.end_min - a.shift.start_min) / 60
+            for day in range(week * 7, week * 7 + 7)
+            for a in self.by_day.get((talent_id, day), [])
+        )
+        self.total_hours[talent_id] -= hours
+
+    def shifts_on(self, talent_id: int, day: int) -> list[assignment]:
+        """Return the talent's assignments on `day`, in the order they were recorded."""
+        return self.by_day.get((talent_id, day), [])
+
+    def works_on(self, talent_id: int, day: int) -> bool:
+        """Return True if the talent has at least one assignment on `day`."""
+        return bool(self.by_day.get((talent_id, day)))
+
+    def hours_in_week(self, talent_id: int, day: int) -> float:
+        """Return the hours already recorded for the talent in the week containing `day`."""
+        return self.weekly_hours.get((talent_id, self.week_of(day)), 0.0)
+
+    def hours_for(self, talent_id: int) -> float:
+        """Return every hour recorded for the talent, regardless of week."""
+        return self.total_hours.get(talent_id, 0.0)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
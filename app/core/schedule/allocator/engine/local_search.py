@@ -0,0 +1,216 @@
+import time
+from collections import defaultdict
+from app.core.schedule.shifts.schema import shiftSpecification
+from app.core.schedule.talents.schema import talentAvailability
+from app.core.schedule.allocator.entities import assignment
+from app.core.schedule.allocator.engine.ledger import assignmentLedger
+from app.core.schedule.allocator.engine.validators import placementValidator, context
+
+
+class workloadSpread:
+    """Running variance of the talents' utilisation (hours assigned / weekly hours).
+
+    Keeps the sum and sum of squares so the effect of moving hours between two
+    talents is known in O(1), without recomputing over everyone.
+    """
+
+    def __init__(self, availability: dict[int, talentAvailability], plan: list[assignment]):
+        self.weekly = {tid: a.weeklyhours for tid, a in availability.items() if a.weeklyhours}
+        self.ratio = {tid: 0.0 for tid in self.weekly}
+        for a in plan:
+            if a.talent_id in self.ratio:
+                self.ratio[a.talent_id] += _hours(a.shift) / self.weekly[a.talent_id]
+        self.total = sum(self.ratio.values())
+        self.squares = sum(r * r for r in self.ratio.values())
+
+    def variance(self, total: float = None, squares: float = None) -> float:
+        if not self.ratio:
+            return 0.0
+        total = self.total if total is None else total
+        squares = self.squares if squares is None else squares
+        mean = total / len(self.ratio)
+        return squares / len(self.ratio) - mean * mean
+
+    def _moved(self, hours: float, source: int, target: int) -> tuple[float, float, float, float]:
+        old_source, old_target = self.ratio[source], self.ratio[target]
+        new_source = old_source - hours / self.weekly[source]
+        new_target = old_target + hours / self.weekly[target]
+        total = self.total - old_source - old_target + new_source + new_target
+        squares = self.squares - old_source ** 2 - old_target ** 2 + new_source ** 2 + new_target ** 2
+        return new_source, new_target, total, squares
+
+    def gain(self, hours: float, source: int, target: int) -> float:
+        """How much the variance drops if `hours` move from source to target (positive is better)."""
+        if source not in self.ratio or target not in self.ratio:
+            return 0.0
+        _, _, total, squares = self._moved(hours, source, target)
+        return self.variance() - self.variance(total, squares)
+
+    def move(self, hours: float, source: int, target: int):
+        if source not in self.ratio or target not in self.ratio:
+            return
+        self.ratio[source], self.ratio[target], self.total, self.squares = self._moved(hours, source, target)
+
+    def add(self, hours: float, talent_id: int):
+        if talent_id not in self.ratio:
+            return
+        old = self.ratio[talent_id]
+        self.ratio[talent_id] = old + hours / self.weekly[talent_id]
+        self.total += self.ratio[talent_id] - old
+        self.squares += self.ratio[talent_id] ** 2 - old ** 2
+
+
+def _hours(shift: shiftSpecification) -> float:
+    return (shift.end_min - shift.start_min) / 60
+
+
+class localSearch:
+    """Time-budgeted improvement pass over a finished plan.
+
+    Two neighbourhoods, both hill-climbing, so the current plan is always the best
+    one found and can be returned the moment the budget runs out:
+    - fill: put an eligible talent on an understaffed shift; when the talent is
+      blocked by one of their own shifts, hand that shift to someone else first.
+    - balance: move a shift from a heavily loaded talent to a lighter one when that
+      lowers the spread of utilisation.
+
+    Every move is checked with placementValidator against the ledger, so only the
+    talents it touches are validated, never the whole plan.
+    """
+
+    # Spread gains smaller than this are rounding noise, not improvements
+    EPSILON = 1e-9
+
+    def __init__(self, availability: dict[int, talentAvailability],
+                 assignable_shifts: dict[int, shiftSpecification],
+                 eligibility: dict[int, list[int]],
+                 history: list[assignment],
+                 budget_ms: int):
+        """
+        Args:
+            availability (dict[int, talentAvailability]): Mapping of talent IDs to their availability.
+            assignable_shifts (dict[int, shiftSpecification]): The week's shifts keyed by shift ID.
+            eligibility (dict[int, list[int]]): Eligible talent IDs per shift ID.
+            history (list[assignment]): Assignments before the week, used by the rest and streak rules.
+            budget_ms (int): Wall-clock budget for the whole pass, in milliseconds.
+        """
+        self.availability = availability
+        self.assignable_shifts = assignable_shifts
+        self.eligibility = eligibility
+        self.history = history
+        self.budget_ms = budget_ms
+        self.validator = placementValidator()
+
+    def improve(self, plan: list[assignment]) -> list[assignment]:
+        """Improve the plan until no move helps or the budget is spent.
+
+        Args:
+            plan (list[assignment]): The plan produced by a solver.
+
+        Returns:
+            list[assignment]: The best plan found.
+        """
+        self.deadline = time.perf_counter() + self.budget_ms / 1000
+        # Keyed by identity so a move adds or drops an assignment in O(1), in plan order
+        self.plan: dict[int, assignment] = {}
+        self.ledger = assignmentLedger(self.history)
+        self.on_shift: dict[int, set[int]] = defaultdict(set)
+        for a in plan:
+            self.plan[id(a)] = a
+            self.ledger.add(a)
+            self.on_shift[a.shift_id].add(a.talent_id)
+        self.spread = workloadSpread(self.availability, plan)
+
+        self._fill_gaps()
+        self._balance()
+        return list(self.plan.values())
+
+    def _expired(self) -> bool:
+        return time.perf_counter() >= self.deadline
+
+    def _fits(self, talent_id: int, shift: shiftSpecification) -> bool:
+        if shift.shift_name not in self.availability[talent_id].shift_name:
+            return False
+        ctx = context.contextFinder(talent_id, shift, self.availability, self.ledger)
+        return self.validator.can_assign_shift(ctx)
+
+    def _place(self, talent_id: int, shift_id) -> assignment:
+        new_assignment = assignment(talent_id=talent_id, shift_id=shift_id, shift=self.assignable_shifts[shift_id])
+        self.plan[id(new_assignment)] = new_assignment
+        self.ledger.add(new_assignment)
+        self.on_shift[shift_id].add(talent_id)
+        return new_assignment
+
+    def _unplace(self, old_assignment: assignment):
+        del self.plan[id(old_assignment)]
+        self.ledger.remove(old_assignment)
+        self.on_shift[old_assignment.shift_id].discard(old_assignment.talent_id)
+
+    def _fill_gaps(self):
+        for shift_id, shift in self.assignable_shifts.items():
+            while len(self.on_shift[shift_id]) < shift.role_count:
+                if self._expired() or not self._fill_one(shift_id, shift):
+                    break
+            if self._expired():
+                return
+
+    def _fill_one(self, shift_id, shift: shiftSpecification) -> bool:
+        candidates = [tid for tid in self.eligibility.get(shift_id, []) if tid not in self.on_shift[shift_id]]
+
+        for talent_id in candidates:
+            if self._fits(talent_id, shift):
+                self.spread.add(_hours(shift), talent_id)
+                self._place(talent_id, shift_id)
+                return True
+
+        # Ejection: free a candidate by handing one of their nearby shifts to someone else
+        for talent_id in candidates:
+            if self._expired():
+                return False
+            nearby = [
+                a
+                for offset in range(-6, 7)
+                for a in self.ledger.shifts_on(talent_id, shift.day + offset)
+                if id(a) in self.plan
+            ]
+            for held in nearby:
+                self._unplace(held)
+                if self._fits(talent_id, shift):
+                    substitute = next(
+                        (tid for tid in self.eligibility.get(held.shift_id, [])
+                         if tid != talent_id and tid not in self.on_shift[held.shift_id] and self._fits(tid, held.shift)),
+                        None,
+                    )
+                    if substitute is not None:
+                        self._place(substitute, held.shift_id)
+                        self._place(talent_id, shift_id)
+                        self.spread.move(_hours(held.shift), talent_id, substitute)
+                        self.spread.add(_hours(shift), talent_id)
+                        return True
+                # Nobody can take it over: put the shift back
+                self._place(held.talent_id, held.shift_id)
+        return False
+
+    def _balance(self):
+        improved = True
+        while improved and not self._expired():
+            improved = False
+            # Most loaded first: their shifts are the ones worth handing out
+            for held in sorted(self.plan.values(), key=lambda a: -self.spread.ratio.get(a.talent_id, 0.0)):
+                if self._expired():
+                    return
+                hours = _hours(held.shift)
+                best, best_gain = None, self.EPSILON
+                for substitute in self.eligibility.get(held.shift_id, []):
+                    if substitute in self.on_shift[held.shift_id]:
+                        continue
+                    gain = self.spread.gain(hours, held.talent_id, substitute)
+                    if gain > best_gain and self._fits(substitute, held.shift):
+                        best, best_gain = substitute, gain
+                if best is None:
+                    continue
+
+                self._unplace(held)
+                self._place(best, held.shift_id)
+                self.spread.move(hours, held.talent_id, best)
+                improved = True
@@ -1,7 +1,9 @@
-from datetime import timedelta
+import random
+import numpy as np
 from app.core.schedule.shifts.schema import shiftSpecification
 from app.core.schedule.talents.schema import talentAvailability
 from app.core.schedule.allocator.entities import assignment
+from app.core.schedule.allocator.engine.ledger import assignmentLedger
 
 
 
@@ -14,15 +16,15 @@ class computeScore:
     - Minimum rest hours between consecutive shifts.
     """
 
-    def __init__(self, shift: shiftSpecification, availability: dict[int, talentAvailability], assignments: list[assignment], workload: dict[int, float] = None):
+    def __init__(self, shift: shiftSpecification, availability: dict[int, talentAvailability], assignments: assignmentLedger, workload: dict[int, float] = None):
         """
         Args:
             shift (shiftSpecification): 
                 The shift being evaluated.
             availability (dict[int, talentAvailability]): 
                 Mapping of talent IDs to their availability and weekly hours.
-            assignments (list[assignment]): 
-                List of existing assignments to use when checking workload and streaks.
+            assignments (assignmentLedger): 
+                Existing assignments, indexed by talent and date, used when checking workload and streaks.
             workload (dict[int, float], optional): 
                 Mapping of talent IDs to total hours already assigned in this run. 
                 If provided, avoids recalculating total hours from scratch.
@@ -50,21 +52,18 @@ class computeScore:
         if self.workload is not None:
             hours_assigned = self.workload.get(talent_id, 0.0)
         else:
-            hours_assigned = sum(
-                (a.shift.end_time - a.shift.start_time).total_seconds()/3600
-                for a in self.assignments if a.talent_id == talent_id
-            )
+            hours_assigned = self.assignments.hours_for(talent_id)
             
         remaining = weekly_hours - hours_assigned
         score += remaining
 
         
-        current_day = self.shift.start_time.date()
+        current_day = self.shift.day
         work_streak = 1
         rest_streak = 0
         for delta in range(1,7):
-            prev_day = current_day - timedelta(days=delta)
-            had_shift =  any(a.talent_id == talent_id and a.shift.start_time.date() == prev_day for a in self.assignments)
+            prev_day = current_day - delta
+            had_shift = self.assignments.works_on(talent_id, prev_day)
             if had_shift:
                 work_streak += 1
             else:
@@ -73,13 +72,10 @@ class computeScore:
         score -= (work_streak * 2)
         score += (rest_streak * 2)
 
-        yesterday = current_day - timedelta(days=1)
-        
-        yesterday_shift = next(
-            (a.shift for a in self.assignments if a.talent_id == talent_id and a.shift.start_time.date() == yesterday), 
-            None)
+        yesterday_shifts = self.assignments.shifts_on(talent_id, current_day - 1)
+        yesterday_shift = yesterday_shifts[0].shift if yesterday_shifts else None
         if yesterday_shift:
-            rest_hours = (self.shift.start_time - yesterday_shift.end_time).total_seconds()/3600
+            rest_hours = (self.shift.start_min - yesterday_shift.end_min)/60
             if rest_hours < 11:
                 score -= 5
 
@@ -104,11 +100,113 @@ class computeScore:
         top_score = scored[0][1]
         return [tid for tid, s in scored if s == top_score]
 
+class batchScore:
+    """Vectorised counterpart of computeScore that scores every candidate of a shift in one call.
+
+    Produces the same scores as computeScore with a workload mapping, but keeps the
+    inputs as NumPy arrays indexed by talent row so a whole candidate list is scored
+    with a handful of array operations:
+    - worked: talent x day matrix, True where the talent has a shift that day.
+    - assigned: hours assigned to each talent during this run.
+    - first_end: talent x day matrix holding the end of the first shift recorded
+      that day (weekClock minutes), NaN when there is none.
+    """
+
+    def __init__(self, shifts: list[shiftSpecification], availability: dict[int, talentAvailability], assignments: assignmentLedger):
+        """
+        Args:
+            shifts (list[shiftSpecification]): 
+                The shifts that will be scored; they fix the range of days tracked.
+            availability (dict[int, talentAvailability]): 
+                Mapping of talent IDs to their availability and weekly hours.
+            assignments (assignmentLedger): 
+                Assignments made before this run (history). They count towards streaks
+                and rest, but not towards the hours assigned in this run.
+        """
+        self.index = {tid: row for row, tid in enumerate(availability)}
+        self.weekly = np.array([a.weeklyhours for a in availability.values()], dtype=float)
+        self.assigned = np.zeros(len(self.index), dtype=float)
+
+        shift_days = [shift.day for shift in shifts]
+        # Six days of look-back before the earliest shift keep every streak slice in range
+        self.origin = min(shift_days) - 6 if shift_days else None
+        width = max(shift_days) - self.origin + 1 if shift_days else 0
+
+        self.worked = np.zeros((len(self.index), width), dtype=bool)
+        self.first_end = np.full((len(self.index), width), np.nan)
+
+        for a in assignments:
+            self.record(a)
+
+    def record(self, new_assignment: assignment):
+        """Mark the assignment's day as worked for its talent, without touching hours.
+
+        Args:
+            new_assignment (assignment): The assignment to record.
+        """
+        row = self.index.get(new_assignment.talent_id)
+        if row is None or self.origin is None:
+            return
+        day = new_assignment.shift.day - self.origin
+        if not 0 <= day < self.worked.shape[1]:
+            return
+        self.worked[row, day] = True
+        if np.isnan(self.first_end[row, day]):
+            self.first_end[row, day] = new_assignment.shift.end_min
+
+    def mark_assigned(self, new_assignment: assignment):
+        """Record an assignment made during this run, including its hours.
+
+        Args:
+            new_assignment (assignment): The assignment that was just made.
+        """
+        self.record(new_assignment)
+        row = self.index.get(new_assignment.talent_id)
+        if row is not None:
+            shift = new_assignment.shift
+            self.assigned[row] += (shift.end_min - shift.start_min) / 60
+
+    def score(self, shift: shiftSpecification, candidates: list[int]) -> dict[int, float]:
+        """Score all candidates for a shift.
+
+        Args:
+            shift (shiftSpecification): The shift being evaluated.
+            candidates (list[int]): Talent IDs eligible for the shift.
+
+        Returns:
+            dict[int, float]: Mapping of talent ID to score, in candidate order. Higher is better.
+        """
+        if not candidates:
+            return {}
+
+        rows = np.fromiter((self.index[tid] for tid in candidates), dtype=np.intp, count=len(candidates))
+        day = shift.day - self.origin
+
+        remaining = self.weekly[rows] - self.assigned[rows]
+
+        days_worked = self.worked[rows, day - 6:day].sum(axis=1)
+        work_streak = 1 + days_worked
+        rest_streak = 6 - days_worked
+
+        # Same order of operations as computeScore, so ties break identically
+        scores = remaining - (work_streak * 2) + (rest_streak * 2)
+
+        rest_hours = (shift.start_min - self.first_end[rows, day - 1]) / 60
+        scores = np.where(rest_hours < 11, scores - 5, scores)
+
+        return dict(zip(candidates, scores.tolist()))
+
 class roundRobinPicker:
     """Round-robin picker to fairly distribute assignments among top candidates."""
-    def __init__(self):
-        """Initialize the pointer tracker for each role."""
+    def __init__(self, seed: int = 0):
+        """Initialize the pointer tracker for each role.
+
+        Args:
+            seed (int, optional): When non-zero, tied candidates are shuffled with this
+                seed before the round-robin pick. 0 keeps the deterministic order.
+        """
         self.pointers = {}
+        self.rng = random.Random(seed) if seed else None
 
     def pickBestFit(self, role: str, candidates: list[int]) -> int | None:
         """Pick the best fit candidate for a role using round-robin.
@@ -122,6 +220,9 @@ class roundRobinPicker:
         """
         if not candidates:
             return None
+        if self.rng is not None:
+            candidates = list(candidates)
+            self.rng.shuffle(candidates)
         idx = self.pointers.get(role, 0) % len(candidates)
         chosen = candidates[idx]
 
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from datetime import timedelta, date
 from app.core.schedule.shifts.schema import shiftSpecification
 from app.core.schedule.talents.schema import talentAvailability
 from app.core.schedule.allocator.entities import assignment
+from app.core.schedule.allocator.engine.ledger import assignmentLedger
 
 class abstractValidator(ABC):
     @abstractmethod
@@ -24,14 +24,14 @@ class context():
     def contextFinder(talent_id: int,
                        shift: dict[int,shiftSpecification], 
                        availability: dict[int, talentAvailability], 
-                       assignments: list[assignment]):
+                       assignments: assignmentLedger):
         """Creates a standardized context dictionary for validators.
 
         Args:
             talent_id (int): ID of the talent being considered.
             shift (shiftSpecification): The shift to validate.
             availability (dict[int, talentAvailability]): Talent availability mapping.
-            assignments (list[assignment]): Current assignments.
+            assignments (assignmentLedger): Current assignments, indexed by talent and day index.
 
         Returns:
             dict: Context dictionary containing the above data.
@@ -61,19 +61,17 @@ class consecutiveValidator(abstractValidator):
         """
         talent_id: int = context["talent_id"]
         shift: shiftSpecification = context["shift"]
-        assignments: list[assignment] = context["assignments"]
+        assignments: assignmentLedger = context["assignments"]
 
-        def check(date, streak=1):
+        def check(day, streak=1):
             if streak >= 6:
                 return False
             
-            prev_date = date - timedelta(days=1)
-            for a in assignments:
-                if a.talent_id == talent_id and a.shift.start_time.date() == prev_date:
-                    return check(prev_date, streak + 1)
+            if assignments.works_on(talent_id, day - 1):
+                return check(day - 1, streak + 1)
             return True
         
-        return check(shift.start_time.date())
+        return check(shift.day)
 
 class restValidator(abstractValidator):
     """Validator to enforce a minimum rest period (11 hours) between shifts."""
@@ -85,16 +83,15 @@ class restValidator(abstractValidator):
             context (dict): Context containing talent_id, shift, and assignments.
 
         Returns:
-            datetime | None: End time of the previous day's shift, or None if none exists.
+            int | None: End of the previous day's shift in week minutes, or None if none exists.
         """
         talent_id: int = context["talent_id"]
         shift: shiftSpecification = context["shift"]
-        assignments: list[assignment] = context["assignments"]
+        assignments: assignmentLedger = context["assignments"]
 
-        yesterday = shift.start_time.date() - timedelta(days=1)
-        for a in assignments:
-            if a.talent_id == talent_id and a.shift.start_time.date() == yesterday:
-                return a.shift.end_time
+        previous = assignments.shifts_on(talent_id, shift.day - 1)
+        if previous:
+            return previous[0].shift.end_min
         return None
     
     def can_assign_shift(self, context: dict) -> bool:
@@ -108,7 +105,7 @@ class restValidator(abstractValidator):
         """
         shift: shiftSpecification = context["shift"]
         yesterday_end = self.get_yesterday_end_time(context)
-        if yesterday_end and (shift.start_time - yesterday_end).total_seconds() / 3600 < 11:
+        if yesterday_end is not None and (shift.start_min - yesterday_end) / 60 < 11:
             return False
         return True
 
@@ -127,7 +124,7 @@ class dailyAssignmentValidator(abstractValidator):
         """
         talent_id: int = context["talent_id"]
         shift: shiftSpecification = context["shift"]
-        self.assigned.add((talent_id, shift.start_time.date()))
+        self.assigned.add((talent_id, shift.day))
 
     def can_assign_shift(self, context: dict) -> bool:
         """Check if a talent has already been assigned to a shift on the same date.
@@ -140,7 +137,7 @@ class dailyAssignmentValidator(abstractValidator):
         """
         talent_id: int = context["talent_id"]
         shift:  shiftSpecification = context["shift"]
-        return not (talent_id, shift.start_time.date()) in self.assigned
+        return not (talent_id, shift.day) in self.assigned
 
 class maxHoursValidator(abstractValidator): 
     """
@@ -156,20 +153,55 @@ class maxHoursValidator(abstractValidator):
         talent_id: int = context["talent_id"] 
         shift: shiftSpecification = context["shift"] 
         availability: dict[int, talentAvailability] = context["availability"] 
-        assignments: list[assignment] = context["assignments"] 
-        duration = (shift.end_time - shift.start_time).total_seconds() / 3600 
-        shift_date = shift.start_time.date() 
-        start_of_week = shift_date - timedelta(days=(shift_date.weekday() + 1) % 7) 
-        end_of_week = start_of_week + timedelta(days=6) # Only sum hours for assignments within the same week 
-        existing_assignments = [ a for a in assignments if a.talent_id == talent_id and start_of_week <= a.shift.start_time.date() <= end_of_week ] 
-        total_hours = sum( (a.shift.end_time - a.shift.start_time).total_seconds() / 3600 for a in existing_assignments ) 
+        assignments: assignmentLedger = context["assignments"] 
+        duration = (shift.end_min - shift.start_min) / 60 
+        # The ledger keeps a running total per Sunday-to-Saturday week
+        total_hours = assignments.hours_in_week(talent_id, shift.day)
         
         return total_hours + duration <= availability[talent_id].weeklyhours
 
+class placementValidator(abstractValidator):
+    """
+    Validator for placing a shift out of date order, as search moves do.
 
+    The other validators only look back in time, which is enough when shifts are
+    filled day by day. This one runs them and also checks the talent's following
+    days: the next shift must still get its rest, and the streak through the new
+    day must stay within the consecutive-day limit. It needs nothing but ledger
+    probes, so a move is checked without re-validating the rest of the plan.
+    """
 
+    def __init__(self):
+        self.backward = [maxHoursValidator(), restValidator(), consecutiveValidator()]
 
+    def can_assign_shift(self, context: dict) -> bool:
+        """Check the placement against every rule, in both directions of time.
 
+        Args:
+            context (dict): Context containing talent_id, shift, availability, and assignments.
 
+        Returns:
+            bool: True if the talent can take the shift without breaking a rule for
+            this shift or for any shift they already hold, False otherwise.
+        """
+        talent_id: int = context["talent_id"]
+        shift: shiftSpecification = context["shift"]
+        assignments: assignmentLedger = context["assignments"]
+
+        if assignments.works_on(talent_id, shift.day):
+            return False
+        if not all(validator.can_assign_shift(context) for validator in self.backward):
+            return False
 
+        tomorrow = assignments.shifts_on(talent_id, shift.day + 1)
+        if tomorrow and (tomorrow[0].shift.start_min - shift.end_min) / 60 < 11:
+            return False
 
+        # The last day of the joined streak sees every day before it, the new one included
+        streak = 0
+        for step in (-1, 1):
+            day = shift.day + step
+            while assignments.works_on(talent_id, day):
+                streak += 1
+                day += step
+        return streak < 5
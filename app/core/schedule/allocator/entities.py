@@ -1,21 +1,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
-import enum
 import pandas as pd
-from app.core.utils.enums import Role
+# One shared definition; re-exported here for the allocator's imports
+from app.core.schedule.shifts.schema import shiftSpecification
 
 
-@dataclass
-class shiftSpecification:
-    start_time: datetime
-    end_time: datetime
-    shift_name: str
-    role_name: Role
-    role_count: int
-
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class assignment:
     talent_id : int
     shift_id: int
@@ -53,7 +44,7 @@ class weekRange:
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class underStaffedShifts:
     shift_id: int
     shift_name: str
@@ -65,4 +56,10 @@ class underStaffedShifts:
     missing: int
 
 
-
+@dataclass
+class solverReport:
+    solver: str
+    wall_time_ms: float
+    assigned: int
+    unfilled_slots: int
+    seed: int = 0
@@ -0,0 +1,82 @@
+"""
+Process pools whose workers can be told to stop.
+
+A threading.Event doesn't reach worker processes, so each pool made here shares a
+multiprocessing Event with its workers. Builders running in a worker check it
+through `stop_requested()` at the same checkpoints as their cancel_event, so
+work the parent no longer wants ends within one shift (or one flow round)
+instead of running to completion in the background.
+"""
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Iterable
+
+
+_NOTHING = object()
+
+_stop_event = None  # the pool's shared Event, inside a worker process
+_shared = _NOTHING  # the pool's `shared` argument, inside a worker process
+
+
+def _init_worker(stop_event, shared):
+    global _stop_event, _shared
+    _stop_event = stop_event
+    _shared = shared
+
+
+def _call(fn: Callable[..., Any], args: tuple):
+    # Jobs still queued when the pool is told to stop end without starting
+    if stop_requested():
+        return None
+    return fn(*args) if _shared is _NOTHING else fn(_shared, *args)
+
+
+def stop_requested() -> bool:
+    """True in a worker process whose pool has been told to stop; always False in the parent."""
+    return _stop_event is not None and _stop_event.is_set()
+
+
+def run_stoppable(fn: Callable[..., Any], jobs: Iterable[tuple], workers: int,
+                  shared: Any = _NOTHING,
+                  check: Callable[[], None] | None = None,
+                  deadline: float | None = None,
+                  poll_seconds: float = 0.05) -> list:
+    """Run `fn(*args)` for every args tuple in `jobs` on a new process pool.
+
+    Args:
+        shared (Any, optional): Passed as the first argument of every call. It goes
+            to each worker once, when the worker starts, rather than with every job.
+        check (Callable, optional): Called every `poll_seconds` while waiting; if it
+            raises (e.g. GenerationCancelled), the workers are stopped and the
+            exception propagates.
+        deadline (float, optional): time.perf_counter() value after which unfinished
+            jobs are stopped and left out of the results.
+
+    Returns:
+        list: Results of the jobs that finished, in submission order.
+
+    The workers are always stopped and joined before this returns, so no process
+    outlives the call.
+    """
+    context = multiprocessing.get_context()
+    stop_event = context.Event()
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_worker, initargs=(stop_event, shared))
+    try:
+        futures = [pool.submit(_call, fn, args) for args in jobs]
+        pending = set(futures)
+        while pending:
+            if check is not None:
+                check()
+            timeout = poll_seconds
+            if deadline is not None:
+                left = deadline - time.perf_counter()
+                if left <= 0:
+                    break
+                timeout = min(timeout, left)
+            _, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        return [future.result() for future in futures if future.done() and future not in pending]
+    finally:
+        stop_event.set()
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -1,109 +1,270 @@
+import time
+import random
+import threading
+from collections import defaultdict
+from typing import Callable
 from app.core.schedule.shifts.schema import shiftSpecification
 from app.core.schedule.talents.schema import talentAvailability
-from app.core.schedule.allocator.entities import assignment, underStaffedShifts
-from app.core.schedule.allocator.engine.generators import TalentGenerator
+from app.core.schedule.allocator.entities import assignment, underStaffedShifts, solverReport
+from app.core.schedule.allocator.engine.generators import EligibilityMatrix
 from app.core.schedule.allocator.engine.validators import maxHoursValidator, consecutiveValidator, restValidator, dailyAssignmentValidator, context, abstractValidator
-from app.core.schedule.allocator.engine.scheduler_scoring import computeScore, roundRobinPicker
+from app.core.schedule.allocator.engine.scheduler_scoring import batchScore, roundRobinPicker
+from app.core.schedule.allocator.engine.ledger import assignmentLedger
+from app.core.schedule.allocator.engine.clock import weekClock
+from app.core.schedule.allocator.engine.local_search import localSearch
+from app.core.schedule.allocator.solvers import SOLVERS
+from app.core.schedule.allocator.pool import run_stoppable, stop_requested
+from app.core.utils.enums import Solver
 
 
 
 class TalentAvailabilityService:
     def __init__(self, talent_availability: dict[int, talentAvailability], 
                  assignable_shifts: dict[int, shiftSpecification], 
-                 talents_to_assign):
+                 talents_to_assign,
+                 clock: weekClock):
         
         self.availability = talent_availability
         self.assignable_shifts = assignable_shifts  
         self.talents_to_assign = talents_to_assign 
-
-    def define_talent_availability_window(self):
-        """
-        Returns:
-            dict[(talent_id, date), list[(start_dt, end_dt)]]
-        """
-        return {
-            (tid, date): spans
-            for tid, avail in self.availability.items()
-            for date, spans in avail.window.items()
-        }
-
-    def define_talent_types(self):
-        return {
-            "constrained": [t.talent_id for t in self.availability.values() if t.constraint],
-            "unconstrained": [t.talent_id for t in self.availability.values() if not t.constraint],
-        }
+        self.clock = clock
 
     def generate_eligible_talents(self):
         """
         Returns:
-            dict[str, list[int]]
-            shift_instance_id → [talent_ids]
+            dict[int, list[int]]
+            shift_instance_id → [talent_ids], constrained talents first
         """
-        talent_types = self.define_talent_types()
-        window = self.define_talent_availability_window()
+        matrix = EligibilityMatrix(self.assignable_shifts, self.talents_to_assign, self.availability, self.clock)
+        return matrix.eligible_talents()
 
-        eligibility = {}
 
-        for shift_instance_id, shift in self.assignable_shifts.items():
-            gen = TalentGenerator(shift, self.talents_to_assign, window)
-            candidates = list(gen.find_eligible_talents())
 
-            prioritized = (
-                [t for t in candidates if t in talent_types["constrained"]] +
-                [t for t in candidates if t in talent_types["unconstrained"]]
-            )
+class GenerationCancelled(Exception):
+    """Raised inside ScheduleBuilder when its cancel_event is set."""
 
-            eligibility[shift_instance_id] = prioritized
-
-        return eligibility
 
+def _allocate_partition(builder: "ScheduleBuilder") -> tuple[list[assignment], dict[int, int]]:
+    """Process-pool entry point: solve one role partition in the worker process."""
+    plan = builder.solve()
+    return plan, builder.scarcity
 
 
 class ScheduleBuilder:
     def __init__(self, availability: dict[int, talentAvailability], 
                  assignable_shifts: dict[int, shiftSpecification],
                 talents_to_assign, 
-                history: list[assignment]= None):
+                history: list[assignment]= None,
+                workers: int = 1,
+                solver: str = Solver.GREEDY.value,
+                budget_ms: int | None = None,
+                restart_seed: int = 0,
+                restarts: int = 8,
+                deadline_ms: int = 2000,
+                clock: weekClock | None = None,
+                cancel_event: threading.Event | None = None,
+                on_stage: Callable[[str], None] | None = None):
+        # Shifts and history are stamped with integer time once, here; the engine
+        # never touches their datetimes again
+        self.clock = clock or weekClock.covering(assignable_shifts.values())
         self.availability = availability     # dict[int, talentAvailability]
-        self.assignable_shifts = assignable_shifts  # dict[str, shiftSpecification]
+        self.assignable_shifts = {sid: self.clock.stamp(shift) for sid, shift in assignable_shifts.items()}  # dict[int, shiftSpecification]
         self.talents_to_assign = talents_to_assign
-        self.history = history or  []
+        self.history = [self.clock.stamp_assignment(a) for a in history or []]
+        self.workers = workers
+        self.solver = solver
+        self.budget_ms = budget_ms  # local-search budget; None skips the pass
+        self.restart_seed = restart_seed  # 0 is the deterministic order; others perturb it
+        self.restarts = restarts  # portfolio size, including seed 0
+        self.deadline_ms = deadline_ms  # portfolio wall-clock limit
+        self.eligibility: dict[int, list[int]] | None = None
+        self.scarcity: dict[int, int] = {}  # shift_instance_id → number of eligible talents
+        self.report: solverReport | None = None
+        self.cancel_event = cancel_event  # set from another thread to stop at the next checkpoint
+        self.on_stage = on_stage  # called with "eligibility", "solving", "improving" as they start
+
+    def __getstate__(self):
+        # Worker processes get neither; the parent polls the event while they run
+        # and stops them through their pool's shared Event (see allocator/pool.py)
+        state = self.__dict__.copy()
+        state["cancel_event"] = None
+        state["on_stage"] = None
+        return state
+
+    def check_cancelled(self):
+        """Raise GenerationCancelled if cancellation was requested, or, in a worker
+        process, if the pool running this builder has been told to stop."""
+        if (self.cancel_event is not None and self.cancel_event.is_set()) or stop_requested():
+            raise GenerationCancelled()
+
+    def enter_stage(self, stage: str):
+        self.check_cancelled()
+        if self.on_stage is not None:
+            self.on_stage(stage)
 
     def generate_schedule(self):
+        """Build the week's plan with the selected solver backend.
+
+        With workers > 1 every role is solved in its own process and the plans are
+        merged; otherwise the solver runs serially. Both paths return the same plan.
+        The portfolio solver is never split by role, since it already spreads its
+        restarts across the workers, and neither is a run with a restart seed: its
+        shuffles come from one RNG stream over the whole week, which the split would
+        break into one per role, so replaying a portfolio winner must run serially.
+        With a budget_ms, a local-search pass then improves the plan for at most that
+        long. The wall time and unfilled slot count are left in `self.report`.
+
+        Raises:
+            GenerationCancelled: `cancel_event` was set; checked between stages and
+                between shifts of every greedy run. Runs in worker processes are
+                stopped by the pool at their next shift.
+        """
+        started = time.perf_counter()
+
+        split = self.workers > 1 and self.solver != Solver.PORTFOLIO.value and self.restart_seed == 0
+        partitions = self.partition_by_role() if split else []
+        if len(partitions) > 1:
+            # Each partition computes its own eligibility in its worker
+            self.enter_stage("solving")
+            plan = self._generate_parallel(partitions)
+        else:
+            self.enter_stage("eligibility")
+            self.find_eligible()
+            self.enter_stage("solving")
+            plan = self.solve()
+
+        if self.budget_ms:
+            self.enter_stage("improving")
+            search = localSearch(self.availability, self.assignable_shifts, self.find_eligible(), self.history, self.budget_ms)
+            plan = search.improve(plan)
+
+        understaffed = UnderstaffedShifts(conn=None, assignable_shifts=self.assignable_shifts, assigned_shifts=plan)
+        self.report = solverReport(
+            solver=self.solver,
+            wall_time_ms=round((time.perf_counter() - started) * 1000, 1),
+            assigned=len(plan),
+            unfilled_slots=sum(u.missing for u in understaffed.get_all()),
+            seed=self.restart_seed,
+        )
+        return plan
+
+    def solve(self) -> list[assignment]:
+        """Run the selected solver backend in the current process."""
+        if self.solver not in SOLVERS:
+            raise ValueError(f"Unknown solver: {self.solver}")
+        return SOLVERS[self.solver]().solve(self)
+
+    def find_eligible(self) -> dict[int, list[int]]:
+        """Eligible talents per shift (constrained first), computed once per builder."""
+        if self.eligibility is None:
+            availability_service = TalentAvailabilityService(
+                self.availability, self.assignable_shifts, self.talents_to_assign, self.clock
+            )
+            self.eligibility = availability_service.generate_eligible_talents()
+            self.scarcity = {sid: len(self.eligibility.get(sid, [])) for sid in self.assignable_shifts}
+        return self.eligibility
+
+    def partition_by_role(self) -> list["ScheduleBuilder"]:
+        """Split the problem into one independent builder per role.
+
+        A talent has exactly one role and only fills shifts of that role, so no rule
+        (hours, rest, streaks, one shift a day) links talents of different roles.
+        Each partition carries its role's talents, shifts and history.
+        """
+        role_of = {
+            talent_id: role
+            for role, talents in self.talents_to_assign.items()
+            for talent_id, _, _ in talents
+        }
+
+        partitions = []
+        for role, talents in self.talents_to_assign.items():
+            if not talents:
+                continue
+            partitions.append(ScheduleBuilder(
+                availability={tid: self.availability[tid] for tid, _, _ in talents if tid in self.availability},
+                assignable_shifts={
+                    sid: shift for sid, shift in self.assignable_shifts.items()
+                    if shift.role_name == role
+                },
+                talents_to_assign={role: talents},
+                history=[a for a in self.history if role_of.get(a.talent_id) == role],
+                solver=self.solver,
+                restart_seed=self.restart_seed,
+                clock=self.clock,
+            ))
+        return partitions
+
+    def _generate_parallel(self, partitions: list["ScheduleBuilder"]) -> list[assignment]:
+        results = run_stoppable(_allocate_partition, [(partition,) for partition in partitions],
+                                min(self.workers, len(partitions)), check=self.check_cancelled)
+
         plan = []
-        working_assignments = list(self.history)
+        for partition_plan, partition_scarcity in results:
+            plan.extend(partition_plan)
+            self.scarcity.update(partition_scarcity)
+
+        # Interleave the partitions back into the order the serial loop visits shifts
+        # (scarcity, then original position); sorted() is stable within a shift
+        position = {sid: i for i, sid in enumerate(self.assignable_shifts)}
+        plan.sort(key=lambda a: (self.scarcity.get(a.shift_id, 0), position[a.shift_id]))
+        return plan
 
-        availability_service = TalentAvailabilityService(
-            self.availability, self.assignable_shifts, self.talents_to_assign
-        )
-        eligibility = availability_service.generate_eligible_talents()
+    def allocate(self, seed: list[assignment] = None) -> list[assignment]:
+        """Run the greedy allocator over every shift in this builder, in the current process.
+
+        Args:
+            seed (list[assignment], optional): Assignments proposed by another solver. They
+                are validated in date order and kept when they pass; the greedy pass then
+                fills the remaining places.
+        """
+        plan = []
+        # History is indexed once; every rule lookup below is then a ledger probe
+        working_assignments = assignmentLedger(self.history)
+
+        eligibility = self.find_eligible()
         
-        # Sort shifts by scarcity: those with fewer eligible candidates first
+        # Sort shifts by scarcity: those with fewer eligible candidates first.
+        # A restart seed shuffles shifts of equal scarcity; seed 0 keeps their order
+        rng = random.Random(self.restart_seed) if self.restart_seed else None
         sorted_shifts = sorted(
             self.assignable_shifts.items(),
-            key=lambda x: len(eligibility.get(x[0], []))
+            key=lambda x: (self.scarcity[x[0]], rng.random() if rng else 0)
         )
 
         validators = [maxHoursValidator(), consecutiveValidator(), restValidator(), dailyAssignmentValidator()]
         
         # Instantiate Round Robin picker once to maintain state across shifts
-        round_robin = roundRobinPicker()
+        round_robin = roundRobinPicker(seed=self.restart_seed)
+
+        # Scoring state (days worked, hours assigned, last shift ends) lives in arrays
+        # that are updated per assignment, so each shift is scored in a single call
+        scorer = batchScore(
+                shifts=list(self.assignable_shifts.values()),
+                availability=self.availability,
+                assignments=working_assignments,
+            )
+
+        placed = defaultdict(set)  # shift_instance_id → talents already on it
 
-        # Track assigned hours per talent for efficient scoring
-        workload = {tid: 0.0 for tid in self.availability.keys()}
+        for proposed in sorted(seed or [], key=lambda a: a.shift.start_min):
+            ctx = context.contextFinder(proposed.talent_id, proposed.shift, self.availability, working_assignments)
+            if all(validator.can_assign_shift(ctx) for validator in validators):
+                plan.append(proposed)
+                working_assignments.add(proposed)
+                scorer.mark_assigned(proposed)
+                for validator in validators:
+                    if hasattr(validator, "mark_assigned"):
+                        validator.mark_assigned(ctx)
+                placed[proposed.shift_id].add(proposed.talent_id)
 
         for shift_instance_id, shift in sorted_shifts:
-            candidates = eligibility.get(shift_instance_id, [])
-            num_assigned = 0
+            self.check_cancelled()
+            candidates = [tid for tid in eligibility.get(shift_instance_id, []) if tid not in placed[shift_instance_id]]
+            num_assigned = len(placed[shift_instance_id])
 
             #Build scores hashmap once per shift
-            scorer = computeScore(
-                    shift=shift,
-                    availability=self.availability,
-                    assignments=working_assignments,
-                    workload=workload
-                )
-            scores = {tid: scorer.calculate_score(tid) for tid in candidates}
+            scores = scorer.score(shift, candidates)
 
             while num_assigned < shift.role_count and scores:
                 #Get top scorers and pick via round-robin
@@ -137,10 +298,9 @@ class ScheduleBuilder:
                     )
 
                     plan.append(new_assignment)
-                    working_assignments.append(new_assignment)
+                    working_assignments.add(new_assignment)
 
-                    shift_hours = (shift.end_time - shift.start_time).total_seconds() / 3600
-                    workload[best_fit] += shift_hours
+                    scorer.mark_assigned(new_assignment)
 
                     for validator in validators:
                         if hasattr(validator, "mark_assigned"):
@@ -156,7 +316,7 @@ class ScheduleBuilder:
 
 
 class UnderstaffedShifts:
-    def __init__(self, conn, assignable_shifts: dict[str, shiftSpecification], assigned_shifts: list[assignment]):
+    def __init__(self, conn, assignable_shifts: dict[int, shiftSpecification], assigned_shifts: list[assignment]):
         self.conn = conn
         self.assignable_shifts = assignable_shifts
         self.assigned_shifts = assigned_shifts
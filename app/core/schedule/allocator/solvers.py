@@ -0,0 +1,220 @@
+import copy
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from math import floor
+from typing import TYPE_CHECKING
+from app.core.schedule.allocator.entities import assignment
+from app.core.schedule.allocator.pool import run_stoppable
+from app.core.schedule.allocator.engine.flow import minCostFlow
+from app.core.schedule.allocator.engine.ledger import assignmentLedger
+from app.core.schedule.allocator.engine.scheduler_scoring import batchScore
+from app.core.schedule.allocator.engine.validators import placementValidator, context
+from app.core.schedule.allocator.engine.local_search import workloadSpread
+from app.core.utils.enums import Solver
+
+if TYPE_CHECKING:
+    from app.core.schedule.allocator.service import ScheduleBuilder
+
+
+class abstractSolver(ABC):
+    @abstractmethod
+    def solve(self, builder: "ScheduleBuilder") -> list[assignment]:
+        """Assign talents to the builder's shifts.
+
+        Args:
+            builder (ScheduleBuilder): Holds the availability, shifts, role groups and history to solve for.
+
+        Returns:
+            list[assignment]: The plan.
+        """
+        raise NotImplementedError
+
+
+class greedySolver(abstractSolver):
+    """Scarcest shift first, best score first, round-robin on ties."""
+
+    def solve(self, builder: "ScheduleBuilder") -> list[assignment]:
+        return builder.allocate()
+
+
+class flowSolver(abstractSolver):
+    """Models the week as a min-cost flow problem and lets the greedy pass finish it.
+
+    Network: source → talent → (talent, week) → (talent, day) → shift → sink.
+    - talent → (talent, week): how many of its shortest eligible shifts still fit in the week's hours.
+    - (talent, week) → (talent, day): capacity 1, at most one shift a day.
+    - (talent, day) → shift: capacity 1, costing the gap to the best computeScore score.
+    - shift → sink: the places still open on the shift.
+
+    The maximum flow fills as many places as the capacities allow, and among those
+    fillings the cheapest favours high scores. Rest, consecutive-day and exact hour
+    rules are not in the network, so each round's flow is checked in date order and
+    only passing assignments are kept; the next round re-solves around them. The
+    greedy pass then fills whatever the rounds left open.
+
+    Because those rules sit outside the network, a tightly constrained week can still
+    come out behind a plain greedy run; the greedy plan is returned in that case.
+    """
+
+    # Scores carry fractional hours; scale them so flow costs are integers
+    COST_SCALE = 100
+    MAX_ROUNDS = 5
+
+    def __init__(self):
+        # Rounds place shifts out of date order, so checks must look forward as well as back
+        self.placement = placementValidator()
+
+    def solve(self, builder: "ScheduleBuilder") -> list[assignment]:
+        eligibility = builder.find_eligible()
+        shifts = builder.assignable_shifts
+
+        ledger = assignmentLedger(builder.history)
+        scorer = batchScore(
+            shifts=list(shifts.values()),
+            availability=builder.availability,
+            assignments=ledger,
+        )
+        open_places = {sid: shift.role_count for sid, shift in shifts.items()}
+        kept: list[assignment] = []
+
+        for _ in range(self.MAX_ROUNDS):
+            builder.check_cancelled()
+            proposed = self._solve_round(builder, eligibility, ledger, scorer, open_places)
+
+            accepted = 0
+            for candidate in sorted(proposed, key=lambda a: a.shift.start_min):
+                if self._fits(builder, ledger, candidate.talent_id, candidate.shift):
+                    ledger.add(candidate)
+                    scorer.mark_assigned(candidate)
+                    open_places[candidate.shift_id] -= 1
+                    kept.append(candidate)
+                    accepted += 1
+
+            # Everything accepted means the flow was already maximal around what is kept
+            if not accepted or accepted == len(proposed):
+                break
+
+        plan = builder.allocate(seed=kept)
+        greedy = builder.allocate()
+        return plan if len(plan) >= len(greedy) else greedy
+
+    def _solve_round(self, builder: "ScheduleBuilder", eligibility: dict[int, list[int]], ledger: assignmentLedger,
+                     scorer: batchScore, open_places: dict[int, int]) -> list[assignment]:
+        shifts = builder.assignable_shifts
+        candidates = {
+            sid: [tid for tid in eligibility.get(sid, []) if self._fits(builder, ledger, tid, shifts[sid])]
+            for sid, places in open_places.items() if places > 0
+        }
+        scores = {sid: scorer.score(shifts[sid], talents) for sid, talents in candidates.items()}
+        best = max((score for shift_scores in scores.values() for score in shift_scores.values()), default=None)
+        if best is None:
+            return []
+
+        graph = minCostFlow()
+        source, sink = graph.add_node(), graph.add_node()
+        talent_nodes: dict[int, int] = {}
+        week_nodes: dict[tuple, int] = {}
+        day_nodes: dict[tuple, int] = {}
+        shortest: dict[tuple, float] = {}
+        arcs = []
+
+        for sid, shift_scores in scores.items():
+            shift = shifts[sid]
+            shift_node = graph.add_node()
+            graph.add_edge(shift_node, sink, open_places[sid], 0)
+            hours = (shift.end_min - shift.start_min) / 60
+            day = shift.day
+            week = assignmentLedger.week_of(day)
+
+            for talent_id, score in shift_scores.items():
+                if talent_id not in talent_nodes:
+                    talent_nodes[talent_id] = graph.add_node()
+                    graph.add_edge(source, talent_nodes[talent_id], len(shifts), 0)
+                if (talent_id, week) not in week_nodes:
+                    week_nodes[(talent_id, week)] = graph.add_node()
+                shortest[(talent_id, week)] = min(shortest.get((talent_id, week), hours), hours)
+
+                if (talent_id, day) not in day_nodes:
+                    day_nodes[(talent_id, day)] = graph.add_node()
+                    graph.add_edge(week_nodes[(talent_id, week)], day_nodes[(talent_id, day)], 1, 0)
+
+                cost = round((best - score) * self.COST_SCALE)
+                arcs.append((talent_id, sid, graph.add_edge(day_nodes[(talent_id, day)], shift_node, 1, cost)))
+
+        for (talent_id, week), node in week_nodes.items():
+            left = builder.availability[talent_id].weeklyhours - ledger.hours_in_week(talent_id, week)
+            fits = floor(left / shortest[(talent_id, week)]) if shortest[(talent_id, week)] > 0 else 0
+            graph.add_edge(talent_nodes[talent_id], node, max(fits, 0), 0)
+
+        graph.solve(source, sink)
+
+        return [
+            assignment(talent_id=talent_id, shift_id=sid, shift=shifts[sid])
+            for talent_id, sid, edge in arcs
+            if graph.flow(edge)
+        ]
+
+    def _fits(self, builder: "ScheduleBuilder", ledger: assignmentLedger, talent_id: int, shift) -> bool:
+        ctx = context.contextFinder(talent_id, shift, builder.availability, ledger)
+        return self.placement.can_assign_shift(ctx)
+
+
+def _run_restart(builder: "ScheduleBuilder", seed: int) -> tuple[int, list[assignment]]:
+    """Process-pool entry point: one perturbed greedy run."""
+    builder.restart_seed = seed
+    return seed, builder.allocate()
+
+
+class portfolioSolver(abstractSolver):
+    """Runs the greedy allocator under several seeds and keeps the best plan.
+
+    Seed 0 is the deterministic greedy order and always runs, in this process, so
+    the portfolio is never worse than plain greedy. Seeds 1..restarts-1 shuffle
+    equal-scarcity shifts and tied candidates and run across builder.workers
+    processes until builder.deadline_ms expires; restarts still running at the
+    deadline, or when the job is cancelled, are stopped at their next shift and
+    dropped. The plan with the fewest missing places wins, then the one with the
+    lowest workload spread, then the lowest seed. The winning seed is written back
+    to builder.restart_seed so the plan can be reproduced with greedy.
+    """
+
+    def solve(self, builder: "ScheduleBuilder") -> list[assignment]:
+        deadline = time.perf_counter() + builder.deadline_ms / 1000
+        # Computed once here so every worker receives the eligibility with the builder
+        builder.find_eligible()
+
+        runner = copy.copy(builder)
+        # copy drops the event with the rest of the unpicklable state; this process still needs it
+        runner.cancel_event = builder.cancel_event
+        results = [_run_restart(runner, 0)]
+        seeds = range(1, builder.restarts)
+
+        if builder.workers > 1:
+            results.extend(self._run_pool(runner, seeds, deadline, builder.workers))
+        else:
+            for seed in seeds:
+                if time.perf_counter() >= deadline:
+                    break
+                results.append(_run_restart(runner, seed))
+
+        seed, plan = min(results, key=lambda result: self._rank(builder, *result))
+        builder.restart_seed = seed
+        return plan
+
+    def _run_pool(self, runner: "ScheduleBuilder", seeds, deadline: float, workers: int) -> list[tuple[int, list[assignment]]]:
+        return run_stoppable(_run_restart, [(seed,) for seed in seeds], workers, shared=runner,
+                             check=runner.check_cancelled, deadline=deadline)
+
+    def _rank(self, builder: "ScheduleBuilder", seed: int, plan: list[assignment]) -> tuple[int, float, int]:
+        filled = Counter(a.shift_id for a in plan)
+        missing = sum(max(shift.role_count - filled[sid], 0) for sid, shift in builder.assignable_shifts.items())
+        spread = workloadSpread(builder.availability, plan).variance()
+        return missing, round(spread, 9), seed
+
+
+SOLVERS: dict[str, type[abstractSolver]] = {
+    Solver.GREEDY.value: greedySolver,
+    Solver.FLOW.value: flowSolver,
+    Solver.PORTFOLIO.value: portfolioSolver,
+}
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from typing import Optional
+
+
+def shift_hours(date_of: date, start_time: time, end_time: time) -> float:
+    return (datetime.combine(date_of, end_time) - datetime.combine(date_of, start_time)).total_seconds() / 3600
+
+
+@dataclass(slots=True)
+class DraftAssignment:
+    talent_id: int
+    date_of: date
+    start_time: time
+    end_time: time
+    shift_name: Optional[str]
+    shift_hours: float
+    tal_role: Optional[str] = None
+    slot: Optional[str] = None  # preview slot key; None for assignments added by hand
+
+    def as_preview(self, assignment_id: str) -> dict:
+        """The assignment in the preview shape DraftScheduleGrid expects."""
+        return {
+            "id":         assignment_id,
+            "slot":       self.slot,
+            "talent_id":  self.talent_id,
+            "tal_role":   self.tal_role,
+            "shift_name": self.shift_name,
+            "date_of":    str(self.date_of),
+            "start_time": str(self.start_time),
+            "end_time":   str(self.end_time),
+        }
+
+
+@dataclass
+class ScheduleDraft:
+    """A generated preview held on the server while the manager edits it.
+
+    `version` goes up with every edit so clients can detect concurrent changes.
+    `understaffed` is the list as generated; edits don't recompute it.
+    """
+    draft_id: str
+    owner_id: int
+    week_start: date
+    week_end: date
+    assignments: dict[str, DraftAssignment]
+    understaffed: list[dict] = field(default_factory=list)
+    version: int = 0
+    next_id: int = 0  # suffix of the next "draft-<n>" assignment ID
@@ -0,0 +1,146 @@
+import uuid
+from datetime import date, time
+from fastapi import HTTPException, status
+from app.config.config import Settings
+from app.core.schedule.schema import DraftEdit
+from app.core.schedule.drafts.schema import DraftAssignment, ScheduleDraft, shift_hours
+from app.core.utils.cache import TTLCache
+
+
+settings = Settings()
+
+
+class DraftStore:
+    """
+    Server-side copies of generated previews, edited with small deltas.
+
+    A draft lives until it is committed or discarded, or until it has gone
+    `ttl_seconds` without an edit. Drafts belong to the user who generated them;
+    anyone else gets a 404.
+    """
+
+    def __init__(self, max_drafts: int = 256, ttl_seconds: float = 3600):
+        self.drafts: TTLCache[ScheduleDraft] = TTLCache(max_entries=max_drafts, ttl_seconds=ttl_seconds)
+
+    def create(self, preview: dict, owner_id: int) -> ScheduleDraft:
+        """Store a preview from build_preview as a new draft.
+
+        The preview's own assignment IDs ("preview-<i>") are kept.
+        """
+        draft = ScheduleDraft(
+            draft_id=uuid.uuid4().hex,
+            owner_id=owner_id,
+            week_start=date.fromisoformat(preview["week_start"]),
+            week_end=date.fromisoformat(preview["week_end"]),
+            assignments={},
+            understaffed=preview["understaffed"],
+        )
+        for entry in preview["assignments"]:
+            date_of = date.fromisoformat(entry["date_of"])
+            start_time = time.fromisoformat(entry["start_time"])
+            end_time = time.fromisoformat(entry["end_time"])
+            draft.assignments[entry["id"]] = DraftAssignment(
+                talent_id=entry["talent_id"],
+                date_of=date_of,
+                start_time=start_time,
+                end_time=end_time,
+                shift_name=entry["shift_name"],
+                shift_hours=shift_hours(date_of, start_time, end_time),
+                tal_role=entry["tal_role"],
+                slot=entry["slot"],
+            )
+        self.drafts.set(draft.draft_id, draft)
+        return draft
+
+    def get(self, draft_id: str, owner_id: int) -> ScheduleDraft:
+        """
+        Raises:
+            HTTPException: 404 if the draft is unknown, expired or someone else's.
+        """
+        draft = self.drafts.get(draft_id)
+        if draft is None or draft.owner_id != owner_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Draft not found or expired")
+        return draft
+
+    def apply(self, draft_id: str, owner_id: int, edit: DraftEdit) -> tuple[ScheduleDraft, list[str]]:
+        """Apply an edit: removals, then updates, then additions.
+
+        The edit is checked in full before anything changes, so a bad entry leaves
+        the draft as it was.
+
+        Returns:
+            tuple[ScheduleDraft, list[str]]: The draft, and the IDs given to the added assignments.
+
+        Raises:
+            HTTPException: 404 for an unknown draft or assignment ID, 409 on a version
+                mismatch, 400 for an added date outside the draft's week.
+        """
+        draft = self.get(draft_id, owner_id)
+        if edit.version is not None and edit.version != draft.version:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Draft is at version {draft.version}, not {edit.version}. Reload it and try again.",
+            )
+
+        remaining = set(draft.assignments) - set(edit.remove)
+        missing = [aid for aid in edit.remove if aid not in draft.assignments]
+        missing += [change.id for change in edit.update if change.id not in remaining]
+        if missing:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Assignments not in draft: {missing}")
+        for entry in edit.add:
+            if not draft.week_start <= entry.date_of <= draft.week_end:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"{entry.date_of} is outside the draft's week ({draft.week_start} to {draft.week_end}).",
+                )
+
+        for assignment_id in dict.fromkeys(edit.remove):
+            del draft.assignments[assignment_id]
+
+        for change in edit.update:
+            current = draft.assignments[change.id]
+            if change.talent_id is not None:
+                current.talent_id = change.talent_id
+            if change.start_time is not None:
+                current.start_time = change.start_time
+            if change.end_time is not None:
+                current.end_time = change.end_time
+            if change.shift_name is not None:
+                current.shift_name = change.shift_name
+            current.shift_hours = shift_hours(current.date_of, current.start_time, current.end_time)
+
+        added = []
+        for entry in edit.add:
+            assignment_id = f"draft-{draft.next_id}"
+            draft.next_id += 1
+            draft.assignments[assignment_id] = DraftAssignment(
+                talent_id=entry.talent_id,
+                date_of=entry.date_of,
+                start_time=entry.start_time,
+                end_time=entry.end_time,
+                shift_name=entry.shift_name,
+                shift_hours=shift_hours(entry.date_of, entry.start_time, entry.end_time),
+            )
+            added.append(assignment_id)
+
+        draft.version += 1
+        # Re-setting restarts the TTL, so a draft being worked on doesn't expire
+        self.drafts.set(draft.draft_id, draft)
+        return draft, added
+
+    def discard(self, draft_id: str):
+        self.drafts.invalidate(draft_id)
+
+    def as_preview(self, draft: ScheduleDraft) -> dict:
+        """The draft in the same shape as POST /generate, plus its ID and version."""
+        return {
+            "draft_id":   draft.draft_id,
+            "version":    draft.version,
+            "week_start": str(draft.week_start),
+            "week_end":   str(draft.week_end),
+            "assignments": [entry.as_preview(aid) for aid, entry in draft.assignments.items()],
+            "understaffed": draft.understaffed,
+        }
+
+
+schedule_drafts = DraftStore(max_drafts=settings.SCHEDULE_DRAFT_LIMIT, ttl_seconds=settings.SCHEDULE_DRAFT_TTL)
@@ -0,0 +1,34 @@
+from app.config.config import Settings
+from app.core.utils.executor import BoundedExecutor
+
+
+settings = Settings()
+
+
+class GenerationExecutor(BoundedExecutor):
+    """
+    Bounded pool for CPU-bound schedule generation.
+
+    At most `max_concurrency` solves run at once, on dedicated threads rather than
+    the event loop or FastAPI's shared threadpool. Up to `max_queue` more wait for a
+    free thread; beyond that new requests are refused with 503 and a Retry-After
+    header instead of piling up.
+
+    Threads, not processes: ScheduleBuilder already fans out to its own process pool
+    when SCHEDULER_WORKERS > 1, and its inputs would otherwise be pickled twice.
+    """
+
+    def __init__(self, max_concurrency: int = 2, max_queue: int = 8, retry_after_seconds: int = 5):
+        super().__init__(
+            name="schedule-generation",
+            max_concurrency=max_concurrency,
+            max_queue=max_queue,
+            retry_after_seconds=retry_after_seconds,
+            busy_detail="The scheduler is busy generating other schedules. Please try again shortly.",
+        )
+
+
+generation_executor = GenerationExecutor(
+    max_concurrency=settings.GENERATION_CONCURRENCY,
+    max_queue=settings.GENERATION_QUEUE_SIZE,
+)
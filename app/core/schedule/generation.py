@@ -0,0 +1,207 @@
+"""
+Schedule preview generation, shared by POST /generate and the background job worker.
+"""
+
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Callable
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.config import Settings
+from app.core.schedule.schema import inputDate
+from app.core.schedule.shifts.service import ShiftSlotBuilder
+from app.core.schedule.shifts.schema import shiftSpecification
+from app.core.schedule.talents.repo import AsyncTalentRepository
+from app.core.schedule.talents.preprocessor import TalentPreprocessor
+from app.core.schedule.talents.assembler import TalentAssembler
+from app.core.schedule.talents.service import TalentService
+from app.core.schedule.talents.snapshot import talent_snapshots
+from app.core.schedule.allocator.engine.generators import TalentByRole
+from app.core.schedule.allocator.service import ScheduleBuilder, UnderstaffedShifts
+from app.core.schedule.allocator.entities import weekRange, assignment
+from app.core.schedule.executor import generation_executor
+from app.core.schedule.talents.schema import talentAvailability
+from app.core.utils.cache import TTLCache
+from app.database.models import ScheduledShift
+
+
+settings = Settings()
+
+# Finished previews by input fingerprint; shared between requests, so read-only
+preview_cache: TTLCache[dict] = TTLCache(max_entries=settings.PREVIEW_CACHE_SIZE, ttl_seconds=settings.PREVIEW_CACHE_TTL)
+
+
+def preview_fingerprint(start_date: inputDate, slot_keys: list, assignable_shifts: dict[int, shiftSpecification],
+                        talent_objects: dict[int, talentAvailability], history_rows: list[ScheduledShift]) -> str:
+    """
+    SHA-256 over everything a preview is computed from.
+
+    The slots stand in for the period, template and staffing configuration, since
+    they are built from exactly that. Talents are hashed with their availability
+    windows (one digest per shared window), and history by row. The solver options
+    and the portfolio settings complete the key.
+    """
+    window_digests: dict[int, str] = {}
+    talents = []
+    for talent_id in sorted(talent_objects):
+        talent = talent_objects[talent_id]
+        window_digest = window_digests.get(id(talent.window))
+        if window_digest is None:
+            window_digest = window_digests[id(talent.window)] = hashlib.sha256(
+                repr(sorted(talent.window.items())).encode()
+            ).hexdigest()
+        talents.append((talent_id, talent.constraint, str(talent.role), sorted(talent.shift_name), window_digest, talent.weeklyhours))
+
+    shifts = [
+        (sid, key, shift.start_time, shift.end_time, shift.shift_name, str(shift.role_name), shift.role_count)
+        for (sid, shift), key in zip(assignable_shifts.items(), slot_keys)
+    ]
+    history = sorted(
+        (row.id, row.talent_id, row.date_of, row.start_time, row.end_time)
+        for row in history_rows
+    )
+    options = (
+        start_date.start_date, start_date.solver.value, start_date.budget_ms, start_date.seed,
+        settings.SCHEDULER_RESTARTS, settings.SCHEDULER_DEADLINE_MS,
+    )
+    return hashlib.sha256(repr((options, shifts, talents, history)).encode()).hexdigest()
+
+
+async def build_preview(db: AsyncSession, start_date: inputDate,
+                        cancel_event: threading.Event | None = None,
+                        on_stage: Callable[[str], None] | None = None,
+                        wait: bool = False) -> dict:
+    """
+    Run the scheduling algorithm for a week and return the preview.
+    Nothing is written to the database. A preview whose inputs all match an
+    earlier one (see preview_fingerprint) is served from `preview_cache`.
+
+    Args:
+        db (AsyncSession): Database session.
+        start_date (inputDate): Week and solver options.
+        cancel_event (threading.Event, optional): Stops the solve at its next checkpoint.
+        on_stage (Callable, optional): Called with each stage name as it starts:
+            "loading", then ScheduleBuilder's stages, then "preview".
+        wait (bool, optional): Wait for a generation slot instead of failing with 503.
+
+    Raises:
+        GenerationCancelled: `cancel_event` was set during the solve.
+    """
+    if on_stage is not None:
+        on_stage("loading")
+    week_provider = weekRange(start_date=start_date.start_date)
+
+    slots_builder = await ShiftSlotBuilder.create_async(db, start_date=week_provider.get_week()[0])
+    assignable_shifts = slots_builder.build_week_slots()
+
+    repo = AsyncTalentRepository(session=db, aggregate=True)
+    preprocessor = TalentPreprocessor(week_provider=week_provider)
+    assembler = TalentAssembler(week_provider=week_provider)
+    talent_service = TalentService(repo=repo, preprocessor=preprocessor, assembler=assembler, snapshots=talent_snapshots)
+    talent_objects = await talent_service.load_talent_objects_async()
+
+    week_start = week_provider.get_week()[0]
+    week_end   = week_provider.get_week()[-1]
+
+    history_rows = (await db.scalars(
+        select(ScheduledShift).where(
+            ScheduledShift.date_of >= week_start - timedelta(days=7),
+            ScheduledShift.date_of < week_start,
+        )
+    )).all()
+
+    fingerprint = preview_fingerprint(start_date, slots_builder.slot_keys, assignable_shifts, talent_objects, history_rows)
+    cached = preview_cache.get(fingerprint)
+    if cached is not None:
+        if on_stage is not None:
+            on_stage("preview")
+        return cached
+
+    talents_by_role = TalentByRole.group_talents(talents=talent_objects)
+
+    history = [
+        assignment(
+            talent_id=row.talent_id,
+            shift_id=row.id,
+            shift=shiftSpecification(
+                template_id=None,
+                start_time=datetime.combine(row.date_of, row.start_time),
+                end_time=datetime.combine(row.date_of, row.end_time),
+                shift_name="",
+                role_name="",
+                role_count=1,
+            )
+        )
+        for row in history_rows
+        if row.talent_id and row.date_of and row.start_time and row.end_time
+    ]
+
+    scheduler = ScheduleBuilder(
+        availability=talent_objects,
+        assignable_shifts=assignable_shifts,
+        talents_to_assign=talents_by_role,
+        history=history,
+        workers=settings.SCHEDULER_WORKERS,
+        solver=start_date.solver.value,
+        budget_ms=start_date.budget_ms,
+        restart_seed=start_date.seed,
+        restarts=settings.SCHEDULER_RESTARTS,
+        deadline_ms=settings.SCHEDULER_DEADLINE_MS,
+        cancel_event=cancel_event,
+        on_stage=on_stage,
+    )
+    # CPU-bound; runs on the bounded generation pool, 503 when it is saturated
+    plan = await generation_executor.run(scheduler.generate_schedule, wait=wait)
+
+    if on_stage is not None:
+        on_stage("preview")
+
+    understaffed = UnderstaffedShifts(
+        conn=None,
+        assignable_shifts=assignable_shifts,
+        assigned_shifts=plan,
+    )
+    understaffed_shifts = understaffed.get_all()
+
+    # Datetimes are rebuilt from the engine's integer minutes only here, for the preview
+    clock = scheduler.clock
+
+    # Return preview data in the shape DraftScheduleGrid expects
+    preview = {
+        "week_start": str(week_start),
+        "week_end":   str(week_end),
+        "assignments": [
+            {
+                "id":         f"preview-{i}",
+                "slot":       slots_builder.slot_key(a.shift_id),
+                "talent_id":  a.talent_id,
+                "tal_role":   a.shift.role_name,
+                "shift_name": a.shift.shift_name,
+                "date_of":    str(clock.datetime_at(a.shift.start_min).date()),
+                "start_time": str(clock.datetime_at(a.shift.start_min).time()),
+                "end_time":   str(clock.datetime_at(a.shift.end_min).time()),
+            }
+            for i, a in enumerate(plan)
+        ],
+        "understaffed": [
+            {
+                "slot":       slots_builder.slot_key(u.shift_id),
+                "shift_name": u.shift_name,
+                "role":       u.role_name,
+                "required":   u.required,
+                "assigned":   u.assigned,
+            }
+            for u in understaffed_shifts
+        ],
+        "solver": {
+            "name":           scheduler.report.solver,
+            "wall_time_ms":   scheduler.report.wall_time_ms,
+            "unfilled_slots": scheduler.report.unfilled_slots,
+            "seed":           scheduler.report.seed,
+        },
+    }
+
+    preview_cache.set(fingerprint, preview)
+    return preview
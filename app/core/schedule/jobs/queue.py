@@ -0,0 +1,50 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+
+class JobQueue(ABC):
+    """Hands job IDs from the API to the workers.
+
+    Only IDs travel through the queue; the jobs themselves stay in the
+    GenerationJobService. A broker-backed queue can replace InProcessJobQueue
+    by implementing these three methods.
+    """
+
+    @abstractmethod
+    async def put(self, job_id: str) -> bool:
+        """Enqueue a job ID.
+
+        Returns:
+            bool: False if the queue is full and the job was not accepted.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self) -> str:
+        """Wait for and return the next job ID."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def qsize(self) -> int:
+        """Number of job IDs waiting."""
+        raise NotImplementedError
+
+
+class InProcessJobQueue(JobQueue):
+    """Bounded asyncio queue, consumed by workers on the same event loop."""
+
+    def __init__(self, max_size: int = 32):
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_size)
+
+    async def put(self, job_id: str) -> bool:
+        try:
+            self.queue.put_nowait(job_id)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+    def qsize(self) -> int:
+        return self.queue.qsize()
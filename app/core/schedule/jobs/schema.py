@@ -0,0 +1,65 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from app.core.schedule.schema import inputDate
+from app.core.schedule.allocator.service import GenerationCancelled
+from app.core.utils.enums import JobStatus
+
+
+# In the order a generation passes through them; "improving" only runs with a budget_ms
+STAGES = ("queued", "loading", "eligibility", "solving", "improving", "preview")
+
+
+@dataclass
+class GenerationJob:
+    """One background schedule generation: its request, progress and, once done, its preview."""
+    job_id: str
+    request: inputDate
+    owner_id: int
+    status: JobStatus = JobStatus.QUEUED
+    stage: str = "queued"
+    progress: float = 0.0
+    stage_ms: dict[str, float] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    result: Optional[dict] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    stage_started: float = field(default_factory=time.perf_counter)
+
+    def enter_stage(self, stage: str):
+        """Close the current stage's timing and move to `stage`.
+
+        Doubles as a cancellation checkpoint, including between the database
+        loads and the solve.
+
+        Raises:
+            GenerationCancelled: The job was cancelled.
+        """
+        if self.cancel_event.is_set():
+            raise GenerationCancelled()
+        self._close_stage()
+        if stage == "loading":
+            self.status = JobStatus.RUNNING
+            self.started_at = datetime.now()
+        self.stage = stage
+        self.progress = STAGES.index(stage) / len(STAGES)
+
+    def finish(self, status: JobStatus, error: str | None = None):
+        if self.status == JobStatus.RUNNING:
+            self._close_stage()
+        self.status = status
+        self.error = error
+        self.finished_at = datetime.now()
+        if status == JobStatus.SUCCEEDED:
+            self.stage = "done"
+            self.progress = 1.0
+
+    def _close_stage(self):
+        now = time.perf_counter()
+        if self.stage != "queued":
+            self.stage_ms[self.stage] = round((now - self.stage_started) * 1000, 1)
+        self.stage_started = now
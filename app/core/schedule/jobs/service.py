@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import uuid
+from typing import Callable
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config.config import Settings
+from app.core.schedule.schema import inputDate
+from app.core.schedule.generation import build_preview
+from app.core.schedule.allocator.service import GenerationCancelled
+from app.core.schedule.jobs.schema import GenerationJob
+from app.core.schedule.jobs.queue import JobQueue, InProcessJobQueue
+from app.core.utils.cache import TTLCache
+from app.core.utils.enums import JobStatus
+from app.database.session import AsyncSessionLocal
+
+
+settings = Settings()
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationJobService:
+    """
+    Runs schedule generations in the background.
+
+    Submitted jobs are kept in `active` and their IDs go onto the queue; worker tasks
+    started with `start()` take them off and build the preview with their own
+    session. Finished jobs (succeeded, failed or cancelled) move to a TTL cache and
+    can be polled until they expire. Jobs belong to the user who submitted them;
+    anyone else gets a 404.
+    """
+
+    def __init__(self, queue: JobQueue,
+                 session_factory: Callable[[], AsyncSession],
+                 result_ttl_seconds: float = 900,
+                 max_finished: int = 256):
+        self.queue = queue
+        self.session_factory = session_factory
+        self.active: dict[str, GenerationJob] = {}
+        self.finished: TTLCache[GenerationJob] = TTLCache(max_entries=max_finished, ttl_seconds=result_ttl_seconds)
+        self.workers: list[asyncio.Task] = []
+
+    async def submit(self, request: inputDate, owner_id: int) -> GenerationJob:
+        """Queue a generation and return its job.
+
+        Raises:
+            HTTPException: 503 when the job queue is full.
+        """
+        job = GenerationJob(job_id=uuid.uuid4().hex, request=request, owner_id=owner_id)
+        self.active[job.job_id] = job
+        if not await self.queue.put(job.job_id):
+            del self.active[job.job_id]
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many schedule generations are waiting. Please try again shortly.",
+            )
+        return job
+
+    def get(self, job_id: str, owner_id: int) -> GenerationJob:
+        """
+        Raises:
+            HTTPException: 404 if the job is unknown, expired or someone else's.
+        """
+        job = self.active.get(job_id) or self.finished.get(job_id)
+        if job is None or job.owner_id != owner_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found or expired")
+        return job
+
+    def cancel(self, job_id: str, owner_id: int) -> GenerationJob:
+        """Request cancellation. A queued job is cancelled at once; a running one
+        stops at the solver's next checkpoint.
+
+        Raises:
+            HTTPException: 404 if the job is unknown, expired or someone else's.
+        """
+        job = self.get(job_id, owner_id)
+        if job.job_id not in self.active:
+            return job
+        job.cancel_event.set()
+        if job.status == JobStatus.QUEUED:
+            job.finish(JobStatus.CANCELLED)
+            self._retire(job)
+        return job
+
+    def start(self, workers: int = 1):
+        """Start the worker tasks on the running event loop."""
+        self.workers = [asyncio.create_task(self._work()) for _ in range(workers)]
+
+    async def stop(self):
+        """Cancel running solves and stop the workers."""
+        for job in self.active.values():
+            job.cancel_event.set()
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "active": len(self.active),
+            "retained": len(self.finished),
+        }
+
+    async def _work(self):
+        while True:
+            job_id = await self.queue.get()
+            job = self.active.get(job_id)
+            # Cancelled while queued
+            if job is None:
+                continue
+            await self._run(job)
+
+    async def _run(self, job: GenerationJob):
+        try:
+            async with self.session_factory() as db:
+                # build_preview reports every stage, starting with "loading".
+                # Jobs are already bounded by the queue, so wait for a solver thread rather than fail
+                job.result = await build_preview(
+                    db, job.request, cancel_event=job.cancel_event, on_stage=job.enter_stage, wait=True
+                )
+            job.finish(JobStatus.SUCCEEDED)
+        except GenerationCancelled:
+            job.finish(JobStatus.CANCELLED)
+        except HTTPException as exc:
+            job.finish(JobStatus.FAILED, error=str(exc.detail))
+        except Exception:
+            logger.exception("Schedule generation job %s failed", job.job_id)
+            job.finish(JobStatus.FAILED, error="An unexpected error occurred during generation.")
+        finally:
+            self._retire(job)
+
+    def _retire(self, job: GenerationJob):
+        self.active.pop(job.job_id, None)
+        self.finished.set(job.job_id, job)
+
+
+generation_jobs = GenerationJobService(
+    queue=InProcessJobQueue(max_size=settings.GENERATION_JOB_QUEUE_SIZE),
+    session_factory=AsyncSessionLocal,
+    result_ttl_seconds=settings.GENERATION_JOB_TTL,
+)
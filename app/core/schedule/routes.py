@@ -2,25 +2,33 @@
 API routes for schedule generation and management.
 """
 
-from fastapi import APIRouter, Body, Depends, status, HTTPException
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
-from typing import Annotated, List
-
-from app.database.session import session
+from fastapi import APIRouter, Body, Depends, Query, Response, status, HTTPException
+from sqlalchemy import select, delete, insert, func, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime, timedelta
+from typing import Annotated, List, Optional, Union
+
+from app.database.session import async_session
+from app.config.config import Settings
 from app.database.auth import User
 from app.core.schedule.schema import (
-    inputDate, ScheduleOut, AssignmentOut, AssignmentUpdate,
-    AssignmentIn, ScheduleCreate, StatusUpdate, ValidationRequest
+    inputDate, ScheduleOut, ScheduleSummaryOut, AssignmentOut, AssignmentUpdate,
+    AssignmentIn, ScheduleCreate, StatusUpdate, ValidationRequest, JobOut,
+    DraftEdit, DraftOut, DraftCommit
 )
-from app.core.schedule.shifts.service import ShiftSlotBuilder
-from app.core.schedule.talents.repo import TalentRepository
+from app.core.schedule.talents.repo import AsyncTalentRepository
 from app.core.schedule.talents.preprocessor import TalentPreprocessor
 from app.core.schedule.talents.assembler import TalentAssembler
 from app.core.schedule.talents.service import TalentService
-from app.core.schedule.allocator.engine.generators import TalentByRole
-from app.core.schedule.allocator.service import ScheduleBuilder, UnderstaffedShifts
 from app.core.schedule.allocator.entities import weekRange, assignment
+from app.core.schedule.generation import build_preview, preview_cache
+from app.core.schedule.executor import generation_executor
+from app.core.schedule.jobs.service import generation_jobs
+from app.core.schedule.drafts.service import schedule_drafts
+from app.core.schedule.drafts.schema import DraftAssignment, shift_hours
+from app.core.utils.enums import JobStatus
 from app.core.schedule.shifts.schema import shiftSpecification
 from app.authentication.utils.auth_utils import get_current_user
 from app.database.models import ScheduledShift, Schedule
@@ -28,7 +36,12 @@ from app.core.schedule.allocator.engine.validators import (
         maxHoursValidator, consecutiveValidator, restValidator,
         dailyAssignmentValidator, context,
     )
+from app.core.schedule.allocator.engine.ledger import assignmentLedger
+from app.core.schedule.allocator.engine.clock import weekClock
+from app.core.schedule.talents.snapshot import talent_snapshots
+
 
+settings = Settings()
 
 schedule = APIRouter(tags=["Schedule"])
 
@@ -38,102 +51,36 @@ schedule = APIRouter(tags=["Schedule"])
 @schedule.post("/generate")
 async def generate_schedule(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     start_date: Annotated[inputDate, Body()]
 ):
     """
     Run the scheduling algorithm and return a preview.
-    Nothing is written to the database — the manager reviews the draft
-    and either saves it as a draft or publishes it via POST /commit.
+    Nothing is written to the database — the preview is kept server-side
+    under the returned draft_id. The manager edits it with PATCH /drafts/{draft_id}
+    and saves it with POST /drafts/{draft_id}/commit.
     """
 
-    week_provider = weekRange(start_date=start_date.start_date)
-
-    slots_builder = ShiftSlotBuilder(db=db, start_date=week_provider.get_week()[0])
-    assignable_shifts = slots_builder.build_week_slots()
-
-    repo = TalentRepository(session=db)
-    preprocessor = TalentPreprocessor(week_provider=week_provider)
-    assembler = TalentAssembler(week_provider=week_provider)
-    talent_service = TalentService(repo=repo, preprocessor=preprocessor, assembler=assembler)
-    talent_objects = talent_service.load_talent_objects()
-
-    talents_by_role = TalentByRole.group_talents(talents=talent_objects)
-
-    week_start = week_provider.get_week()[0]
-    week_end   = week_provider.get_week()[-1]
-
-    history_rows = (
-        db.query(ScheduledShift)
-        .filter(
-            ScheduledShift.date_of >= week_start - timedelta(days=7),
-            ScheduledShift.date_of < week_start,
-        )
-        .all()
-    )
-
-    history = [
-        assignment(
-            talent_id=row.talent_id,
-            shift_id=row.id,
-            shift=shiftSpecification(
-                template_id=None,
-                start_time=datetime.combine(row.date_of, row.start_time),
-                end_time=datetime.combine(row.date_of, row.end_time),
-                shift_name="",
-                role_name="",
-                role_count=1,
-            )
-        )
-        for row in history_rows
-        if row.talent_id and row.date_of and row.start_time and row.end_time
-    ]
+    preview = await build_preview(db, start_date)
+    draft = schedule_drafts.create(preview, owner_id=current_user.id)
+    return {**preview, "draft_id": draft.draft_id, "version": draft.version}
 
-    scheduler = ScheduleBuilder(
-        availability=talent_objects,
-        assignable_shifts=assignable_shifts,
-        talents_to_assign=talents_by_role,
-        history=history,
-    )
-    plan = scheduler.generate_schedule()
 
-    understaffed = UnderstaffedShifts(
-        conn=db,
-        assignable_shifts=assignable_shifts,
-        assigned_shifts=plan,
-    )
-    understaffed_shifts = understaffed.get_all()
+async def _load_schedule(db: AsyncSession, schedule_id: int) -> Schedule | None:
+    """Fetch a schedule with its shifts; AsyncSession can't lazy-load them later."""
+    return (await db.scalars(
+        select(Schedule)
+        .options(selectinload(Schedule.scheduled_shifts))
+        .where(Schedule.id == schedule_id)
+        .execution_options(populate_existing=True)
+    )).first()
 
-    # Return preview data in the shape DraftScheduleGrid expects
-    return {
-        "week_start": str(week_start),
-        "week_end":   str(week_end),
-        "assignments": [
-            {
-                "id":         f"preview-{i}",
-                "talent_id":  a.talent_id,
-                "tal_role":   a.shift.role_name,
-                "shift_name": a.shift.shift_name,
-                "date_of":    str(a.shift.start_time.date()),
-                "start_time": str(a.shift.start_time.time()),
-                "end_time":   str(a.shift.end_time.time()),
-            }
-            for i, a in enumerate(plan)
-        ],
-        "understaffed": [
-            {
-                "shift_name": u.shift_name,
-                "role":       u.role_name,
-                "required":   u.required,
-                "assigned":   u.assigned,
-            }
-            for u in understaffed_shifts
-        ],
-    }
 
+def _serialize_schedule(schedule, shifts: list[ScheduledShift] | None = None):
+    """Map a Schedule ORM object to the dict shape ScheduleOut expects.
 
-def _serialize_schedule(schedule):
-    """Map a Schedule ORM object to the dict shape ScheduleOut expects."""
+    `shifts` replaces schedule.scheduled_shifts when the caller already has them.
+    """
     return {
         "id":         schedule.id,
         "week_start": schedule.week_start,
@@ -150,22 +97,147 @@ def _serialize_schedule(schedule):
                 "shift_hours": float(s.shift_hours) if s.shift_hours else None,
                 "schedule_id": s.schedule_id,
             }
-            for s in (schedule.scheduled_shifts or [])
+            for s in (shifts if shifts is not None else schedule.scheduled_shifts or [])
         ],
     }
 
 
 
-# LIST ALL SCHEDULES
+# LIST SCHEDULES  (newest week first, keyset-paginated)
+
+
+def _parse_cursor(cursor: str) -> tuple[date, int]:
+    """Split a "<week_start>:<id>" cursor from X-Next-Cursor."""
+    try:
+        week_start, schedule_id = cursor.split(":")
+        return date.fromisoformat(week_start), int(schedule_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
 
-@schedule.get("/", response_model=List[ScheduleOut])
+@schedule.get("/", response_model=Union[List[ScheduleOut], List[ScheduleSummaryOut]])
 async def list_schedules(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=200)] = 52,
+    cursor: Optional[str] = None,
+    summary: bool = False,
+):
+    """
+    Return one page of schedules ordered by week_start descending (then ID).
+
+    When more remain, the X-Next-Cursor response header holds the cursor for the
+    next page; pass it back as `cursor`. Pages are found by seeking past the
+    cursor's (week_start, id), so deep pages cost the same as the first.
+
+    With summary=true each schedule carries its assignment count and total hours,
+    aggregated in SQL, instead of its assignments.
+    """
+    if summary:
+        query = (
+            select(
+                Schedule.id, Schedule.week_start, Schedule.week_end, Schedule.status,
+                func.count(ScheduledShift.id).label("assignment_count"),
+                func.coalesce(func.sum(ScheduledShift.shift_hours), 0).label("total_hours"),
+            )
+            .outerjoin(ScheduledShift, ScheduledShift.schedule_id == Schedule.id)
+            .group_by(Schedule.id)
+        )
+    else:
+        query = select(Schedule).options(selectinload(Schedule.scheduled_shifts))
+
+    if cursor:
+        query = query.where(tuple_(Schedule.week_start, Schedule.id) < tuple_(*_parse_cursor(cursor)))
+    # One extra row says whether there is a next page
+    query = query.order_by(Schedule.week_start.desc(), Schedule.id.desc()).limit(limit + 1)
+
+    if summary:
+        rows = (await db.execute(query)).all()
+    else:
+        rows = (await db.scalars(query)).all()
+
+    page = rows[:limit]
+    if len(rows) > limit:
+        response.headers["X-Next-Cursor"] = f"{page[-1].week_start}:{page[-1].id}"
+
+    if summary:
+        return [
+            ScheduleSummaryOut(
+                id=row.id,
+                week_start=row.week_start,
+                week_end=row.week_end,
+                status=row.status,
+                assignment_count=row.assignment_count,
+                total_hours=float(row.total_hours),
+            )
+            for row in page
+        ]
+    return [ScheduleOut.model_validate(_serialize_schedule(s)) for s in page]
+
+
+
+# GENERATION METRICS  (declared before /{schedule_id})
+
+@schedule.get("/generation/metrics")
+async def generation_metrics(
+    current_user: Annotated[User, Depends(get_current_user)],
+):
+    """Queue depth and counters of the schedule generation pool, job queue and preview cache."""
+    return {
+        **generation_executor.stats(),
+        "jobs": generation_jobs.stats(),
+        "preview_cache": preview_cache.stats(),
+    }
+
+
+
+# GENERATION JOBS  (background /generate: submit, poll, fetch the preview)
+
+
+@schedule.post("/jobs", response_model=JobOut, status_code=status.HTTP_202_ACCEPTED)
+async def submit_generation_job(
+    current_user: Annotated[User, Depends(get_current_user)],
+    start_date: Annotated[inputDate, Body()],
+):
+    """
+    Queue a schedule generation and return its job at once.
+    Poll GET /jobs/{job_id}; when it has succeeded the preview is at
+    GET /jobs/{job_id}/result, until the job expires.
+    """
+    return await generation_jobs.submit(start_date, owner_id=current_user.id)
+
+
+@schedule.get("/jobs/{job_id}", response_model=JobOut)
+async def get_generation_job(
+    current_user: Annotated[User, Depends(get_current_user)],
+    job_id: str,
 ):
-    """Return all schedules ordered by week_start descending."""
-    schedules = db.query(Schedule).order_by(Schedule.week_start.desc()).all()
-    return [_serialize_schedule(s) for s in schedules]
+    return generation_jobs.get(job_id, owner_id=current_user.id)
+
+
+@schedule.get("/jobs/{job_id}/result")
+async def get_generation_job_result(
+    current_user: Annotated[User, Depends(get_current_user)],
+    job_id: str,
+):
+    """Return the finished preview as a new draft, in the same shape as POST /generate."""
+    job = generation_jobs.get(job_id, owner_id=current_user.id)
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is {job.status.value}; no preview available.",
+        )
+    draft = schedule_drafts.create(job.result, owner_id=current_user.id)
+    return {**job.result, "draft_id": draft.draft_id, "version": draft.version}
+
+
+@schedule.post("/jobs/{job_id}/cancel", response_model=JobOut)
+async def cancel_generation_job(
+    current_user: Annotated[User, Depends(get_current_user)],
+    job_id: str,
+):
+    return generation_jobs.cancel(job_id, owner_id=current_user.id)
 
 
 
@@ -175,7 +247,7 @@ async def list_schedules(
 @schedule.post("/commit", response_model=ScheduleOut)
 async def commit_schedule(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     data: ScheduleCreate,
 ):
     """
@@ -185,38 +257,130 @@ async def commit_schedule(
                        already exists for the same week).
     """
 
-    # Block duplicate schedules for the same week
-    existing = db.query(Schedule).filter(
-        Schedule.week_start == data.week_start,
-        Schedule.status == data.status,
-    ).first()
+    return await _save_schedule(
+        db, data.week_start, data.week_end, data.status,
+        [
+            DraftAssignment(
+                talent_id=entry.talent_id,
+                date_of=entry.date_of,
+                start_time=entry.start_time,
+                end_time=entry.end_time,
+                shift_name=entry.shift_name,
+                shift_hours=shift_hours(entry.date_of, entry.start_time, entry.end_time),
+            )
+            for entry in data.assignments
+        ],
+    )
+
+
+async def _save_schedule(db: AsyncSession, week_start, week_end, schedule_status: str,
+                         entries: list[DraftAssignment]) -> dict:
+    # Block duplicate schedules for the same week. For finals this is a probe of
+    # uq_schedules_final_week_start, which also catches a concurrent commit below.
+    existing = (await db.scalars(
+        select(Schedule).where(
+            Schedule.week_start == week_start,
+            Schedule.status == schedule_status,
+        )
+    )).first()
     if existing:
-        label = "final" if data.status == "final" else "draft"
+        label = "final" if schedule_status == "final" else "draft"
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"A {label} schedule for the week starting {data.week_start} already exists (ID {existing.id}).",
+            detail=f"A {label} schedule for the week starting {week_start} already exists (ID {existing.id}).",
         )
 
-    saved = Schedule(week_start=data.week_start, week_end=data.week_end, status=data.status)
+    saved = Schedule(week_start=week_start, week_end=week_end, status=schedule_status)
     db.add(saved)
-    db.flush()
-
-    for entry in data.assignments:
-        start_dt = datetime.combine(entry.date_of, entry.start_time)
-        end_dt   = datetime.combine(entry.date_of, entry.end_time)
-        shift_hours = (end_dt - start_dt).total_seconds() / 3600
-        db.add(ScheduledShift(
-            talent_id=entry.talent_id,
-            date_of=entry.date_of,
-            start_time=entry.start_time,
-            end_time=entry.end_time,
-            shift_hours=shift_hours,
-            shift_name=entry.shift_name,
-            schedule_id=saved.id,
-        ))
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A final schedule for the week starting {week_start} already exists.",
+        )
+
+    # One multi-row INSERT ... RETURNING (batched by SQLAlchemy for very large weeks);
+    # the returned rows are the response, so nothing is read back afterwards
+    shifts = (await db.scalars(
+        insert(ScheduledShift).returning(ScheduledShift, sort_by_parameter_order=True),
+        [
+            {
+                "talent_id":   entry.talent_id,
+                "date_of":     entry.date_of,
+                "start_time":  entry.start_time,
+                "end_time":    entry.end_time,
+                "shift_hours": entry.shift_hours,
+                "shift_name":  entry.shift_name,
+                "schedule_id": saved.id,
+            }
+            for entry in entries
+        ],
+    )).all() if entries else []
+
+    await db.commit()
+    return _serialize_schedule(saved, shifts)
+
 
-    db.commit()
-    db.refresh(saved)
+
+# DRAFTS  (server-side previews, edited by delta and committed by ID)
+
+
+@schedule.get("/drafts/{draft_id}")
+async def get_draft(
+    current_user: Annotated[User, Depends(get_current_user)],
+    draft_id: str,
+):
+    """Return the draft in full, in the same shape as POST /generate."""
+    return schedule_drafts.as_preview(schedule_drafts.get(draft_id, owner_id=current_user.id))
+
+
+@schedule.patch("/drafts/{draft_id}", response_model=DraftOut)
+async def edit_draft(
+    current_user: Annotated[User, Depends(get_current_user)],
+    draft_id: str,
+    data: DraftEdit,
+):
+    """
+    Apply a batch of additions, updates and removals to a draft.
+    Only the changes travel; the response carries the new version and the
+    IDs given to added assignments.
+    """
+    draft, added = schedule_drafts.apply(draft_id, owner_id=current_user.id, edit=data)
+    return DraftOut(
+        draft_id=draft.draft_id,
+        version=draft.version,
+        week_start=draft.week_start,
+        week_end=draft.week_end,
+        assignment_count=len(draft.assignments),
+        added=added,
+    )
+
+
+@schedule.delete("/drafts/{draft_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def discard_draft(
+    current_user: Annotated[User, Depends(get_current_user)],
+    draft_id: str,
+):
+    schedule_drafts.get(draft_id, owner_id=current_user.id)
+    schedule_drafts.discard(draft_id)
+
+
+@schedule.post("/drafts/{draft_id}/commit", response_model=ScheduleOut)
+async def commit_draft(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(async_session)],
+    draft_id: str,
+    data: DraftCommit,
+):
+    """
+    Persist a draft, the same way POST /commit does, without re-sending its
+    assignments. The draft is discarded once saved.
+    """
+    draft = schedule_drafts.get(draft_id, owner_id=current_user.id)
+    saved = await _save_schedule(db, draft.week_start, draft.week_end, data.status, list(draft.assignments.values()))
+    schedule_drafts.discard(draft_id)
     return saved
 
 
@@ -227,10 +391,10 @@ async def commit_schedule(
 @schedule.get("/{schedule_id}", response_model=ScheduleOut)
 async def get_schedule(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     schedule_id: int,
 ):
-    saved = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    saved = await _load_schedule(db, schedule_id)
     if not saved:
         raise HTTPException(status_code=404, detail="Schedule not found")
     return _serialize_schedule(saved)
@@ -243,12 +407,12 @@ async def get_schedule(
 @schedule.patch("/{schedule_id}/status", response_model=ScheduleOut)
 async def update_schedule_status(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     schedule_id: int,
     data: StatusUpdate,
 ):
 
-    saved = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    saved = await _load_schedule(db, schedule_id)
     if not saved:
         raise HTTPException(status_code=404, detail="Schedule not found")
 
@@ -259,11 +423,13 @@ async def update_schedule_status(
         )
 
     if data.status == "final" and saved.status != "final":
-        existing = db.query(Schedule).filter(
-            Schedule.week_start == saved.week_start,
-            Schedule.status == "final",
-            Schedule.id != schedule_id,
-        ).first()
+        existing = (await db.scalars(
+            select(Schedule).where(
+                Schedule.week_start == saved.week_start,
+                Schedule.status == "final",
+                Schedule.id != schedule_id,
+            )
+        )).first()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -271,8 +437,15 @@ async def update_schedule_status(
             )
 
     saved.status = data.status
-    db.commit()
-    db.refresh(saved)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Another request published this week between the check above and now
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A final schedule for this week already exists.",
+        )
     return _serialize_schedule(saved)
 
 
@@ -283,15 +456,15 @@ async def update_schedule_status(
 @schedule.delete("/{schedule_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_schedule(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     schedule_id: int,
 ):
-    saved = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    saved = await db.get(Schedule, schedule_id)
     if not saved:
         raise HTTPException(status_code=404, detail="Schedule not found")
-    db.query(ScheduledShift).filter(ScheduledShift.schedule_id == schedule_id).delete()
-    db.delete(saved)
-    db.commit()
+    await db.execute(delete(ScheduledShift).where(ScheduledShift.schedule_id == schedule_id))
+    await db.delete(saved)
+    await db.commit()
 
 
 
@@ -301,7 +474,7 @@ async def delete_schedule(
 @schedule.post("/assignments/", response_model=AssignmentOut)
 async def create_assignment(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     data: AssignmentIn,
 ):
     
@@ -318,19 +491,19 @@ async def create_assignment(
         schedule_id=data.schedule_id,
     )
     db.add(new_shift)
-    db.commit()
-    db.refresh(new_shift)
+    await db.commit()
+    await db.refresh(new_shift)
     return new_shift
 
 
 @schedule.patch("/assignments/{assignment_id}", response_model=AssignmentOut)
 async def update_assignment(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     assignment_id: int,
     data: AssignmentUpdate,
 ):
-    shift = db.query(ScheduledShift).filter(ScheduledShift.id == assignment_id).first()
+    shift = await db.get(ScheduledShift, assignment_id)
     if not shift:
         raise HTTPException(status_code=404, detail="Assignment not found")
     if data.start_time is not None:
@@ -339,23 +512,23 @@ async def update_assignment(
         shift.end_time = data.end_time
     if data.shift_name is not None:
         shift.shift_name = data.shift_name
-    db.commit()
-    db.refresh(shift)
+    await db.commit()
+    await db.refresh(shift)
     return shift
 
 
 @schedule.delete("/assignments/{assignment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_assignment(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     assignment_id: int,
 ):
     from app.database.models import ScheduledShift
-    shift = db.query(ScheduledShift).filter(ScheduledShift.id == assignment_id).first()
+    shift = await db.get(ScheduledShift, assignment_id)
     if not shift:
         raise HTTPException(status_code=404, detail="Assignment not found")
-    db.delete(shift)
-    db.commit()
+    await db.delete(shift)
+    await db.commit()
 
 
 # VALIDATE ASSIGNMENT  (constraint check, non-blocking, informational)
@@ -364,7 +537,7 @@ async def delete_assignment(
 @schedule.post("/validate_assignment")
 async def validate_assignment(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     data: ValidationRequest,
 ):
     """
@@ -378,33 +551,32 @@ async def validate_assignment(
     shift_date = data.date_of
     week_start = shift_date - timedelta(days=shift_date.weekday())
     week_provider = weekRange(start_date=week_start)
-    repo = TalentRepository(session=db)
+    repo = AsyncTalentRepository(session=db, aggregate=True)
     preprocessor = TalentPreprocessor(week_provider=week_provider)
     assembler = TalentAssembler(week_provider=week_provider)
-    talent_objects = TalentService(
-        repo=repo, preprocessor=preprocessor, assembler=assembler
-    ).load_talent_objects()
+    talent_objects = await TalentService(
+        repo=repo, preprocessor=preprocessor, assembler=assembler, snapshots=talent_snapshots
+    ).load_talent_objects_async()
 
     if data.talent_id not in talent_objects:
         raise HTTPException(status_code=404, detail="Talent not found or inactive")
 
-    proposed_shift = shiftSpecification(
+    clock = weekClock(shift_date)
+    proposed_shift = clock.stamp(shiftSpecification(
         template_id=None,
         start_time=datetime.combine(data.date_of, data.start_time),
         end_time=datetime.combine(data.date_of, data.end_time),
         shift_name=data.shift_name or "",
         role_name="",
         role_count=1,
-    )
+    ))
 
-    existing_shifts = (
-        db.query(ScheduledShift)
-        .filter(ScheduledShift.schedule_id == data.schedule_id)
-        .all()
-    ) if data.schedule_id else []
+    existing_shifts = (await db.scalars(
+        select(ScheduledShift).where(ScheduledShift.schedule_id == data.schedule_id)
+    )).all() if data.schedule_id else []
 
     existing_assignments = [
-        assignment(
+        clock.stamp_assignment(assignment(
             talent_id=s.talent_id,
             shift_id=s.id,
             shift=shiftSpecification(
@@ -415,13 +587,13 @@ async def validate_assignment(
                 role_name="",
                 role_count=1,
             ),
-        )
+        ))
         for s in existing_shifts
         if s.talent_id and s.start_time and s.end_time
     ]
 
     ctx = context.contextFinder(
-        data.talent_id, proposed_shift, talent_objects, existing_assignments
+        data.talent_id, proposed_shift, talent_objects, assignmentLedger(existing_assignments)
     )
 
     violations = []
@@ -1,10 +1,19 @@
-from pydantic import BaseModel
-from datetime import date, time
+from pydantic import BaseModel, Field
+from datetime import date, datetime, time
 from typing import Optional
+from app.config.config import Settings
+from app.core.utils.enums import Solver, JobStatus
+
+
+settings = Settings()
 
 
 class inputDate(BaseModel):
     start_date: date
+    solver: Solver = Solver.GREEDY
+    # time allowed for local search after the solver; capped so one request can't hold a generation thread
+    budget_ms: Optional[int] = Field(default=None, ge=0, le=settings.SCHEDULER_MAX_BUDGET_MS)
+    seed: int = 0  # restart seed; replays a portfolio winner with the greedy solver
 
 
 class AssignmentBase(BaseModel):
@@ -45,6 +54,15 @@ class ScheduleOut(BaseModel):
         from_attributes = True
 
 
+class ScheduleSummaryOut(BaseModel):
+    id: int
+    week_start: date
+    week_end: date
+    status: str
+    assignment_count: int
+    total_hours: float
+
+
 class ScheduleCreate(BaseModel):
     week_start: date
     week_end: date
@@ -63,3 +81,47 @@ class ValidationRequest(BaseModel):
     end_time: time
     shift_name: Optional[str] = None
     schedule_id: Optional[int] = None
+
+
+class JobOut(BaseModel):
+    job_id: str
+    status: JobStatus
+    stage: str
+    progress: float  # 0..1, by stages completed
+    stage_ms: dict[str, float] = {}  # wall time of each finished stage
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class DraftAssignmentUpdate(BaseModel):
+    id: str
+    talent_id: Optional[int] = None
+    start_time: Optional[time] = None
+    end_time: Optional[time] = None
+    shift_name: Optional[str] = None
+
+
+class DraftEdit(BaseModel):
+    """A batch of changes to a draft, applied all or nothing."""
+    version: Optional[int] = None  # when given, the edit is refused unless the draft is still at it
+    add: list[AssignmentBase] = []
+    update: list[DraftAssignmentUpdate] = []
+    remove: list[str] = []
+
+
+class DraftOut(BaseModel):
+    draft_id: str
+    version: int
+    week_start: date
+    week_end: date
+    assignment_count: int
+    added: list[str] = []  # IDs given to the assignments in `add`, in order
+
+
+class DraftCommit(BaseModel):
+    status: str = "final"   # 'draft' or 'final'
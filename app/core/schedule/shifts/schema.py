@@ -2,11 +2,16 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from app.core.utils.enums import Role
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class shiftSpecification:
     template_id: int
     start_time: datetime
     end_time: datetime
     shift_name: str
     role_name: Role
-    role_count: int
\ No newline at end of file
+    role_count: int
+    # Integer time, stamped by the allocator's weekClock on entry:
+    # day index and minutes since the week start
+    day: int | None = None
+    start_min: int | None = None
+    end_min: int | None = None
\ No newline at end of file
@@ -2,21 +2,28 @@ import pandas as pd
 from datetime import timedelta, date, datetime
 from collections import defaultdict
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.schedule.staffing.service import StaffingService
 from app.core.schedule.shifts.schema import shiftSpecification
-from app.core.schedule.shifts.utils import flatten_shift_structure, start_date_within_allowed_window
+from app.core.schedule.shifts.utils import start_date_within_allowed_window
 
 
 
 
 class ShiftSlotBuilder:
 
-    def __init__(self, db: Session, start_date: date):
+    def __init__(self, db: Session | None, start_date: date, engine: StaffingService | None = None):
         self.db = db
-        self.engine = StaffingService(db=self.db)
+        self.engine = engine if engine is not None else StaffingService(db=self.db)
         self.start_date = start_date
         self.week_spec: dict = self._build_week_spec()
 
+    @classmethod
+    async def create_async(cls, db: AsyncSession, start_date: date) -> "ShiftSlotBuilder":
+        """Load the periods through an AsyncSession, then lay out the week in memory."""
+        engine = StaffingService(periods=await StaffingService.load_periods_async(db))
+        return cls(db=None, start_date=start_date, engine=engine)
+
     def _build_week_spec(self) -> dict [date, dict[int, dict[str, dict]]]:
         start_date_within_allowed_window(start_date=self.start_date)
         end_date = self.start_date + timedelta(days=7)
@@ -36,8 +43,17 @@ class ShiftSlotBuilder:
         return week_spec
     
     def build_week_slots(self) -> dict[int, shiftSpecification]:
-        shift_spec = defaultdict(lambda: defaultdict(dict))
+        """Turn the week's staffed periods into assignable shift slots in one pass.
+
+        Slots get consecutive integer IDs in date, period, role order. The readable
+        (template_id, date, period_id, role) key of each slot is kept in
+        `self.slot_keys`, indexed by slot ID, for building API responses.
 
+        Returns:
+            dict[int, shiftSpecification]: slot ID -> shift specification.
+        """
+        slots: dict[int, shiftSpecification] = {}
+        self.slot_keys: list[tuple[int, date, int, str]] = []
 
         for shift_date, staffed_periods in self.week_spec.items():
             staffed_periods: dict
@@ -45,7 +61,7 @@ class ShiftSlotBuilder:
                 staffed_roles: dict
                 for role, role_data in staffed_roles.items():
                     role_data: dict
-                    shift_spec[shift_date][period_id][role] = shiftSpecification(
+                    slots[len(self.slot_keys)] = shiftSpecification(
                         template_id=role_data["template_id"],
                         start_time=datetime.combine(shift_date, role_data["start_time"]),
                         end_time=datetime.combine(shift_date, role_data["end_time"]),
@@ -53,14 +69,11 @@ class ShiftSlotBuilder:
                         role_name= role,
                         role_count= role_data["count"]
                     )
-                    flattened = flatten_shift_structure(shift_spec)
-        
-        return flattened
-
-        
-
-
-
-
+                    self.slot_keys.append((role_data["template_id"], shift_date, period_id, role))
 
+        return slots
 
+    def slot_key(self, slot_id: int) -> str:
+        """Return the readable key of a slot, as "template_id__date__period_id__role"."""
+        template_id, shift_date, period_id, role = self.slot_keys[slot_id]
+        return f"{template_id}__{shift_date}__{period_id}__{role}"
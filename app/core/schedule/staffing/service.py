@@ -1,4 +1,6 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.utils.enums import Role
 from collections import defaultdict
 from app.database.models import ShiftPeriod
@@ -10,9 +12,9 @@ from app.database.models import ShiftPeriod
 class StaffingService:
     
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session | None = None, periods: list[ShiftPeriod] | None = None):
         self.db = db
-        self.periods = self._load_periods()
+        self.periods = periods if periods is not None else self._load_periods()
         self.staffing_rules = self._define_staffing_rules()
     
     def _load_periods(self) -> list[ShiftPeriod]:
@@ -21,6 +23,17 @@ class StaffingService:
           raise ValueError("Period does not exist") 
      return period
 
+    @staticmethod
+    async def load_periods_async(db: AsyncSession) -> list[ShiftPeriod]:
+        """_load_periods for AsyncSession; the templates are loaded with the periods
+        since they can't be lazy-loaded later."""
+        periods = (await db.scalars(
+            select(ShiftPeriod).join(ShiftPeriod.templates).options(selectinload(ShiftPeriod.templates))
+        )).unique().all()
+        if not periods:
+            raise ValueError("Period does not exist")
+        return list(periods)
+
 
     def _define_staffing_rules(self) -> dict[str, str]:
      return {
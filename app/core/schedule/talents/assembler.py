@@ -1,6 +1,6 @@
 from datetime import datetime, date
 
-from app.core.schedule.talents.schema import talentAvailability, TalentRecord
+from app.core.schedule.talents.schema import talentAvailability, TalentRecord, availabilityWindow
 from app.core.schedule.allocator.entities import weekRange
 from app.core.schedule.talents.utils import map_shift_name_to_time
 from app.core.utils.enums import Role
@@ -12,26 +12,14 @@ class TalentAssembler:
 
     def assemble(self, records: dict[int, TalentRecord]) -> dict[int, talentAvailability]:
         result: dict[int, talentAvailability] = {}
+        # Talents with the same days and shifts share one window instance
+        windows: dict[tuple[frozenset, frozenset], availabilityWindow] = {}
 
         for tid, record in records.items():
-            window: dict[date, list[tuple[datetime, datetime]]] = {}
-
-            for day in record.days:
-                d: date = self.date_map[day]
-                window[d] = []
-
-                for shift in record.shifts:
-                    span = map_shift_name_to_time(shift)
-                    if not span:
-                        continue
-
-                    start_t, end_t = span
-
-                    # Combine date + time into datetime
-                    start_dt = datetime.combine(d, start_t)
-                    end_dt   = datetime.combine(d, end_t)
-
-                    window[d].append((start_dt, end_dt))
+            signature = (frozenset(record.days), frozenset(record.shifts))
+            window = windows.get(signature)
+            if window is None:
+                window = windows[signature] = self._build_window(signature)
 
             result[tid] = talentAvailability(
                 talent_id=record.talent_id,
@@ -44,3 +32,21 @@ class TalentAssembler:
 
         return result
 
+    def _build_window(self, signature: tuple[frozenset, frozenset]) -> availabilityWindow:
+        days, shifts = signature
+        spans: dict[date, tuple[tuple[datetime, datetime], ...]] = {}
+
+        for d in sorted(self.date_map[day] for day in days):
+            day_spans = []
+            for shift in sorted(shift for shift in shifts if shift):
+                span = map_shift_name_to_time(shift)
+                if not span:
+                    continue
+
+                start_t, end_t = span
+
+                # Combine date + time into datetime
+                day_spans.append((datetime.combine(d, start_t), datetime.combine(d, end_t)))
+            spans[d] = tuple(day_spans)
+
+        return availabilityWindow(signature, spans)
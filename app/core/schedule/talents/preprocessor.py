@@ -1,3 +1,4 @@
+from sqlalchemy.engine import RowMapping
 from app.core.schedule.allocator.entities import weekRange
 from app.database.models import TalentData
 from app.core.utils.enums import ConstraintType
@@ -81,3 +82,42 @@ class TalentPreprocessor:
             )
 
         return talent_objects
+
+    def preprocess_summaries(self, summaries: list[RowMapping]) -> dict[int, TalentRecord]:
+        """Build TalentRecords from rows already grouped per talent in SQL.
+
+        Applies the same whitelist rules as `preprocess` to the arrays returned by
+        TalentRepository.load_talent_summaries: a shift restriction opens every day,
+        an availability rule opens every shift, and an empty day or shift list means
+        all of them.
+
+        Two results deliberately differ from `preprocess`, which depends on the
+        view's unspecified row order in both places:
+          - `preprocess` takes constraint_status from a talent's first row, so a
+            talent whose first row is an inactive rule is left unconstrained even
+            when another of their rules is active. Here a talent is constrained when
+            any of their rules is active (BOOL_OR).
+          - `preprocess` opens every shift for an availability rule only when that
+            rule's rows come before any combination rows; here it always does.
+        """
+        all_week_days = list(self.week_provider.get_date_map().keys())
+        talent_objects: dict[int, TalentRecord] = {}
+
+        for row in summaries:
+            if not row["constraint_status"]:
+                days = all_week_days
+                shifts = fetch_all_shifts()
+            else:
+                days = all_week_days if row["all_days"] else (list(row["days"] or []) or all_week_days)
+                shifts = fetch_all_shifts() if row["all_shifts"] else (list(row["shifts"] or []) or fetch_all_shifts())
+
+            talent_objects[row["talent_id"]] = TalentRecord(
+                talent_id=row["talent_id"],
+                role=row["tal_role"],
+                weeklyhours=row["hours"],
+                constraint_status=bool(row["constraint_status"]),
+                days=days,
+                shifts=shifts
+            )
+
+        return talent_objects
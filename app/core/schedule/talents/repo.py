@@ -1,11 +1,78 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.models import TalentData
+from app.core.utils.enums import ConstraintType
+
+
+TALENT_ROWS_SQL = text("""
+    SELECT pk, talent_id, talent_name, tal_role, hours,
+           constraint_type, constraint_status, available_day, available_shifts
+    FROM talent_data
+""")
+
+TALENT_SUMMARIES_SQL = text("""
+    SELECT talent_id,
+           MIN(tal_role) AS tal_role,
+           MIN(hours) AS hours,
+           -- Constrained when any rule is active (the row path reads only the first row)
+           COALESCE(BOOL_OR(CAST(constraint_status AS boolean)), false) AS constraint_status,
+           ARRAY_AGG(DISTINCT available_day) FILTER (
+               WHERE CAST(constraint_status AS boolean)
+                 AND LOWER(constraint_type) IN (:combination, :availability)
+                 AND available_day IS NOT NULL
+           ) AS days,
+           ARRAY_AGG(DISTINCT available_shifts) FILTER (
+               WHERE CAST(constraint_status AS boolean)
+                 AND LOWER(constraint_type) IN (:combination, :shift_restriction)
+                 AND available_shifts IS NOT NULL
+           ) AS shifts,
+           COALESCE(BOOL_OR(
+               CAST(constraint_status AS boolean) AND LOWER(constraint_type) = :shift_restriction
+           ), false) AS all_days,
+           COALESCE(BOOL_OR(
+               CAST(constraint_status AS boolean) AND LOWER(constraint_type) = :availability
+           ), false) AS all_shifts
+    FROM talent_data
+    GROUP BY talent_id
+""")
+
+SUMMARY_PARAMS = {
+    "combination": ConstraintType.COMBINATION.value,
+    "availability": ConstraintType.AVAILABILITY.value,
+    "shift_restriction": ConstraintType.SHIFT_RESTRICTION.value,
+}
+
+
+def _to_talent_data(rows) -> list[TalentData]:
+    # Convert to TalentData-like objects (namedtuple-like mapping access)
+    talent_data_rows = []
+    for row in rows:
+        obj = TalentData()
+        obj.pk = row["pk"]
+        obj.talent_id = row["talent_id"]
+        obj.talent_name = row["talent_name"]
+        obj.tal_role = row["tal_role"]
+        obj.hours = row["hours"]
+        obj.constraint_type = row["constraint_type"]
+        obj.constraint_status = row["constraint_status"]
+        obj.available_day = row["available_day"]
+        obj.available_shifts = row["available_shifts"]
+        talent_data_rows.append(obj)
+    return talent_data_rows
 
 
 class TalentRepository:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, aggregate: bool = False):
+        """
+        Args:
+            session (Session): Database session.
+            aggregate (bool, optional): Load one pre-aggregated row per talent
+                (load_talent_summaries) instead of one row per constraint rule.
+        """
         self.session = session
+        self.aggregate = aggregate
     
     def load_all_talent_rows(self) -> list[TalentData]:
         """
@@ -18,26 +85,38 @@ class TalentRepository:
         only the first constraint rule per talent would be returned.
         Using text() bypasses the identity map and returns ALL rows faithfully.
         """
-        result = self.session.execute(text("""
-            SELECT pk, talent_id, talent_name, tal_role, hours,
-                   constraint_type, constraint_status, available_day, available_shifts
-            FROM talent_data
-        """))
-        rows = result.mappings().all()
-
-        # Convert to TalentData-like objects (namedtuple-like mapping access)
-        talent_data_rows = []
-        for row in rows:
-            obj = TalentData()
-            obj.pk = row["pk"]
-            obj.talent_id = row["talent_id"]
-            obj.talent_name = row["talent_name"]
-            obj.tal_role = row["tal_role"]
-            obj.hours = row["hours"]
-            obj.constraint_type = row["constraint_type"]
-            obj.constraint_status = row["constraint_status"]
-            obj.available_day = row["available_day"]
-            obj.available_shifts = row["available_shifts"]
-            talent_data_rows.append(obj)
-
-        return talent_data_rows
\ No newline at end of file
+        result = self.session.execute(TALENT_ROWS_SQL)
+        return _to_talent_data(result.mappings().all())
+
+    def load_talent_summaries(self) -> list[RowMapping]:
+        """
+        Load the talent_data view grouped in SQL, one row per talent.
+
+        Only rules of active constraints contribute. Each row carries:
+        - talent_id, tal_role, hours
+        - constraint_status: True if any of the talent's constraints is active
+        - days: distinct days from combination and availability rules
+        - shifts: distinct shifts from combination and shift restriction rules
+        - all_days: True if an active shift restriction makes every day available
+        - all_shifts: True if an active availability rule makes every shift available
+
+        TalentPreprocessor.preprocess_summaries turns these into TalentRecords.
+        """
+        result = self.session.execute(TALENT_SUMMARIES_SQL, SUMMARY_PARAMS)
+        return result.mappings().all()
+
+
+class AsyncTalentRepository:
+    """TalentRepository over an AsyncSession; see it for what each query returns."""
+
+    def __init__(self, session: AsyncSession, aggregate: bool = False):
+        self.session = session
+        self.aggregate = aggregate
+
+    async def load_all_talent_rows(self) -> list[TalentData]:
+        result = await self.session.execute(TALENT_ROWS_SQL)
+        return _to_talent_data(result.mappings().all())
+
+    async def load_talent_summaries(self) -> list[RowMapping]:
+        result = await self.session.execute(TALENT_SUMMARIES_SQL, SUMMARY_PARAMS)
+        return result.mappings().all()
@@ -1,15 +1,47 @@
 from dataclasses import dataclass, field
 from datetime import datetime, date, time
+from collections.abc import Mapping
 import enum
 from app.core.utils.enums import Role
 
-@dataclass
+
+class availabilityWindow(Mapping):
+    """Immutable date -> (start, end) spans mapping.
+
+    The assembler builds one per distinct (days, shifts) pattern and every talent
+    with that pattern points at the same instance, so identity tells the
+    eligibility step which talents share a window.
+    """
+
+    __slots__ = ("signature", "_spans")
+
+    def __init__(self, signature: tuple, spans: dict[date, tuple[tuple[datetime, datetime], ...]]):
+        self.signature = signature
+        self._spans = dict(spans)
+
+    def __getitem__(self, day: date) -> tuple[tuple[datetime, datetime], ...]:
+        return self._spans[day]
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __reduce__(self):
+        # Pickle memoises by identity, so talents sharing a window still share it after unpickling
+        return (availabilityWindow, (self.signature, self._spans))
+
+    def __repr__(self) -> str:
+        return f"availabilityWindow({self._spans!r})"
+
+@dataclass(slots=True, frozen=True)
 class talentAvailability:
     talent_id: int
     constraint: bool
     role: Role
     shift_name: list[str]
-    window: dict[date, list[tuple[time, time]]] 
+    window: availabilityWindow
     weeklyhours: float
 
 @dataclass
@@ -1,21 +1,45 @@
-from app.core.schedule.talents.repo import TalentRepository
+from app.core.schedule.talents.repo import TalentRepository, AsyncTalentRepository
 from app.core.schedule.talents.preprocessor import TalentPreprocessor
 from app.core.schedule.talents.assembler import TalentAssembler
 from app.core.schedule.talents.schema import talentAvailability
+from app.core.schedule.talents.snapshot import TalentSnapshotCache
 
 
 class TalentService:
-    def __init__(self, repo: TalentRepository,
+    def __init__(self, repo: TalentRepository | AsyncTalentRepository,
                  preprocessor: TalentPreprocessor,
-                 assembler: TalentAssembler):
+                 assembler: TalentAssembler,
+                 snapshots: TalentSnapshotCache | None = None):
         self.repo = repo
         self.preprocessor = preprocessor
         self.assembler = assembler
+        self.snapshots = snapshots
 
     def load_talent_objects(self) -> dict[int, talentAvailability]:
-        rows = self.repo.load_all_talent_rows()
-        records = self.preprocessor.preprocess(rows)
+        if self.snapshots is not None:
+            week_start = self.assembler.week_provider.get_week()[0]
+            return self.snapshots.get(week_start, self._load)
+        return self._load()
+
+    def _load(self) -> dict[int, talentAvailability]:
+        if self.repo.aggregate:
+            records = self.preprocessor.preprocess_summaries(self.repo.load_talent_summaries())
+        else:
+            rows = self.repo.load_all_talent_rows()
+            records = self.preprocessor.preprocess(rows)
         return self.assembler.assemble(records)
 
+    async def load_talent_objects_async(self) -> dict[int, talentAvailability]:
+        """load_talent_objects for an AsyncTalentRepository."""
+        if self.snapshots is not None:
+            week_start = self.assembler.week_provider.get_week()[0]
+            return await self.snapshots.get_async(week_start, self._load_async)
+        return await self._load_async()
 
-        
\ No newline at end of file
+    async def _load_async(self) -> dict[int, talentAvailability]:
+        if self.repo.aggregate:
+            records = self.preprocessor.preprocess_summaries(await self.repo.load_talent_summaries())
+        else:
+            rows = await self.repo.load_all_talent_rows()
+            records = self.preprocessor.preprocess(rows)
+        return self.assembler.assemble(records)
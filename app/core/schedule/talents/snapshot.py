@@ -0,0 +1,66 @@
+import threading
+from datetime import date
+from typing import Awaitable, Callable
+from app.config.config import Settings
+from app.core.schedule.talents.schema import talentAvailability
+from app.core.utils.cache import TTLCache
+
+
+settings = Settings()
+
+
+class TalentSnapshotCache:
+    """
+    Per-week cache of the talentAvailability map, keyed by a data version.
+
+    Every write to talents, constraints or constraint rules calls `bump()`, which
+    moves the version on, so every snapshot built before the write stops matching.
+    Entries also expire after a TTL as a safety net for changes that happen outside
+    this process (another worker or a direct database edit).
+
+    Snapshots are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, max_weeks: int = 8, ttl_seconds: float = 300):
+        self.version = 0
+        self.snapshots: TTLCache[dict[int, talentAvailability]] = TTLCache(max_entries=max_weeks, ttl_seconds=ttl_seconds)
+        self._lock = threading.Lock()
+
+    def bump(self):
+        """Invalidate every snapshot; call after committing a change to talent data."""
+        with self._lock:
+            self.version += 1
+        self.snapshots.clear()
+
+    def get(self, week_start: date, loader: Callable[[], dict[int, talentAvailability]]) -> dict[int, talentAvailability]:
+        """Return the week's snapshot, building it with `loader` on a miss.
+
+        Args:
+            week_start (date): First day of the week the availability windows are built for.
+            loader (Callable): Builds the map from the database.
+
+        Returns:
+            dict[int, talentAvailability]: Talent ID -> availability for that week.
+        """
+        version = self.version
+        snapshot = self.snapshots.get((week_start, version))
+        if snapshot is None:
+            snapshot = loader()
+            # A write that landed while loading may not be in the snapshot; don't keep it
+            if version == self.version:
+                self.snapshots.set((week_start, version), snapshot)
+        return snapshot
+
+    async def get_async(self, week_start: date,
+                        loader: Callable[[], Awaitable[dict[int, talentAvailability]]]) -> dict[int, talentAvailability]:
+        """`get` for a coroutine loader, such as one reading through an AsyncSession."""
+        version = self.version
+        snapshot = self.snapshots.get((week_start, version))
+        if snapshot is None:
+            snapshot = await loader()
+            if version == self.version:
+                self.snapshots.set((week_start, version), snapshot)
+        return snapshot
+
+
+talent_snapshots = TalentSnapshotCache(ttl_seconds=settings.TALENT_SNAPSHOT_TTL)
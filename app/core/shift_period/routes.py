@@ -6,10 +6,10 @@ and deleting shift periods (the overall time windows for scheduling).
 """
 
 from fastapi import Depends, Body, APIRouter
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 from datetime import time
-from app.database.session import session
+from app.database.session import async_session
 from app.database.auth import User
 from app.core.shift_period.schema import ShiftPeriodIn, ShiftPeriodUpdate, ShiftOut, OneShiftOut
 from app.core.shift_period.services.services import ShiftPeriodService, get_all_periods, get_period
@@ -20,9 +20,9 @@ shift_period = APIRouter(tags=["Shift Period"])
 
 
 @shift_period.post("/create", response_model=ShiftOut)
-def create_shift_period(
+async def create_shift_period(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     data: Annotated[ShiftPeriodIn, Body()]
 ):
     """
@@ -42,14 +42,14 @@ def create_shift_period(
     Raises:
         HTTPException: 400 if validation fails (invalid times, dates, etc.).
     """
-    return ShiftPeriodService().create_shift_period(db=db, data=data)
+    return await ShiftPeriodService().create_shift_period(db=db, data=data)
     
 
   
 @shift_period.patch("/update/{period_id}", response_model=ShiftOut)
-def update_shift_period(
+async def update_shift_period(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     period_id: int,
     update_data: Annotated[ShiftPeriodUpdate, Body()]
 ):
@@ -70,13 +70,13 @@ def update_shift_period(
     Raises:
         HTTPException: 404 if period not found, 400 if validation fails.
     """
-    return ShiftPeriodService().update_shift_period(db=db, data=update_data, period_id=period_id)
+    return await ShiftPeriodService().update_shift_period(db=db, data=update_data, period_id=period_id)
    
 
 @shift_period.delete("/delete/{period_id}", status_code=204, response_model=None)
-def delete_shift_period(
+async def delete_shift_period(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     period_id: int
 ):
     """
@@ -92,12 +92,12 @@ def delete_shift_period(
     Raises:
         HTTPException: 404 if period not found.
     """
-    return ShiftPeriodService().delete_shift_period(db=db, period_id=period_id)
+    return await ShiftPeriodService().delete_shift_period(db=db, period_id=period_id)
 
 @shift_period.get("/retrieve_period/{period_id}", response_model=OneShiftOut)
-def retrieve_period(
+async def retrieve_period(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     period_id: int
 ):
     """
@@ -116,12 +116,12 @@ def retrieve_period(
     Raises:
         HTTPException: 404 if period not found.
     """
-    return get_period(db=db, id=period_id)
+    return await get_period(db=db, id=period_id)
 
 @shift_period.get("/retrieve_all_periods", response_model=list[ShiftOut])
-def retrieve_periods(
+async def retrieve_periods(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     shift_name: str | None = None,
     start_time: time | None = None,
     end_time: time | None = None
@@ -144,5 +144,5 @@ def retrieve_periods(
     Raises:
         HTTPException: 404 if no periods found.
     """
-    return get_all_periods(db=db, shift_name=shift_name, start_time=start_time, end_time=end_time)
+    return await get_all_periods(db=db, shift_name=shift_name, start_time=start_time, end_time=end_time)
    
\ No newline at end of file
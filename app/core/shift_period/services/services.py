@@ -1,6 +1,9 @@
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import time
-from app.core.utils.crud import CRUDBase
+from app.core.utils.crud import AsyncCRUDBase
 from app.core.shift_period.schema import ShiftPeriodIn,  ShiftPeriodUpdate, ShiftOut, OneShiftOut
 from app.database.models import ShiftPeriod
 from app.core.shift_period.services.validators import ShiftPeriodTimeFrame, validate_shift_period, validate_shift_period_update, validate_shift_period_delete, period_exists
@@ -8,22 +11,22 @@ from app.core.shift_period.utils import search_filters
 
 
 
-class ShiftPeriodService(CRUDBase[ShiftPeriod, ShiftPeriodIn, ShiftPeriodUpdate]):
+class ShiftPeriodService(AsyncCRUDBase[ShiftPeriod, ShiftPeriodIn, ShiftPeriodUpdate]):
 
     def __init__(self):
         super().__init__(ShiftPeriod)
 
-    def create_shift_period(self, db:Session, data: ShiftPeriodIn):
+    async def create_shift_period(self, db: AsyncSession, data: ShiftPeriodIn):
         
-        shift_period = db.query(ShiftPeriod).filter(ShiftPeriod.shift_name == data.shift_name).first()
+        shift_period = (await db.scalars(select(ShiftPeriod).where(ShiftPeriod.shift_name == data.shift_name))).first()
         ShiftPeriodTimeFrame().validate_shift_period(data=data)
         validate_shift_period(data=data, period=shift_period)
-        created_shift_period = self.create(db=db, obj_in=data)
+        created_shift_period = await self.create(db=db, obj_in=data)
        
         return ShiftOut.model_validate(created_shift_period)
 
-    def update_shift_period(self, db: Session, data: ShiftPeriodUpdate, period_id: int) -> ShiftOut:
-        period = db.query(ShiftPeriod).filter(ShiftPeriod.id == period_id).first()
+    async def update_shift_period(self, db: AsyncSession, data: ShiftPeriodUpdate, period_id: int) -> ShiftOut:
+        period = await _load_period(db, period_id)
         validate_shift_period_update(data=data, period=period)
         
         # New: Safety check for existing templates
@@ -37,25 +40,34 @@ class ShiftPeriodService(CRUDBase[ShiftPeriod, ShiftPeriodIn, ShiftPeriodUpdate]
                     detail=f"Cannot shrink period: Template for {template.role} ({template.shift_start}-{template.shift_end}) falls outside new bounds."
                 )
 
-        updated_period = self.update(db=db, db_obj=period, obj_in=data)
+        updated_period = await self.update(db=db, db_obj=period, obj_in=data)
         return ShiftOut.model_validate(updated_period)
 
-    def delete_shift_period(self, db: Session, period_id: int):
-        shift_period = db.query(ShiftPeriod).filter(ShiftPeriod.id == period_id).first()
+    async def delete_shift_period(self, db: AsyncSession, period_id: int):
+        shift_period = await db.get(ShiftPeriod, period_id)
         validate_shift_period_delete(shift_period)
-        self.delete(db=db, id=period_id)
+        await self.delete(db=db, id=period_id)
 
-def get_period(db: Session, id: int):
-    period = db.query(ShiftPeriod).filter(ShiftPeriod.id == id).first()
+async def _load_period(db: AsyncSession, id: int) -> ShiftPeriod | None:
+    """Fetch a period with its templates; AsyncSession can't lazy-load them later."""
+    return (await db.scalars(
+        select(ShiftPeriod)
+        .options(selectinload(ShiftPeriod.templates))
+        .where(ShiftPeriod.id == id)
+        .execution_options(populate_existing=True)
+    )).first()
+
+async def get_period(db: AsyncSession, id: int):
+    period = await _load_period(db, id)
     period_exists(period)
     return OneShiftOut.model_validate(period) 
 
-def get_all_periods(db: Session,
+async def get_all_periods(db: AsyncSession,
                     shift_name: str | None = None,
                     start_time: time | None = None,
                     end_time: time | None = None):
-    query = db.query(ShiftPeriod)
-    periods = search_filters(query=query, shift_name=shift_name, start_time=start_time, end_time=end_time)
+    query = search_filters(query=select(ShiftPeriod), shift_name=shift_name, start_time=start_time, end_time=end_time)
+    periods = (await db.scalars(query)).all()
     return [ShiftOut.model_validate(period) for period in periods]
 
         
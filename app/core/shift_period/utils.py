@@ -1,12 +1,12 @@
-from sqlalchemy.orm import Query
+from sqlalchemy import Select
 from datetime import time
 from app.database.models import ShiftTemplate, ShiftPeriod
 
 
-def search_filters(query: Query,
+def search_filters(query: Select,
                    shift_name: str | None = None,
                    start_time: time | None = None,
-                   end_time: time | None = None):
+                   end_time: time | None = None) -> Select:
     
     if shift_name:
         query = query.filter(ShiftPeriod.shift_name == shift_name)
@@ -17,4 +17,4 @@ def search_filters(query: Query,
     if end_time:
         query = query.filter(ShiftPeriod.end_time == end_time)
     
-    return query.all()
\ No newline at end of file
+    return query
\ No newline at end of file
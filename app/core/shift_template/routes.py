@@ -6,11 +6,11 @@ and deleting shift templates (time ranges for shifts within a period).
 """
 
 from fastapi import APIRouter, Depends, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 from datetime import time
 
-from app.database.session import session
+from app.database.session import async_session
 from app.database.auth import User
 from app.core.shift_template.schema import TemplateIn, TemplateUpdate, TemplateOut
 from app.core.shift_template.services.service import TemplateService, get_template, get_all_templates
@@ -21,9 +21,9 @@ shift_templates = APIRouter(tags=["Shift Templates"])
 
 
 @shift_templates.post("/create", response_model=TemplateOut)
-def create_template(
+async def create_template(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     data: Annotated[TemplateIn, Body()]
 ):
     """
@@ -43,13 +43,13 @@ def create_template(
     Raises:
         HTTPException: 400 if validation fails (invalid times, period not found, etc.).
     """
-    shift_template = TemplateService().create_template(db=db, data=data)
+    shift_template = await TemplateService().create_template(db=db, data=data)
     return shift_template
 
 @shift_templates.put("/update/{template_id}", response_model=TemplateOut)
-def update_template(
+async def update_template(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     template_id: int,
     update_data: Annotated[TemplateUpdate, Body()]
 ):
@@ -71,13 +71,13 @@ def update_template(
     Raises:
         HTTPException: 404 if template not found, 400 if validation fails.
     """
-    updated_template = TemplateService().update_template(db=db, data=update_data, template_id=template_id)
+    updated_template = await TemplateService().update_template(db=db, data=update_data, template_id=template_id)
     return updated_template
 
 @shift_templates.delete("/delete/{template_id}", status_code=204, response_model=None)
-def delete_template(
+async def delete_template(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     template_id: int
 ):
     """
@@ -93,12 +93,12 @@ def delete_template(
     Raises:
         HTTPException: 404 if template not found.
     """
-    TemplateService().delete_template(db=db, template_id=template_id)
+    await TemplateService().delete_template(db=db, template_id=template_id)
 
 @shift_templates.get("/retrieve_template/{template_id}", response_model=TemplateOut)
-def retrieve_template(
+async def retrieve_template(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     template_id: int
 ):
     """
@@ -117,13 +117,13 @@ def retrieve_template(
     Raises:
         HTTPException: 404 if template not found.
     """
-    return get_template(db=db, id=template_id)
+    return await get_template(db=db, id=template_id)
 
 
 @shift_templates.get("/retrieve_all_templates", response_model=list[TemplateOut])
-def retrieve_templates(
+async def retrieve_templates(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     shift_name: str | None = None,
     shift_start: time | None = None,
     shift_end: time | None = None
@@ -146,7 +146,7 @@ def retrieve_templates(
     Raises:
         HTTPException: 404 if no templates found.
     """
-    return get_all_templates(
+    return await get_all_templates(
         db=db, 
         shift_name=shift_name, 
         shift_start=shift_start, 
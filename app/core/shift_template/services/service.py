@@ -8,17 +8,19 @@ Note: Currently allows duplicate/overlapping templates within a period.
 This is a known limitation to be addressed in v2.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import time
 from typing import List
-from app.core.utils.crud import CRUDBase
+from app.core.utils.crud import AsyncCRUDBase
 from app.database.models import ShiftPeriod, ShiftTemplate
 from app.core.shift_template.schema import TemplateIn, TemplateOut, TemplateUpdate
 from app.core.shift_template.services.validators import validate_shift_template, validate_shift_template_update, template_exists
 from app.core.shift_template.utils import search_filters
 
 
-class TemplateService(CRUDBase[ShiftTemplate, TemplateIn, TemplateUpdate]):
+class TemplateService(AsyncCRUDBase[ShiftTemplate, TemplateIn, TemplateUpdate]):
     """
     Service class for managing shift templates.
     
@@ -32,7 +34,7 @@ class TemplateService(CRUDBase[ShiftTemplate, TemplateIn, TemplateUpdate]):
         super().__init__(ShiftTemplate)
     
 
-    def create_template(self, db: Session, data: TemplateIn) -> TemplateOut:
+    async def create_template(self, db: AsyncSession, data: TemplateIn) -> TemplateOut:
         """
         Create a new shift template.
 
@@ -49,12 +51,12 @@ class TemplateService(CRUDBase[ShiftTemplate, TemplateIn, TemplateUpdate]):
         Raises:
             HTTPException: 400 if validation fails (invalid times, period not found, etc.).
         """
-        shift_period = db.query(ShiftPeriod).filter(ShiftPeriod.id == data.period_id).first()
+        shift_period = await db.get(ShiftPeriod, data.period_id)
         validate_shift_template(data=data, period=shift_period)
-        created_templates = self.create(db=db, obj_in=data)
-        return TemplateOut.model_validate(created_templates)
+        created_template = await self.create(db=db, obj_in=data)
+        return TemplateOut.model_validate(await _load_template(db, created_template.id))
     
-    def update_template(self, db: Session, data: TemplateUpdate, template_id: int) -> TemplateOut:
+    async def update_template(self, db: AsyncSession, data: TemplateUpdate, template_id: int) -> TemplateOut:
         """
         Update an existing shift template.
 
@@ -72,12 +74,12 @@ class TemplateService(CRUDBase[ShiftTemplate, TemplateIn, TemplateUpdate]):
         Raises:
             HTTPException: 404 if template not found, 400 if validation fails.
         """
-        template = db.query(ShiftTemplate).filter(ShiftTemplate.id == template_id).first()
+        template = await _load_template(db, template_id)
         validate_shift_template_update(data=data, template=template)
-        updated_template = self.update(db=db, db_obj=template, obj_in=data)
-        return TemplateOut.model_validate(updated_template)
+        updated_template = await self.update(db=db, db_obj=template, obj_in=data)
+        return TemplateOut.model_validate(await _load_template(db, updated_template.id))
     
-    def delete_template(self, db: Session, template_id: int) -> None:
+    async def delete_template(self, db: AsyncSession, template_id: int) -> None:
         """
         Delete a shift template.
 
@@ -88,12 +90,22 @@ class TemplateService(CRUDBase[ShiftTemplate, TemplateIn, TemplateUpdate]):
         Raises:
             HTTPException: 404 if template not found.
         """
-        template = db.query(ShiftTemplate).filter(ShiftTemplate.id == template_id).first()
+        template = await db.get(ShiftTemplate, template_id)
         template_exists(template)
-        self.delete(db=db, id=template_id)
+        await self.delete(db=db, id=template_id)
 
 
-def get_template(db: Session, id: int) -> TemplateOut:
+async def _load_template(db: AsyncSession, id: int) -> ShiftTemplate | None:
+    """Fetch a template with its period; AsyncSession can't lazy-load it later."""
+    return (await db.scalars(
+        select(ShiftTemplate)
+        .options(selectinload(ShiftTemplate.period))
+        .where(ShiftTemplate.id == id)
+        .execution_options(populate_existing=True)
+    )).first()
+
+
+async def get_template(db: AsyncSession, id: int) -> TemplateOut:
     """
     Retrieve a single shift template by ID.
 
@@ -107,14 +119,14 @@ def get_template(db: Session, id: int) -> TemplateOut:
     Raises:
         HTTPException: 404 if template not found.
     """
-    template = db.query(ShiftTemplate).filter(ShiftTemplate.id == id).first()
+    template = await _load_template(db, id)
     template_exists(template)
     return TemplateOut.model_validate(template)
 
 
 
-def get_all_templates(
-    db: Session,
+async def get_all_templates(
+    db: AsyncSession,
     shift_name: str | None = None,
     shift_start: time | None = None,
     shift_end: time | None = None
@@ -134,11 +146,12 @@ def get_all_templates(
     Raises:
         HTTPException: 404 if no templates found.
     """
-    query = db.query(ShiftTemplate).join(ShiftTemplate.period)
-    templates = search_filters(
+    query = select(ShiftTemplate).join(ShiftTemplate.period).options(selectinload(ShiftTemplate.period))
+    query = search_filters(
         query=query,
         shift_name=shift_name,
         shift_end=shift_end,
         shift_start=shift_start
     )
+    templates = (await db.scalars(query)).all()
     return [TemplateOut.model_validate(template) for template in templates]
@@ -1,12 +1,12 @@
-from sqlalchemy.orm import Query
+from sqlalchemy import Select
 from datetime import time
 from app.database.models import ShiftTemplate, ShiftPeriod
 
 
-def search_filters(query: Query,
+def search_filters(query: Select,
                    shift_name: str | None = None,
                    shift_start: time | None = None,
-                   shift_end: time | None = None):
+                   shift_end: time | None = None) -> Select:
     
     if shift_name:
         query = query.filter(ShiftPeriod.shift_name == shift_name)
@@ -17,4 +17,4 @@ def search_filters(query: Query,
     if shift_end:
         query = query.filter(ShiftTemplate.shift_end == shift_end)
     
-    return query.all()
\ No newline at end of file
+    return query
\ No newline at end of file
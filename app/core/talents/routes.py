@@ -6,11 +6,11 @@ and managing talent/employee records.
 """
 
 from fastapi import APIRouter, Depends, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated, Union, List
 from app.core.talents.services.service import TalentService, get_talent, get_all_talents
 from app.core.talents.schema import TalentIn, TalentUpdate, TalentOut
-from app.database.session import session
+from app.database.session import async_session
 from app.database.auth import User
 from app.database.models import Talent
 from app.authentication.utils.auth_utils import get_current_user
@@ -21,9 +21,9 @@ talents = APIRouter(tags=["Talents"])
 
 
 @talents.post("/create", response_model=TalentOut)
-def create_talent(
+async def create_talent(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     data: Annotated[TalentIn, Body()]
 ):
     """
@@ -43,13 +43,13 @@ def create_talent(
     Raises:
         HTTPException: 400 if validation fails (duplicate email, invalid dates, etc.).
     """
-    talents = TalentService().create_talent(db=db, data=data)
+    talents = await TalentService().create_talent(db=db, data=data)
     return talents
   
 @talents.put("/update/{talent_id}", response_model=TalentOut)
-def update_talent(
+async def update_talent(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     talent_id: int,
     data: Annotated[TalentUpdate, Body()]
 ):
@@ -71,13 +71,13 @@ def update_talent(
     Raises:
         HTTPException: 404 if talent not found, 403 if trying to reactivate.
     """
-    talent = TalentService().update_talent(db, talent_id, data)
+    talent = await TalentService().update_talent(db, talent_id, data)
     return talent
 
 @talents.get("/retrieve_talents", response_model=list[TalentOut])
-def retrieve_all_talents(
+async def retrieve_all_talents(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)], 
+    db: Annotated[AsyncSession, Depends(async_session)], 
     name: str | None = None, 
     tal_role: str | None = None,
     contract_type: str | None = None,
@@ -103,12 +103,12 @@ def retrieve_all_talents(
     Raises:
         HTTPException: 404 if no talents found.
     """
-    return get_all_talents(db, name=name, tal_role=tal_role, contract_type=contract_type, is_active=is_active)
+    return await get_all_talents(db, name=name, tal_role=tal_role, contract_type=contract_type, is_active=is_active)
 
 @talents.get("/retrieve_talent/{talent_id}", response_model=TalentOut)
-def retrieve_a_talent(
+async def retrieve_a_talent(
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[Session, Depends(session)],
+    db: Annotated[AsyncSession, Depends(async_session)],
     talent_id: int
 ):
     """
@@ -127,4 +127,4 @@ def retrieve_a_talent(
     Raises:
         HTTPException: 404 if talent not found.
     """
-    return get_talent(db=db, id=talent_id)
+    return await get_talent(db=db, id=talent_id)
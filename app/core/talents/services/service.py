@@ -1,21 +1,23 @@
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import List
 from app.core.talents.schema import TalentIn, TalentUpdate, TalentOut
-from app.core.utils.crud import CRUDBase
+from app.core.utils.crud import AsyncCRUDBase
 from app.database.models import Talent
 from app.core.talents.services.validator import validate_talent_create, validate_talent_update, talent_exists
 from app.core.talents.utils import set_contract_hours, search_filters
+from app.core.schedule.talents.snapshot import talent_snapshots
 
 
-class TalentService(CRUDBase[Talent, TalentIn, TalentUpdate]):
+class TalentService(AsyncCRUDBase[Talent, TalentIn, TalentUpdate]):
 
     def __init__(self):
         super().__init__(Talent)
 
-    def create_talent(self, db: Session, data: TalentIn) -> TalentOut:
-        talent = db.query(Talent).filter(Talent.email == data.email).first()
+    async def create_talent(self, db: AsyncSession, data: TalentIn) -> TalentOut:
+        talent = (await db.scalars(select(Talent).where(Talent.email == data.email))).first()
         validate_talent_create(data=data, talent=talent)
 
         # Build the model object manually so we can set `hours` before the first commit.
@@ -25,47 +27,49 @@ class TalentService(CRUDBase[Talent, TalentIn, TalentUpdate]):
 
         try:
             db.add(talent_obj)
-            db.commit()
-            db.refresh(talent_obj)
+            await db.commit()
+            await db.refresh(talent_obj)
         except Exception:
-            db.rollback()
+            await db.rollback()
             raise
 
+        talent_snapshots.bump()
         return TalentOut.model_validate(talent_obj)
 
-    def update_talent(self, db: Session, talent_id: int, data: TalentUpdate) -> TalentOut:
-        talent = db.query(Talent).filter(Talent.id == talent_id).first()
+    async def update_talent(self, db: AsyncSession, talent_id: int, data: TalentUpdate) -> TalentOut:
+        talent = await db.get(Talent, talent_id)
         validate_talent_update(data=data, talent=talent)
 
         if data.is_active is False:
             talent.end_date = datetime.now().date()
         if data.contract_type:
             talent.hours = set_contract_hours(data.contract_type)
-        updated_talent = self.update(db, talent, data)
+        updated_talent = await self.update(db, talent, data)
+        talent_snapshots.bump()
 
         return TalentOut.model_validate(updated_talent)
 
 
-def get_all_talents(
-    db: Session,
+async def get_all_talents(
+    db: AsyncSession,
     name: str | None = None,
     tal_role: str | None = None,
     contract_type: str | None = None,
     is_active: bool | None = None
 ) -> List[TalentOut]:
-    query = db.query(Talent)
-    talents = search_filters(
-        query=query,
+    query = search_filters(
+        query=select(Talent),
         name=name,
         tal_role=tal_role,
         contract_type=contract_type,
         is_active=is_active
     )
+    talents = (await db.scalars(query)).all()
     talent_exists(talents)
     return [TalentOut.model_validate(talent) for talent in talents]
 
 
-def get_talent(db: Session, id: int) -> TalentOut:
-    talent = db.query(Talent).filter(Talent.id == id).first()
+async def get_talent(db: AsyncSession, id: int) -> TalentOut:
+    talent = await db.get(Talent, id)
     talent_exists(talent)
     return TalentOut.model_validate(talent)
\ No newline at end of file
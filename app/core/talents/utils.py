@@ -1,5 +1,4 @@
-from sqlalchemy.orm import Query
-from sqlalchemy import or_
+from sqlalchemy import Select, or_
 from app.core.talents.schema import ContractType
 from app.database.models import Talent
 
@@ -12,11 +11,11 @@ def set_contract_hours(contract_type: str):
 
     return contract_hours.get(contract_type)
 
-def search_filters(query: Query,
+def search_filters(query: Select,
                    name: str | None = None,
                     tal_role: str | None = None,
                     contract_type: str | None = None,
-                    is_active: bool | None = None):
+                    is_active: bool | None = None) -> Select:
     if tal_role:
             query = query.filter(Talent.tal_role == tal_role) 
     if contract_type:
@@ -33,7 +32,7 @@ def search_filters(query: Query,
                     (Talent.firstname + " " + Talent.lastname).ilike(name_pattern))
             )
         
-    return query.all()
+    return query
 
 
 
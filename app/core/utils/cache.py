@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[ValueType]):
+    """Thread-safe in-process cache with a size bound (LRU) and an expiry (TTL).
+
+    Entries older than `ttl_seconds` are treated as missing; once `max_entries`
+    is reached the least recently used entry is evicted. Hits and misses are
+    counted for metrics.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.entries: OrderedDict[Hashable, tuple[float, ValueType]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[ValueType]:
+        """Return the cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: ValueType):
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        """Drop one entry if present."""
+        with self._lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        """Return size and hit/miss counters."""
+        with self._lock:
+            return {"size": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self.entries)
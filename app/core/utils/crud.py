@@ -1,6 +1,8 @@
 from typing import Generic, TypeVar, Type, Optional, Union
 from pydantic import BaseModel
+from sqlalchemy import select, insert
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import DatabaseError as AlchemyDatabaseError
 import asyncpg
 from app.core.utils.exceptions import DatabaseError
@@ -32,13 +34,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
        return query.all()
     
     def batch_create(self, db: Union[Session, asyncpg.Connection], objs_in: Optional[CreateSchemaType]):
-        objs = [self.model(**obj.model_dump()) for obj in objs_in]
+        rows = [obj.model_dump() for obj in objs_in]
         try:
-            db.add_all(objs)
+            # One multi-row INSERT ... RETURNING rather than an INSERT per object
+            ids = db.scalars(insert(self.model).returning(self.model.id, sort_by_parameter_order=True), rows).all() if rows else []
             db.commit()
-            for obj in objs:
-                db.refresh(obj)
-            return objs
+            # Commit expires the objects; one SELECT reloads them all instead of a refresh per row
+            objs = {obj.id: obj for obj in db.scalars(select(self.model).where(self.model.id.in_(ids)))} if ids else {}
+            return [objs[id] for id in ids]
         except AlchemyDatabaseError:
             db.rollback()
             raise DatabaseError("A database error has occurred during generation. Please try again")
@@ -79,4 +82,68 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         except AlchemyDatabaseError as e:
             db.rollback()
             raise RuntimeError("A database error has occurred during generation. Please try again")
-        
\ No newline at end of file
+
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """CRUDBase for AsyncSession: the same operations, awaited."""
+
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+
+    async def get(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        return await db.get(self.model, id)
+
+    async def get_all(self, db: AsyncSession, **filters) -> list[ModelType]:
+        query = select(self.model)
+        for field, value in filters.items():
+            if value is not None and hasattr(self.model, field):
+                query = query.where(getattr(self.model, field) == value)
+
+        return list((await db.scalars(query)).all())
+
+    async def batch_create(self, db: AsyncSession, objs_in: Optional[CreateSchemaType]):
+        rows = [obj.model_dump() for obj in objs_in]
+        try:
+            # RETURNING loads every column; the async session doesn't expire on commit,
+            # so the objects need no refresh
+            objs = (await db.scalars(insert(self.model).returning(self.model, sort_by_parameter_order=True), rows)).all() if rows else []
+            await db.commit()
+            return list(objs)
+        except AlchemyDatabaseError:
+            await db.rollback()
+            raise DatabaseError("A database error has occurred during generation. Please try again")
+
+    async def create(self, db: AsyncSession, obj_in: Optional[CreateSchemaType]) -> Optional[ModelType]:
+        obj = self.model(**obj_in.model_dump())
+        try:
+            db.add(obj)
+            await db.commit()
+            await db.refresh(obj)
+            return obj
+        except AlchemyDatabaseError:
+            await db.rollback()
+            raise DatabaseError("A database error has occurred during generation. Please try again")
+
+    async def update(self, db: AsyncSession, db_obj: ModelType, obj_in: UpdateSchemaType) -> Optional[ModelType]:
+        try:
+            update_data = obj_in.model_dump(exclude_unset=True)
+            update_data = {key: value for key, value in update_data.items() if value is not None}
+            for field, value in update_data.items():
+                setattr(db_obj, field, value)
+            await db.commit()
+            await db.refresh(db_obj)
+            return db_obj
+        except AlchemyDatabaseError:
+            await db.rollback()
+            raise DatabaseError("A database error has occurred during generation. Please try again")
+
+    async def delete(self, db: AsyncSession, id: int):
+        try:
+            obj = await db.get(self.model, id)
+            if obj:
+                await db.delete(obj)
+                await db.commit()
+            return obj
+        except AlchemyDatabaseError:
+            await db.rollback()
+            raise DatabaseError("A database error has occurred during generation. Please try again")
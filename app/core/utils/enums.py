@@ -53,6 +53,26 @@ class UserRole(str, Enum):
     manager = "manager"
     user = "user"
 
+class Solver(Enum):
+    GREEDY = "greedy"
+    FLOW = "flow"
+    PORTFOLIO = "portfolio"
+
 class TokenType(Enum):
     invite = "invite"
-    access = "access"
\ No newline at end of file
+    access = "access"
+
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class EmailStatus(Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
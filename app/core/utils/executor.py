@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+from fastapi import HTTPException, status
+
+
+ResultType = TypeVar("ResultType")
+
+
+class BoundedExecutor:
+    """
+    Dedicated thread pool with a concurrency cap and a bounded queue.
+
+    At most `max_concurrency` calls run at once. Up to `max_queue` more wait for a
+    free thread; beyond that new calls are refused with 503 and a Retry-After
+    header instead of piling up. Queue depth, counters and time spent waiting
+    are reported by `stats()`.
+    """
+
+    def __init__(self, name: str, max_concurrency: int = 2, max_queue: int = 8,
+                 retry_after_seconds: int = 5, busy_detail: str = "The server is busy. Please try again shortly."):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.retry_after_seconds = retry_after_seconds
+        self.busy_detail = busy_detail
+        self.pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix=name)
+        self.running = 0
+        self.queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._lock = threading.Lock()
+
+    async def run(self, fn: Callable[..., ResultType], *args, wait: bool = False) -> ResultType:
+        """Run `fn(*args)` on the pool and await its result.
+
+        Args:
+            wait (bool, optional): Queue even when the queue is full. For callers that
+                are bounded on their own, such as the job workers.
+
+        Raises:
+            HTTPException: 503 when every thread is busy and the queue is full.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.pool, self._admit(fn, args, wait))
+
+    def _admit(self, fn: Callable[..., ResultType], args: tuple, wait: bool) -> Callable[[], ResultType]:
+        """Reserve a queue place and wrap `fn` so it updates the counters when it runs."""
+        with self._lock:
+            if not wait and self.running + self.queued >= self.max_concurrency + self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=self.busy_detail,
+                    headers={"Retry-After": str(self.retry_after_seconds)},
+                )
+            self.queued += 1
+        submitted = time.perf_counter()
+
+        def task():
+            waited = time.perf_counter() - submitted
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        return task
+
+    def stats(self) -> dict:
+        """Return queue depth, counters and queue wait times."""
+        with self._lock:
+            started = self.completed + self.running
+            return {
+                "running": self.running,
+                "queued": self.queued,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(1000 * self.wait_seconds / started, 2) if started else 0.0,
+                "max_wait_ms": round(1000 * self.max_wait_seconds, 2),
+            }
@@ -1,6 +1,6 @@
 from datetime import date, time, datetime
 from typing import List, Optional
-from sqlalchemy import ForeignKey, String, Integer, Boolean, Numeric, Date, Time, DateTime, func
+from sqlalchemy import ForeignKey, String, Integer, Boolean, Numeric, Date, Time, DateTime, Text, Index, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -22,6 +22,10 @@ class User(Base):
 
 class AccessToken(Base):
     __tablename__ = "access_token"
+    __table_args__ = (
+        Index("uq_access_token_token_hash", "token_hash", unique=True),
+        Index("ix_access_token_jti", "jti"),
+    )
 
     id:Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -33,6 +37,10 @@ class AccessToken(Base):
 
 class InviteToken(Base):
     __tablename__ = "invite_token"
+    __table_args__ = (
+        Index("uq_invite_token_token_hash", "token_hash", unique=True),
+        Index("ix_invite_token_jti", "jti"),
+    )
 
     id:Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -40,4 +48,23 @@ class InviteToken(Base):
     jti:Mapped[str] = mapped_column(String(36), nullable=False)
     expires_at: Mapped[Optional[date]] = mapped_column(Date)
     used_at: Mapped[Optional[date]] = mapped_column(Date)
-    created_at: Mapped[Optional[date]] = mapped_column(Date)
\ No newline at end of file
+    created_at: Mapped[Optional[date]] = mapped_column(Date)
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # The dispatcher's claim: due messages in send order
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    to_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    html: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_error: Mapped[Optional[str]] = mapped_column(Text)
+    provider_id: Mapped[Optional[str]] = mapped_column(String(255))
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
@@ -1,6 +1,6 @@
 from datetime import date, time, datetime
 from typing import List, Optional
-from sqlalchemy import ForeignKey, String, Integer, Boolean, Numeric, Date, Time, DateTime, func
+from sqlalchemy import ForeignKey, String, Integer, Boolean, Numeric, Date, Time, DateTime, Index, func, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -82,6 +82,11 @@ class ShiftTemplate(Base):
 
 class ScheduledShift(Base):
     __tablename__ = "scheduled_shifts"
+    __table_args__ = (
+        # Loading a schedule's shifts, and the previous week's shifts for rest rules
+        Index("ix_scheduled_shifts_schedule_id_date_of", "schedule_id", "date_of"),
+        Index("ix_scheduled_shifts_date_of_talent_id", "date_of", "talent_id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     talent_id: Mapped[Optional[int]] = mapped_column(ForeignKey("talents.id", ondelete="CASCADE"))
@@ -98,6 +103,17 @@ class ScheduledShift(Base):
 
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        Index("ix_schedules_week_start_status", "week_start", "status"),
+        # Keyset pagination in GET /schedules
+        Index("ix_schedules_week_start_id", "week_start", "id"),
+        # At most one final schedule per week
+        Index(
+            "uq_schedules_final_week_start", "week_start", unique=True,
+            postgresql_where=text("status = 'final'"),
+            sqlite_where=text("status = 'final'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True,index=True)
     week_start: Mapped[date] = mapped_column(Date)
@@ -1,5 +1,7 @@
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.config.config import Settings
 
 settings = Settings()
@@ -14,4 +16,26 @@ def session():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def async_database_url(url: str) -> URL:
+    """Point a postgresql:// URL at the asyncpg driver.
+
+    asyncpg takes `ssl` where libpq takes `sslmode`, so the option is renamed.
+    """
+    parsed = make_url(url).set(drivername="postgresql+asyncpg")
+    query = dict(parsed.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return parsed.set(query=query)
+
+
+async_engine = create_async_engine(async_database_url(database), echo=True)
+# Objects stay readable after commit; with async sessions an expired attribute
+# can't be lazily reloaded on access
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+async def async_session():
+    async with AsyncSessionLocal() as db:
+        yield db
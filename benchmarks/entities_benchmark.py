@@ -0,0 +1,138 @@
+"""Memory and attribute-access cost of the allocator's entity classes.
+
+Compares the slotted, frozen engine dataclasses with plain dataclasses of the same
+fields, then runs generate_schedule on a synthetic week and reports its peak memory.
+
+    python -m benchmarks.entities_benchmark --talents 1000 --objects 200000
+"""
+import argparse
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime, time as clock_time, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.schedule.allocator.entities import assignment, weekRange
+from app.core.schedule.allocator.engine.generators import TalentByRole
+from app.core.schedule.allocator.service import ScheduleBuilder
+from app.core.schedule.shifts.schema import shiftSpecification
+from app.core.schedule.talents.assembler import TalentAssembler
+from app.core.schedule.talents.schema import TalentRecord
+
+
+@dataclass
+class plainShiftSpecification:
+    template_id: int
+    start_time: datetime
+    end_time: datetime
+    shift_name: str
+    role_name: str
+    role_count: int
+    day: int | None = None
+    start_min: int | None = None
+    end_min: int | None = None
+
+
+@dataclass
+class plainAssignment:
+    talent_id: int
+    shift_id: int
+    shift: plainShiftSpecification
+
+
+ROLES = ["manager", "leader", "bartender", "server", "runner", "hostess"]
+PERIODS = [("am", clock_time(7), clock_time(14)), ("pm", clock_time(16), clock_time(23)), ("lounge", clock_time(12), clock_time(20))]
+DAYS = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+
+
+def build_week(talents: int, seed: int = 1, start: date = date(2026, 10, 18)):
+    """Synthetic talents and shift slots for one week, shaped like the database output."""
+    rng = random.Random(seed)
+    week = weekRange(start_date=start)
+    records = {}
+    for talent_id in range(1, talents + 1):
+        constrained = rng.random() < 0.4
+        records[talent_id] = TalentRecord(
+            talent_id=talent_id,
+            role=rng.choice(ROLES),
+            weeklyhours=rng.choice([44, 33, 27]),
+            constraint_status=constrained,
+            days=rng.sample(DAYS, rng.randint(2, 7)) if constrained else DAYS,
+            shifts=rng.sample(["am", "pm", "lounge"], rng.randint(1, 3)) if constrained else ["am", "pm", "lounge"],
+        )
+    availability = TalentAssembler(week_provider=week).assemble(records)
+
+    shifts = {}
+    for offset in range(7):
+        day = week.get_week()[0] + timedelta(days=offset)
+        for period_id, (name, start_time, end_time) in enumerate(PERIODS):
+            for role in ROLES:
+                shifts[f"{day}__{period_id}__{role}"] = shiftSpecification(
+                    template_id=period_id,
+                    start_time=datetime.combine(day, start_time),
+                    end_time=datetime.combine(day, end_time),
+                    shift_name=name,
+                    role_name=role,
+                    role_count=rng.randint(1, 4),
+                )
+    return availability, shifts, TalentByRole.group_talents(talents=availability)
+
+
+def _allocated(factory, count: int) -> tuple[float, list]:
+    tracemalloc.start()
+    objects = [factory(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / count, objects
+
+
+def compare_entities(count: int):
+    moment = datetime(2026, 10, 18, 7)
+
+    def slotted(i):
+        shift = shiftSpecification(None, moment, moment, "am", "server", 1, i % 7, i, i + 420)
+        return assignment(talent_id=i, shift_id=i, shift=shift)
+
+    def plain(i):
+        shift = plainShiftSpecification(None, moment, moment, "am", "server", 1, i % 7, i, i + 420)
+        return plainAssignment(talent_id=i, shift_id=i, shift=shift)
+
+    print(f"{'entities':<10}{'bytes/assignment':>18}{'ns/attribute read':>20}")
+    for label, factory in (("plain", plain), ("slotted", slotted)):
+        per_object, objects = _allocated(factory, count)
+        sample = objects[: min(count, 10_000)]
+        reads = timeit.timeit(lambda: [a.shift.end_min - a.shift.start_min + a.talent_id for a in sample], number=20)
+        print(f"{label:<10}{per_object:>18.0f}{reads / (20 * len(sample) * 4) * 1e9:>20.1f}")
+
+
+def profile_generate(talents: int):
+    availability, shifts, talents_by_role = build_week(talents)
+    builder = ScheduleBuilder(availability=availability, assignable_shifts=shifts, talents_to_assign=talents_by_role)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    plan = builder.generate_schedule()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"generate_schedule: {talents} talents, {len(plan)} assignments, "
+          f"{elapsed * 1000:.0f} ms, peak {peak / 1024:.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--talents", type=int, default=1000)
+    parser.add_argument("--objects", type=int, default=200_000)
+    args = parser.parse_args()
+
+    compare_entities(args.objects)
+    profile_generate(args.talents)
+
+
+if __name__ == "__main__":
+    main()
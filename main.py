@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.talents.routes import talents
@@ -7,9 +8,25 @@ from app.core.constraints.constraint_rules.routes import constraint_rules
 from app.core.shift_template.routes import shift_templates
 from app.core.shift_period.routes import shift_period
 from app.authentication.routes import auth_router
+from app.core.schedule.jobs.service import generation_jobs
+from app.authentication.outbox.service import email_outbox
+from app.config.config import Settings
 
 
-app = FastAPI(title="SlotMeIn", version="1.0")
+settings = Settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One job worker per generation slot; more would only wait on the executor
+    generation_jobs.start(workers=settings.GENERATION_CONCURRENCY)
+    email_outbox.start()
+    yield
+    await email_outbox.stop()
+    await generation_jobs.stop()
+
+
+app = FastAPI(title="SlotMeIn", version="1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,6 +34,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -0,0 +1,56 @@
+"""Indexes for the schedule hot queries and one final schedule per week
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+The tables predate migrations, so this revision assumes they exist and only adds
+indexes. IF NOT EXISTS lets it run on a database whose schema was created with
+Base.metadata.create_all, which already builds them.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FINAL_ONLY = sa.text("status = 'final'")
+
+
+def upgrade() -> None:
+    # --sql output can't inspect the data
+    if not context.is_offline_mode():
+        duplicates = op.get_bind().execute(sa.text(
+            "SELECT week_start FROM schedules WHERE status = 'final' "
+            "GROUP BY week_start HAVING COUNT(*) > 1"
+        )).scalars().all()
+        if duplicates:
+            raise RuntimeError(
+                f"More than one final schedule exists for weeks {[str(d) for d in duplicates]}. "
+                "Delete or demote the extras before upgrading."
+            )
+
+    op.create_index("ix_scheduled_shifts_schedule_id_date_of", "scheduled_shifts",
+                    ["schedule_id", "date_of"], if_not_exists=True)
+    op.create_index("ix_scheduled_shifts_date_of_talent_id", "scheduled_shifts",
+                    ["date_of", "talent_id"], if_not_exists=True)
+    op.create_index("ix_schedules_week_start_status", "schedules",
+                    ["week_start", "status"], if_not_exists=True)
+    op.create_index("ix_schedules_week_start_id", "schedules",
+                    ["week_start", "id"], if_not_exists=True)
+    op.create_index("uq_schedules_final_week_start", "schedules", ["week_start"], unique=True,
+                    postgresql_where=FINAL_ONLY, sqlite_where=FINAL_ONLY, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_schedules_final_week_start", table_name="schedules", if_exists=True)
+    op.drop_index("ix_schedules_week_start_id", table_name="schedules", if_exists=True)
+    op.drop_index("ix_schedules_week_start_status", table_name="schedules", if_exists=True)
+    op.drop_index("ix_scheduled_shifts_date_of_talent_id", table_name="scheduled_shifts", if_exists=True)
+    op.drop_index("ix_scheduled_shifts_schedule_id_date_of", table_name="scheduled_shifts", if_exists=True)
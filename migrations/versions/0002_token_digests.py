@@ -0,0 +1,31 @@
+"""Unique index on token digests
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+Tokens are now stored as HMAC-SHA256 digests and looked up by them. Existing
+rows keep their bcrypt hashes (salted, so already unique) and are still
+accepted through the JTI fallback in TokenService.search_token until they expire.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table in ("access_token", "invite_token"):
+        op.create_index(f"uq_{table}_token_hash", table, ["token_hash"], unique=True, if_not_exists=True)
+        op.create_index(f"ix_{table}_jti", table, ["jti"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    for table in ("access_token", "invite_token"):
+        op.drop_index(f"ix_{table}_jti", table_name=table, if_exists=True)
+        op.drop_index(f"uq_{table}_token_hash", table_name=table, if_exists=True)
@@ -0,0 +1,46 @@
+"""Email outbox
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+Outbound email is stored here and sent by the background dispatcher
+(app/authentication/outbox) instead of during the request.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("to_email", sa.String(255), nullable=False),
+        sa.Column("subject", sa.String(255), nullable=False),
+        sa.Column("html", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.Text()),
+        sa.Column("provider_id", sa.String(255)),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime()),
+        if_not_exists=True,
+    )
+    op.create_index("ix_email_outbox_id", "email_outbox", ["id"], if_not_exists=True)
+    op.create_index("ix_email_outbox_status_next_attempt_at", "email_outbox",
+                    ["status", "next_attempt_at"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_email_outbox_status_next_attempt_at", table_name="email_outbox", if_exists=True)
+    op.drop_index("ix_email_outbox_id", table_name="email_outbox", if_exists=True)
+    op.drop_table("email_outbox", if_exists=True)